@@ -8,6 +8,7 @@ import requests
 from dotenv import load_dotenv
 
 from tests.utils.dataset_utils import wait_for_file_processing
+from tests.utils.fake_textual_server import FakeTextualServer
 from tests.utils.resource_utils import get_resource_path
 from tonic_textual.audio_api import TextualAudio
 from tonic_textual.classes.common_api_responses.single_detection_result import (
@@ -109,3 +110,10 @@ def setup_dataset(
     yield textual, dataset_name, dataset_path
     # Will be executed after the last test
     textual.delete_dataset(dataset_name)
+
+
+@pytest.fixture
+def fake_server():
+    server = FakeTextualServer().start()
+    yield server
+    server.stop()
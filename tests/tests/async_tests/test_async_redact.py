@@ -0,0 +1,110 @@
+import asyncio
+import threading
+import time
+
+import pytest
+
+from tests.utils.fake_textual_server import fake_redact_bulk_handler, fake_redact_handler
+from tonic_textual.async_redact_api import AsyncTextualNer
+
+
+def test_async_redact_matches_sync_shape(fake_server):
+    fake_server.route("POST", "/api/redact", fake_redact_handler)
+    fake_server.route("POST", "/api/redact/bulk", fake_redact_bulk_handler)
+
+    async def run():
+        async with AsyncTextualNer(fake_server.url, "key", verify=False) as textual:
+            single = await textual.redact("My name is John", generator_default="Redaction")
+            bulk = await textual.redact_bulk(["John lives in Atlanta", "no pii"])
+            return single, bulk
+
+    single, bulk = asyncio.run(run())
+
+    assert single.redacted_text == "My name is [NAME_GIVEN]"
+    assert single.de_identify_results[0].label == "NAME_GIVEN"
+    assert bulk.bulk_redacted_text == ["[NAME_GIVEN] lives in [LOCATION_CITY]", "no pii"]
+
+
+def test_async_redact_bounds_in_flight_requests(fake_server):
+    lock = threading.Lock()
+    in_flight = {"current": 0, "max": 0}
+
+    def slow_redact(request):
+        with lock:
+            in_flight["current"] += 1
+            in_flight["max"] = max(in_flight["max"], in_flight["current"])
+        time.sleep(0.05)
+        with lock:
+            in_flight["current"] -= 1
+        return fake_redact_handler(request)
+
+    fake_server.route("POST", "/api/redact", slow_redact)
+
+    async def run():
+        async with AsyncTextualNer(fake_server.url, "key", verify=False, max_concurrency=4) as textual:
+            return await asyncio.gather(*[textual.redact(f"Jane {i}") for i in range(20)])
+
+    results = asyncio.run(run())
+
+    assert [r.original_text for r in results] == [f"Jane {i}" for i in range(20)]
+    assert in_flight["max"] == 4
+
+
+def test_async_redact_deadline(fake_server):
+    def slow_redact(request):
+        time.sleep(0.5)
+        return fake_redact_handler(request)
+
+    fake_server.route("POST", "/api/redact", slow_redact)
+
+    async def run():
+        async with AsyncTextualNer(fake_server.url, "key", verify=False) as textual:
+            await textual.redact("Mary", timeout=0.05)
+
+    with pytest.raises(asyncio.TimeoutError):
+        asyncio.run(run())
+
+
+def test_async_deadline_releases_the_slot(fake_server):
+    calls = []
+
+    def hanging_then_fast(request):
+        calls.append(request)
+        if len(calls) == 1:
+            time.sleep(1.0)
+        return fake_redact_handler(request)
+
+    fake_server.route("POST", "/api/redact", hanging_then_fast)
+
+    async def run():
+        async with AsyncTextualNer(
+            fake_server.url, "key", verify=False, max_concurrency=1
+        ) as textual:
+            with pytest.raises(asyncio.TimeoutError):
+                await textual.redact("Mary", timeout=0.1)
+            start = time.monotonic()
+            response = await textual.redact("John", timeout=0.8)
+            return response, time.monotonic() - start
+
+    response, elapsed = asyncio.run(run())
+
+    assert response.redacted_text == "[NAME_GIVEN]"
+    assert elapsed < 0.8
+
+
+def test_async_close_waits_for_running_calls(fake_server):
+    def slow_redact(request):
+        time.sleep(0.2)
+        return fake_redact_handler(request)
+
+    fake_server.route("POST", "/api/redact", slow_redact)
+
+    async def run():
+        async with AsyncTextualNer(fake_server.url, "key", verify=False) as textual:
+            task = asyncio.ensure_future(textual.redact("John"))
+            await asyncio.sleep(0.05)
+        return task
+
+    task = asyncio.run(run())
+
+    assert task.result().redacted_text == "[NAME_GIVEN]"
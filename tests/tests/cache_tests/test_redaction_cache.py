@@ -0,0 +1,145 @@
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from tests.utils.fake_textual_server import (
+    FakeTextualServer,
+    fake_redact_bulk_handler,
+    fake_redact_handler,
+    fake_structured_table_handler,
+)
+from tonic_textual.classes.redaction_cache import RedactionCache, make_cache_key
+from tonic_textual.redact_api import TextualNer
+
+
+def make_textual(fake_server, cache):
+    fake_server.route("POST", "/api/redact", fake_redact_handler)
+    fake_server.route("POST", "/api/redact/bulk", fake_redact_bulk_handler)
+    fake_server.route(
+        "POST", "/api/redact/structured_table", fake_structured_table_handler
+    )
+    return TextualNer(fake_server.url, "key", verify=False, cache=cache)
+
+
+def test_cache_key_ignores_payload_key_order():
+    assert make_cache_key("/api/redact", {"a": 1, "b": 2}, 1) == make_cache_key(
+        "/api/redact", {"b": 2, "a": 1}, 1
+    )
+    assert make_cache_key("/api/redact", {"a": 1}, 1) != make_cache_key(
+        "/api/redact", {"a": 1}, 2
+    )
+
+
+def test_least_recently_used_entry_is_evicted():
+    cache = RedactionCache(max_entries=2)
+    cache.put("a", 1)
+    cache.put("b", 2)
+    cache.get("a")
+    cache.put("c", 3)
+
+    assert cache.get("b") is None
+    assert cache.get("a") == 1
+    assert cache.get("c") == 3
+    assert len(cache) == 2
+
+
+def test_entries_expire_after_ttl():
+    cache = RedactionCache(ttl_seconds=0.05)
+    cache.put("a", 1)
+    assert cache.get("a") == 1
+
+    time.sleep(0.1)
+
+    assert cache.get("a") is None
+    assert cache.hits == 1
+    assert cache.misses == 1
+
+
+def test_concurrent_misses_compute_once():
+    cache = RedactionCache()
+    calls = []
+    release = threading.Event()
+
+    def compute():
+        calls.append(1)
+        release.wait(5)
+        return "value"
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        futures = [executor.submit(cache.get_or_compute, "key", compute) for _ in range(8)]
+        time.sleep(0.1)
+        release.set()
+        results = [f.result() for f in futures]
+
+    assert results == ["value"] * 8
+    assert len(calls) == 1
+    assert cache.misses == 1
+    assert cache.hits == 7
+
+
+def test_redact_is_cached_only_with_random_seed(fake_server):
+    cache = RedactionCache()
+    textual = make_textual(fake_server, cache)
+
+    first = textual.redact("John lives in Paris", random_seed=1)
+    second = textual.redact("John lives in Paris", random_seed=1)
+    textual.redact("John lives in Paris", random_seed=2)
+    textual.redact("John lives in Paris")
+    textual.redact("John lives in Paris")
+
+    assert len(fake_server.requests) == 4
+    assert second.redacted_text == first.redacted_text
+    assert second.de_identify_results == first.de_identify_results
+
+
+def test_cache_is_scoped_to_instance_and_api_key(fake_server):
+    cache = RedactionCache()
+    other_server = FakeTextualServer().start()
+    try:
+        make_textual(fake_server, cache).redact("John", random_seed=1)
+        make_textual(other_server, cache).redact("John", random_seed=1)
+        other_key = TextualNer(fake_server.url, "other-key", verify=False, cache=cache)
+        other_key.redact("John", random_seed=1)
+        make_textual(fake_server, cache).redact("John", random_seed=1)
+
+        assert len(fake_server.requests) == 2
+        assert len(other_server.requests) == 1
+    finally:
+        other_server.stop()
+
+
+def test_redact_bulk_sends_only_uncached_strings(fake_server):
+    cache = RedactionCache()
+    textual = make_textual(fake_server, cache)
+    textual.redact_bulk(["John", "Paris"], random_seed=1)
+
+    response = textual.redact_bulk(["Paris", "Mary", "John", "Mary"], random_seed=1)
+
+    assert fake_server.requests[-1].json()["bulkText"] == ["Mary"]
+    assert response.bulk_text == ["Paris", "Mary", "John", "Mary"]
+    assert response.bulk_redacted_text == [
+        "[LOCATION_CITY]",
+        "[NAME_GIVEN]",
+        "[NAME_GIVEN]",
+        "[NAME_GIVEN]",
+    ]
+    assert [r.text for results in response.de_identify_results for r in results] == [
+        "Paris",
+        "Mary",
+        "John",
+        "Mary",
+    ]
+    assert response.usage == 1
+
+
+def test_redact_structured_sends_only_uncached_values(fake_server):
+    cache = RedactionCache()
+    textual = make_textual(fake_server, cache)
+    textual.redact_structured(["a@x.com"], "EMAIL_ADDRESS", random_seed=1)
+
+    values = textual.redact_structured(
+        ["b@x.com", "a@x.com"], "EMAIL_ADDRESS", random_seed=1
+    )
+
+    assert fake_server.requests[-1].json()["columns"] == [["b@x.com"]]
+    assert values == ["EMAIL_ADDRESS:moc.x@b", "EMAIL_ADDRESS:moc.x@a"]
@@ -0,0 +1,82 @@
+import multiprocessing
+
+from tests.utils.fake_textual_server import fake_redact_bulk_handler
+from tonic_textual.classes.redaction_cache import RedactionCache
+from tonic_textual.classes.sqlite_redaction_cache import SqliteRedactionCache
+from tonic_textual.redact_api import TextualNer
+
+
+def write_entries(path, start):
+    store = SqliteRedactionCache(path)
+    store.put_many((f"key-{i}", {"value": i}) for i in range(start, start + 50))
+
+
+def test_results_survive_reopening(tmp_path):
+    path = str(tmp_path / "cache.db")
+    SqliteRedactionCache(path).put("key", {"redactedText": "[NAME_GIVEN]"})
+
+    store = SqliteRedactionCache(path)
+
+    assert store.get("key") == {"redactedText": "[NAME_GIVEN]"}
+    assert store.get("missing") is None
+
+
+def test_namespace_isolates_results(tmp_path):
+    path = str(tmp_path / "cache.db")
+    SqliteRedactionCache(path, namespace="v1").put("key", 1)
+
+    assert SqliteRedactionCache(path, namespace="v2").get("key") is None
+    assert SqliteRedactionCache(path, namespace="v1").get("key") == 1
+
+
+def test_least_recently_used_results_are_evicted(tmp_path):
+    store = SqliteRedactionCache(
+        str(tmp_path / "cache.db"), max_bytes=100, eviction_interval=1
+    )
+    for i in range(20):
+        store.put(f"key-{i}", "x" * 10)
+
+    assert len(store) < 20
+    assert store.get("key-19") == "x" * 10
+    assert store.get("key-0") is None
+
+
+def test_processes_share_the_cache(tmp_path):
+    path = str(tmp_path / "cache.db")
+    SqliteRedactionCache(path)
+    context = multiprocessing.get_context("spawn")
+    processes = [
+        context.Process(target=write_entries, args=(path, start))
+        for start in (0, 50)
+    ]
+    for process in processes:
+        process.start()
+    for process in processes:
+        process.join(30)
+
+    assert [process.exitcode for process in processes] == [0, 0]
+    found = SqliteRedactionCache(path).get_many([f"key-{i}" for i in range(100)])
+    assert len(found) == 100
+
+
+def test_backed_cache_skips_server_after_restart(fake_server, tmp_path):
+    fake_server.route("POST", "/api/redact/bulk", fake_redact_bulk_handler)
+    path = str(tmp_path / "cache.db")
+    strings = ["John lives in Paris", "Mary"]
+
+    first = TextualNer(
+        fake_server.url,
+        "key",
+        verify=False,
+        cache=RedactionCache(backing_store=SqliteRedactionCache(path)),
+    ).redact_bulk(strings, random_seed=7)
+    cache = RedactionCache(backing_store=SqliteRedactionCache(path))
+    second = TextualNer(fake_server.url, "key", verify=False, cache=cache).redact_bulk(
+        strings, random_seed=7
+    )
+
+    assert len(fake_server.requests) == 1
+    assert second.bulk_redacted_text == first.bulk_redacted_text
+    assert second.de_identify_results == first.de_identify_results
+    assert cache.hits == 2
+    assert cache.misses == 0
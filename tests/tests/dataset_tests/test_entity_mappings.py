@@ -11,7 +11,7 @@ class RecordingClient:
         self.response = response
         self.calls = []
 
-    def http_get(self, url, session, params={}):
+    def http_get(self, url, session=None, params={}):
         self.calls.append({"url": url, "session": session, "params": params})
         return self.response
 
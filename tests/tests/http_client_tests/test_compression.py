@@ -0,0 +1,63 @@
+import gzip
+
+import pytest
+
+from tests.utils.fake_textual_server import fake_redact_bulk_handler, json_response
+from tonic_textual.classes.http_client_options import HttpClientOptions
+from tonic_textual.classes.httpclient import HttpClient
+from tonic_textual.redact_api import TextualNer
+
+TEXTS = ["John lives in Paris and emails john@example.com"] * 200
+
+
+def gunzipping(handler):
+    def handle(request):
+        if request.headers.get("Content-Encoding") == "gzip":
+            request.body = gzip.decompress(request.body)
+        return handler(request)
+
+    return handle
+
+
+def test_large_bodies_are_compressed(fake_server):
+    fake_server.route("POST", "/api/redact/bulk", gunzipping(fake_redact_bulk_handler))
+    options = HttpClientOptions(request_compression="gzip", compression_threshold=1024)
+    textual = TextualNer(fake_server.url, "key", verify=False, client_options=options)
+
+    response = textual.redact_bulk(TEXTS)
+
+    request = fake_server.requests[0]
+    assert request.headers["Content-Encoding"] == "gzip"
+    assert int(request.headers["Content-Length"]) * 5 < len(request.body)
+    assert response.bulk_redacted_text[0] == "[NAME_GIVEN] lives in [LOCATION_CITY] and emails [EMAIL_ADDRESS]"
+
+
+def test_small_bodies_are_not_compressed(fake_server):
+    fake_server.route("POST", "/api/ping", lambda r: json_response(r.json()))
+    client = HttpClient(fake_server.url, "key", False, HttpClientOptions(request_compression="gzip"))
+
+    assert client.http_post("/api/ping", data={"a": 1}) == {"a": 1}
+    assert "Content-Encoding" not in fake_server.requests[0].headers
+
+
+def test_compression_is_off_by_default(fake_server):
+    fake_server.route("POST", "/api/ping", lambda r: json_response({}))
+    client = HttpClient(fake_server.url, "key", False)
+
+    client.http_post("/api/ping", data={"text": "x" * 100000})
+
+    assert "Content-Encoding" not in fake_server.requests[0].headers
+
+
+def test_compressed_responses_are_decoded(fake_server):
+    body = gzip.compress(b'{"ok": true}')
+    fake_server.route("GET", "/api/ping", lambda r: (200, {"Content-Type": "application/json", "Content-Encoding": "gzip"}, body))
+    client = HttpClient(fake_server.url, "key", False, HttpClientOptions(accept_encoding="gzip"))
+
+    assert client.http_get("/api/ping") == {"ok": True}
+    assert fake_server.requests[0].headers["Accept-Encoding"] == "gzip"
+
+
+def test_invalid_compression_is_rejected():
+    with pytest.raises(ValueError):
+        HttpClientOptions(request_compression="br")
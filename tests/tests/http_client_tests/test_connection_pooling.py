@@ -0,0 +1,62 @@
+import threading
+
+from tests.utils.fake_textual_server import json_response
+from tonic_textual.classes.http_client_options import HttpClientOptions
+from tonic_textual.classes.httpclient import HttpClient
+
+
+def test_requests_reuse_one_connection(fake_server):
+    fake_server.route("GET", "/api/ping", lambda r: json_response({"ok": True}))
+    fake_server.route("POST", "/api/ping", lambda r: json_response({"ok": True}))
+    client = HttpClient(fake_server.url, "key", False)
+
+    for _ in range(3):
+        assert client.http_get("/api/ping") == {"ok": True}
+        assert client.http_post("/api/ping", data={"a": 1}) == {"ok": True}
+
+    ports = {r.client_address[1] for r in fake_server.requests}
+    assert len(fake_server.requests) == 6
+    assert len(ports) == 1
+
+
+def test_keep_alive_disabled_closes_connections(fake_server):
+    fake_server.route("GET", "/api/ping", lambda r: json_response({"ok": True}))
+    client = HttpClient(fake_server.url, "key", False, HttpClientOptions(keep_alive=False))
+
+    for _ in range(3):
+        client.http_get("/api/ping")
+
+    assert all(r.headers.get("Connection") == "close" for r in fake_server.requests)
+
+
+def test_threads_share_pool_but_not_sessions(fake_server):
+    fake_server.route("GET", "/api/ping", lambda r: json_response({"ok": True}))
+    client = HttpClient(fake_server.url, "key", False, HttpClientOptions(pool_maxsize=4))
+    sessions = []
+
+    def work():
+        sessions.append(client.session)
+        for _ in range(5):
+            client.http_get("/api/ping")
+
+    threads = [threading.Thread(target=work) for _ in range(4)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    assert len(fake_server.requests) == 20
+    assert len({id(s) for s in sessions}) == 4
+    assert all(s.get_adapter(fake_server.url) is client._adapter for s in sessions)
+
+
+def test_pool_is_recreated_after_fork(fake_server):
+    client = HttpClient(fake_server.url, "key", False)
+    parent_session = client.session
+    parent_adapter = client._adapter
+
+    # Simulate running in a forked child process.
+    client._pid = -1
+
+    assert client.session is not parent_session
+    assert client._adapter is not parent_adapter
@@ -0,0 +1,77 @@
+import json
+
+import pytest
+
+from tests.utils.fake_textual_server import json_response
+from tonic_textual.classes.common_api_responses.replacement import Replacement
+from tonic_textual.classes.http_client_options import HttpClientOptions
+from tonic_textual.classes.httpclient import HttpClient
+from tonic_textual.classes.json_codec import get_json_codec
+from tonic_textual.classes.redaction_config import RedactionConfig
+
+DOCUMENT = {"text": "Jöhn ✓", "scores": [0.5, 1], "nested": {"1": None, "ok": True}}
+
+
+@pytest.mark.parametrize("name", ["json", "orjson", "msgspec"])
+def test_codecs_round_trip(name):
+    pytest.importorskip(name)
+    codec = get_json_codec(name)
+
+    assert codec.name == name
+    assert codec.loads(codec.dumps(DOCUMENT)) == DOCUMENT
+    with pytest.raises(ValueError):
+        codec.loads(b"{not json")
+
+
+def test_default_codec_is_fastest_installed():
+    expected = "json"
+    for name in ("msgspec", "orjson"):
+        try:
+            __import__(name)
+            expected = name
+        except ImportError:
+            pass
+
+    assert get_json_codec().name == expected
+
+
+def test_unknown_codec_is_rejected():
+    with pytest.raises(ValueError):
+        HttpClientOptions(json_codec="yaml")
+
+
+def test_payload_bytes_match_payload_json():
+    payload = RedactionConfig(generator_config={"NAME_GIVEN": "Synthesis"}).to_payload(text="Jöhn")
+
+    assert json.loads(payload.to_json_bytes(get_json_codec("json"))) == json.loads(payload.to_json())
+    assert json.loads(payload.to_json_bytes(get_json_codec())) == json.loads(payload.to_json())
+
+
+@pytest.mark.parametrize("name", ["json", "orjson"])
+def test_client_encodes_and_decodes_with_codec(fake_server, name):
+    pytest.importorskip(name)
+    fake_server.route("POST", "/api/echo", lambda r: json_response(r.json()))
+    client = HttpClient(fake_server.url, "key", False, HttpClientOptions(json_codec=name))
+
+    assert client.http_post("/api/echo", data=DOCUMENT) == DOCUMENT
+    assert fake_server.requests[0].headers["Content-Type"] == "application/json"
+
+
+def test_replacement_from_api_result():
+    result = {
+        "start": 0,
+        "end": 4,
+        "newStart": 0,
+        "newEnd": 12,
+        "label": "NAME_GIVEN",
+        "text": "John",
+        "score": 0.9,
+        "language": "en",
+        "newText": "[NAME_GIVEN]",
+        "jsonPath": None,
+    }
+
+    replacement = Replacement.from_api_result(result)
+
+    assert replacement == Replacement(0, 4, 0, 12, "NAME_GIVEN", "John", 0.9, "en", new_text="[NAME_GIVEN]")
+    assert replacement.json_path is None
@@ -0,0 +1,90 @@
+import io
+
+import boto3
+import pytest
+import requests
+
+from tests.utils.fake_textual_server import json_response
+from tonic_textual.classes.multipart_encoder import MultipartEncoder, SizedReader
+from tonic_textual.parse_api import TextualParse
+from tonic_textual.redact_api import TextualNer
+
+CONTENT = bytes(range(256)) * 1000
+
+
+class OneWayStream:
+    def __init__(self, data: bytes):
+        self._stream = io.BytesIO(data)
+
+    def read(self, size=-1):
+        return self._stream.read(size)
+
+
+def test_matches_requests_encoding(tmp_path):
+    path = tmp_path / "scan.pdf"
+    path.write_bytes(CONTENT)
+    with open(path, "rb") as f:
+        fields = {
+            "document": (None, '{"fileName": "scan.pdf"}', "application/json"),
+            "file": f,
+        }
+        expected, content_type = requests.PreparedRequest._encode_files(fields, {})
+        f.seek(0)
+        boundary = content_type.split("boundary=")[1]
+        body = MultipartEncoder(fields, boundary=boundary)
+        encoded = body.read()
+
+    assert encoded == expected
+    assert body.content_type == content_type
+    assert body.len == len(expected)
+
+
+def test_reads_in_chunks_and_rewinds():
+    body = MultipartEncoder({"file": io.BytesIO(CONTENT)})
+    first = list(body)
+
+    assert max(len(chunk) for chunk in first) <= 64 * 1024
+    body.rewind()
+    assert b"".join(first) == body.read()
+
+
+def test_stream_without_length_has_no_length():
+    assert MultipartEncoder({"file": OneWayStream(CONTENT)}).len is None
+    assert MultipartEncoder({"file": SizedReader(OneWayStream(CONTENT), len(CONTENT))}).len is not None
+
+
+def test_upload_streams_file(fake_server, tmp_path):
+    fake_server.route("POST", "/api/unattachedfile/upload", lambda r: json_response({"jobId": "job"}))
+    textual = TextualNer(fake_server.url, "key", verify=False)
+    path = tmp_path / "scan.pdf"
+    path.write_bytes(CONTENT)
+
+    with open(path, "rb") as f:
+        assert textual.start_file_redaction(f, "scan.pdf") == "job"
+
+    request = fake_server.requests[0]
+    assert int(request.headers["Content-Length"]) == len(request.body)
+    assert request.headers["Content-Type"].startswith("multipart/form-data; boundary=")
+    assert CONTENT in request.body
+
+
+def test_parse_s3_file_streams_body(fake_server, monkeypatch):
+    class FakeObject:
+        def get(self):
+            return {"Body": OneWayStream(CONTENT), "ContentLength": len(CONTENT)}
+
+    class FakeS3:
+        def Object(self, bucket, key):
+            return FakeObject()
+
+    monkeypatch.setattr(boto3, "resource", lambda name: FakeS3())
+    fake_server.route("POST", "/api/parse", lambda r: json_response({}, 503))
+    parse = TextualParse(fake_server.url, "key", verify=False)
+
+    with pytest.raises(requests.HTTPError):
+        parse.parse_s3_file("bucket", "scans/scan.pdf")
+
+    request = fake_server.requests[0]
+    assert int(request.headers["Content-Length"]) == len(request.body)
+    assert b'filename="scan.pdf"' in request.body
+    assert CONTENT in request.body
@@ -0,0 +1,109 @@
+import io
+import time
+from email.utils import formatdate
+
+import pytest
+import requests
+
+from tests.utils.fake_textual_server import json_response
+from tonic_textual.classes.http_client_options import HttpClientOptions
+from tonic_textual.classes.httpclient import HttpClient
+from tonic_textual.classes.rate_limiter import RateLimit, RateLimiter, parse_retry_after
+
+
+def responses(*statuses):
+    remaining = list(statuses)
+
+    def handle(request):
+        status, headers = remaining.pop(0) if len(remaining) > 1 else remaining[0]
+        return json_response({"status": status}, status, headers)
+
+    return handle
+
+
+def limited_client(fake_server, limiter):
+    return HttpClient(fake_server.url, "key", False, HttpClientOptions(rate_limiter=limiter))
+
+
+def test_retries_after_429_with_retry_after(fake_server):
+    fake_server.route("POST", "/api/redact", responses((429, {"Retry-After": "0"}), (200, {})))
+    client = limited_client(fake_server, RateLimiter())
+
+    assert client.http_post("/api/redact", data={"text": "x"}) == {"status": 200}
+    assert len(fake_server.requests) == 2
+    assert fake_server.requests[1].json() == {"text": "x"}
+
+
+def test_retries_503_with_backoff(fake_server):
+    fake_server.route("GET", "/api/datasets", responses((503, {}), (503, {}), (200, {})))
+    client = limited_client(fake_server, RateLimiter(max_retry_after=0.05))
+
+    assert client.http_get("/api/datasets") == {"status": 200}
+    assert len(fake_server.requests) == 3
+
+
+def test_gives_up_when_retry_after_is_too_long(fake_server):
+    fake_server.route("POST", "/api/redact", responses((429, {"Retry-After": "120"})))
+    client = limited_client(fake_server, RateLimiter())
+
+    with pytest.raises(requests.HTTPError) as e:
+        client.http_post("/api/redact", data={})
+
+    assert e.value.response.status_code == 429
+    assert len(fake_server.requests) == 1
+
+
+def test_errors_are_not_retried_without_limiter(fake_server):
+    fake_server.route("POST", "/api/redact", responses((429, {"Retry-After": "0"}), (200, {})))
+    client = HttpClient(fake_server.url, "key", False)
+
+    with pytest.raises(requests.HTTPError):
+        client.http_post("/api/redact", data={})
+
+
+def test_uploads_are_resent_intact(fake_server):
+    fake_server.route("POST", "/api/parse", responses((429, {"Retry-After": "0"}), (200, {})))
+    client = limited_client(fake_server, RateLimiter())
+
+    client.http_post("/api/parse", files={"file": io.BytesIO(b"scanned page")})
+
+    assert fake_server.requests[0].body == fake_server.requests[1].body
+    assert b"scanned page" in fake_server.requests[1].body
+
+
+def test_budget_limits_sustained_rate(fake_server):
+    fake_server.route("POST", "/api/redact", lambda r: json_response({}))
+    client = limited_client(fake_server, RateLimiter({"redact": RateLimit(20, burst=1)}))
+
+    start = time.monotonic()
+    for _ in range(5):
+        client.http_post("/api/redact", data={})
+
+    assert time.monotonic() - start >= 0.19
+
+
+def test_lock_file_shares_budget_across_limiters(tmp_path):
+    lock_file = str(tmp_path / "textual.lock")
+    first = RateLimiter({"redact": RateLimit(10, burst=1)}, lock_file=lock_file)
+    second = RateLimiter({"redact": RateLimit(10, burst=1)}, lock_file=lock_file)
+
+    start = time.monotonic()
+    first.acquire("redact")
+    second.acquire("redact")
+
+    assert time.monotonic() - start >= 0.09
+
+
+def test_endpoint_classes():
+    assert RateLimiter.endpoint_class("POST", "/api/redact/bulk") == "redact"
+    assert RateLimiter.endpoint_class("POST", "/api/unattachedfile/upload") == "upload"
+    assert RateLimiter.endpoint_class("POST", "/api/unattachedfile/job/download") == "read"
+    assert RateLimiter.endpoint_class("GET", "/api/dataset") == "read"
+    assert RateLimiter.endpoint_class("DELETE", "/api/dataset/1") == "default"
+
+
+def test_parse_retry_after():
+    assert parse_retry_after("3") == 3.0
+    assert 9 <= parse_retry_after(formatdate(time.time() + 10, usegmt=True)) <= 10
+    assert parse_retry_after("soon") is None
+    assert parse_retry_after(None) is None
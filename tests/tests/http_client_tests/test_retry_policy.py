@@ -0,0 +1,143 @@
+import socket
+import threading
+import time
+
+import pytest
+import requests
+
+from tests.utils.fake_textual_server import json_response
+from tonic_textual.classes.http_client_options import HttpClientOptions
+from tonic_textual.classes.httpclient import HttpClient
+from tonic_textual.classes.rate_limiter import RateLimiter
+from tonic_textual.classes.retry_policy import RetryPolicy
+from tonic_textual.classes.tonic_exception import TextualServerBadRequest
+
+
+def statuses(*codes):
+    remaining = list(codes)
+
+    def handle(request):
+        status = remaining.pop(0) if len(remaining) > 1 else remaining[0]
+        return json_response({"status": status}, status)
+
+    return handle
+
+
+def retrying_client(url, **policy):
+    policy.setdefault("initial_backoff", 0)
+    return HttpClient(url, "key", False, HttpClientOptions(retry_policy=RetryPolicy(**policy)))
+
+
+def test_gateway_errors_are_retried(fake_server):
+    fake_server.route("POST", "/api/redact", statuses(502, 504, 200))
+    client = retrying_client(fake_server.url)
+
+    assert client.http_post("/api/redact", data={"text": "x"}) == {"status": 200}
+    assert [r.json() for r in fake_server.requests] == [{"text": "x"}] * 3
+
+
+def test_raised_errors_have_attempts(fake_server):
+    fake_server.route("GET", "/api/dataset", statuses(502))
+    client = retrying_client(fake_server.url, max_attempts=4)
+
+    with pytest.raises(requests.HTTPError) as e:
+        client.http_get("/api/dataset")
+
+    assert e.value.attempts == 4
+    assert len(fake_server.requests) == 4
+
+
+def test_non_idempotent_requests_are_not_retried(fake_server):
+    fake_server.route("POST", "/api/parse", statuses(502, 200))
+    client = retrying_client(fake_server.url)
+
+    with pytest.raises(requests.HTTPError) as e:
+        client.http_post("/api/parse", data={})
+
+    assert e.value.attempts == 1
+    assert len(fake_server.requests) == 1
+
+
+def test_retry_non_idempotent(fake_server):
+    fake_server.route("POST", "/api/parse", statuses(502, 200))
+    client = retrying_client(fake_server.url, retry_non_idempotent=True)
+
+    assert client.http_post("/api/parse", data={}) == {"status": 200}
+
+
+def test_client_errors_are_not_retried(fake_server):
+    fake_server.route("POST", "/api/redact", statuses(400))
+    client = retrying_client(fake_server.url)
+
+    with pytest.raises(TextualServerBadRequest) as e:
+        client.http_post("/api/redact", data={})
+
+    assert e.value.attempts == 1
+
+
+def test_connection_errors_are_retried():
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        url = "http://127.0.0.1:%d" % s.getsockname()[1]
+    client = retrying_client(url, max_attempts=3)
+
+    with pytest.raises(requests.ConnectionError) as e:
+        client.http_get("/api/dataset")
+
+    assert e.value.attempts == 3
+
+
+def test_read_timeouts_are_retried(fake_server):
+    first = threading.Event()
+
+    def handle(request):
+        if not first.is_set():
+            first.set()
+            time.sleep(0.5)
+        return json_response({"ok": True})
+
+    fake_server.route("POST", "/api/redact", handle)
+    client = retrying_client(fake_server.url)
+
+    assert client.http_post("/api/redact", data={}, timeout_seconds=0.2) == {"ok": True}
+    assert len(fake_server.requests) == 2
+
+
+def test_deadline_bounds_all_attempts(fake_server):
+    fake_server.route("GET", "/api/dataset", lambda r: (time.sleep(0.5), json_response({}))[1])
+    client = retrying_client(fake_server.url, initial_backoff=0.1, deadline=0.3)
+
+    start = time.monotonic()
+    with pytest.raises(requests.Timeout) as e:
+        client.http_get("/api/dataset")
+
+    assert time.monotonic() - start < 0.45
+    assert e.value.attempts == 1
+
+
+def test_rate_limiter_keeps_503(fake_server):
+    fake_server.route("GET", "/api/dataset", statuses(503, 502, 200))
+    options = HttpClientOptions(
+        rate_limiter=RateLimiter(max_retry_after=0.01),
+        retry_policy=RetryPolicy(initial_backoff=0),
+    )
+    client = HttpClient(fake_server.url, "key", False, options)
+
+    assert client.http_get("/api/dataset") == {"status": 200}
+    assert len(fake_server.requests) == 3
+
+
+def test_is_idempotent():
+    assert RetryPolicy.is_idempotent("POST", "/api/redact/bulk")
+    assert RetryPolicy.is_idempotent("POST", "/api/unattachedfile/job/download")
+    assert RetryPolicy.is_idempotent("GET", "/api/dataset?name=x")
+    assert not RetryPolicy.is_idempotent("POST", "/api/unattachedfile/upload")
+    assert not RetryPolicy.is_idempotent("DELETE", "/api/dataset/1")
+
+
+def test_backoff_grows_with_jitter():
+    policy = RetryPolicy(initial_backoff=1, max_backoff=3, jitter=0.5)
+
+    assert 0.5 <= policy.backoff(1) <= 1
+    assert 1 <= policy.backoff(2) <= 2
+    assert 1.5 <= policy.backoff(5) <= 3
@@ -0,0 +1,207 @@
+import hashlib
+import io
+import json
+import os
+import threading
+
+import pytest
+
+from tests.utils.fake_textual_server import json_response
+from tonic_textual.classes.httpclient import HttpClient
+from tonic_textual.classes.tonic_exception import (
+    DownloadChecksumMismatch,
+    FileNotReadyForDownload,
+)
+from tonic_textual.redact_api import TextualNer
+
+CONTENT = bytes(range(256)) * 40
+SHA256 = hashlib.sha256(CONTENT).hexdigest()
+
+
+def serve_range(content, etag='"v1"'):
+    etag_header = {} if etag is None else {"ETag": etag}
+
+    def handler(request):
+        range_header = request.headers.get("Range")
+        if_range = request.headers.get("If-Range")
+        if range_header is None or (if_range is not None and if_range != etag):
+            return 200, {"Content-Type": "application/octet-stream", **etag_header}, content
+        start = int(range_header[len("bytes="):].rstrip("-"))
+        if start >= len(content):
+            return 416, {}, b""
+        return (
+            206,
+            {
+                "Content-Range": f"bytes {start}-{len(content) - 1}/{len(content)}",
+                **etag_header,
+            },
+            content[start:],
+        )
+
+    return handler
+
+
+range_handler = serve_range(CONTENT)
+
+
+def write_part(path, content, etag='"v1"', total=len(CONTENT)):
+    (path.parent / (path.name + ".part")).write_bytes(content)
+    (path.parent / (path.name + ".part.json")).write_text(
+        json.dumps({"etag": etag, "total": total})
+    )
+
+
+def test_download_to_path(fake_server, tmp_path):
+    fake_server.route("GET", "/api/file", range_handler)
+    client = HttpClient(fake_server.url, "key", False)
+    path = tmp_path / "out.bin"
+
+    size = client.http_get_file_to("/api/file", str(path), checksum=f"sha256:{SHA256}", chunk_size=1000)
+
+    assert size == len(CONTENT)
+    assert path.read_bytes() == CONTENT
+    assert not os.path.exists(str(path) + ".part")
+
+
+def test_download_to_file_object(fake_server):
+    fake_server.route("POST", "/api/file", range_handler)
+    client = HttpClient(fake_server.url, "key", False)
+    buffer = io.BytesIO()
+
+    size = client.http_post_download_file_to("/api/file", buffer, data={"a": 1}, checksum=SHA256)
+
+    assert size == len(CONTENT)
+    assert buffer.getvalue() == CONTENT
+
+
+def test_download_chunks(fake_server):
+    fake_server.route("GET", "/api/file", range_handler)
+    client = HttpClient(fake_server.url, "key", False)
+
+    chunks = list(client.http_get_file_chunks("/api/file", chunk_size=1000))
+
+    assert b"".join(chunks) == CONTENT
+    assert max(len(c) for c in chunks) <= 1000
+
+
+def test_resumes_partial_download(fake_server, tmp_path):
+    fake_server.route("GET", "/api/file", range_handler)
+    client = HttpClient(fake_server.url, "key", False)
+    path = tmp_path / "out.bin"
+    write_part(path, CONTENT[:3000])
+
+    client.http_get_file_to("/api/file", str(path), checksum=SHA256)
+
+    assert fake_server.requests[0].headers["Range"] == "bytes=3000-"
+    assert fake_server.requests[0].headers["If-Range"] == '"v1"'
+    assert path.read_bytes() == CONTENT
+    assert os.listdir(tmp_path) == ["out.bin"]
+
+
+def test_stale_part_from_another_file_is_not_resumed(fake_server, tmp_path):
+    fake_server.route("GET", "/api/file", serve_range(CONTENT, etag='"v2"'))
+    client = HttpClient(fake_server.url, "key", False)
+    path = tmp_path / "out.bin"
+    other = bytes(reversed(CONTENT))
+    write_part(path, other[:3000], etag='"v1"')
+
+    client.http_get_file_to("/api/file", str(path), checksum=SHA256)
+
+    assert path.read_bytes() == CONTENT
+
+
+def test_stale_part_without_a_validator_is_not_resumed(fake_server, tmp_path):
+    fake_server.route("GET", "/api/file", range_handler)
+    client = HttpClient(fake_server.url, "key", False)
+    path = tmp_path / "out.bin"
+    (tmp_path / "out.bin.part").write_bytes(b"stale bytes from another file")
+
+    client.http_get_file_to("/api/file", str(path))
+
+    assert "Range" not in fake_server.requests[0].headers
+    assert path.read_bytes() == CONTENT
+
+
+def test_part_with_a_different_length_is_not_resumed(fake_server, tmp_path):
+    fake_server.route("GET", "/api/file", serve_range(CONTENT, etag=None))
+    client = HttpClient(fake_server.url, "key", False)
+    path = tmp_path / "out.bin"
+    write_part(path, CONTENT[:3000], etag=None, total=len(CONTENT) + 1)
+
+    client.http_get_file_to("/api/file", str(path), checksum=SHA256)
+
+    assert len(fake_server.requests) == 2
+    assert path.read_bytes() == CONTENT
+
+
+def test_concurrent_downloads_do_not_share_a_part_file(fake_server, tmp_path):
+    release = threading.Event()
+
+    def slow_handler(request):
+        release.wait(5)
+        return range_handler(request)
+
+    fake_server.route("GET", "/api/file", slow_handler)
+    client = HttpClient(fake_server.url, "key", False)
+    path = tmp_path / "out.bin"
+    sizes = []
+    threads = [
+        threading.Thread(
+            target=lambda: sizes.append(client.http_get_file_to("/api/file", str(path)))
+        )
+        for _ in range(2)
+    ]
+    for thread in threads:
+        thread.start()
+    while len(fake_server.requests) < 2:
+        threading.Event().wait(0.01)
+    release.set()
+    for thread in threads:
+        thread.join()
+
+    assert sizes == [len(CONTENT)] * 2
+    assert path.read_bytes() == CONTENT
+    assert os.listdir(tmp_path) == ["out.bin"]
+
+
+def test_restarts_when_range_is_ignored(fake_server, tmp_path):
+    fake_server.route("GET", "/api/file", lambda r: (200, {}, CONTENT))
+    client = HttpClient(fake_server.url, "key", False)
+    path = tmp_path / "out.bin"
+    write_part(path, b"stale bytes")
+
+    client.http_get_file_to("/api/file", str(path), checksum=SHA256)
+
+    assert path.read_bytes() == CONTENT
+
+
+def test_checksum_mismatch_removes_partial_file(fake_server, tmp_path):
+    fake_server.route("GET", "/api/file", range_handler)
+    client = HttpClient(fake_server.url, "key", False)
+    path = tmp_path / "out.bin"
+
+    with pytest.raises(DownloadChecksumMismatch):
+        client.http_get_file_to("/api/file", str(path), checksum="md5:" + "0" * 32)
+
+    assert os.listdir(tmp_path) == []
+
+
+def test_not_ready_leaves_no_partial_file(fake_server, tmp_path):
+    fake_server.route("GET", "/api/file", lambda r: json_response({}, 409))
+    client = HttpClient(fake_server.url, "key", False)
+
+    with pytest.raises(FileNotReadyForDownload):
+        client.http_get_file_to("/api/file", str(tmp_path / "out.bin"))
+
+    assert os.listdir(tmp_path) == []
+
+
+def test_download_redacted_file_to_destination(fake_server, tmp_path):
+    fake_server.route("POST", "/api/unattachedfile/job/download", range_handler)
+    textual = TextualNer(fake_server.url, "key", verify=False)
+    path = tmp_path / "redacted.bin"
+
+    size = textual.download_redacted_file("job", destination=str(path), checksum=SHA256)
+
+    assert size == len(CONTENT)
+    assert path.read_bytes() == CONTENT
@@ -0,0 +1,180 @@
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+
+import pytest
+
+from tonic_textual.classes.job_poller import NOT_READY, JobPoller, run_when_ready
+from tonic_textual.classes.tonic_exception import FileNotReadyForDownload
+from tonic_textual.redact_api import TextualNer
+
+
+def _ready_after(polls: int, result):
+    count = {"polls": 0}
+
+    def poll():
+        count["polls"] += 1
+        return result if count["polls"] >= polls else NOT_READY
+
+    return poll, count
+
+
+def test_polls_until_ready():
+    poller = JobPoller(initial_interval=0.01, max_interval=0.02)
+    poll, count = _ready_after(4, "done")
+
+    assert poller.wait(poll) == "done"
+    assert count["polls"] == 4
+    poller.shutdown()
+
+
+def test_many_jobs_share_one_scheduler_thread():
+    poller = JobPoller(initial_interval=0.01, max_interval=0.05, max_workers=2)
+    before = threading.active_count()
+
+    futures = [poller.submit(_ready_after(3, i)[0]) for i in range(200)]
+
+    assert [f.result(timeout=10) for f in futures] == list(range(200))
+    assert threading.active_count() - before <= 3
+    poller.shutdown()
+
+
+def test_backoff_grows_to_max_interval():
+    poller = JobPoller(initial_interval=0.01, max_interval=0.04, jitter=0)
+    times = []
+
+    def poll():
+        times.append(time.monotonic())
+        return "done" if len(times) == 6 else NOT_READY
+
+    poller.wait(poll)
+    gaps = [b - a for a, b in zip(times, times[1:])]
+
+    assert gaps[0] < 0.03
+    assert all(gap >= 0.035 for gap in gaps[3:])
+    poller.shutdown()
+
+
+def test_timeout_polls_once_more_then_fails():
+    poller = JobPoller(initial_interval=0.01, max_interval=0.02)
+    poll, count = _ready_after(10**6, None)
+
+    with pytest.raises(FileNotReadyForDownload):
+        poller.wait(
+            poll,
+            timeout_seconds=0.1,
+            on_timeout=lambda: FileNotReadyForDownload("not ready"),
+        )
+    assert count["polls"] > 2
+    poller.shutdown()
+
+
+def test_poll_exception_fails_job():
+    poller = JobPoller()
+
+    def poll():
+        raise ValueError("bad job")
+
+    with pytest.raises(ValueError, match="bad job"):
+        poller.wait(poll)
+    poller.shutdown()
+
+
+def test_cancelled_job_stops_polling():
+    poller = JobPoller(initial_interval=0.01, max_interval=0.01)
+    poll, count = _ready_after(10**6, None)
+
+    future = poller.submit(poll)
+    time.sleep(0.05)
+    assert future.cancel()
+    polls = count["polls"]
+    time.sleep(0.05)
+
+    assert count["polls"] <= polls + 1
+    poller.shutdown()
+
+
+def test_download_redacted_file_polls_until_ready(fake_server):
+    attempts = []
+
+    def handler(request):
+        attempts.append(request)
+        if len(attempts) < 3:
+            return 409, {}, b""
+        return 200, {"Content-Type": "application/octet-stream"}, b"redacted"
+
+    fake_server.route("POST", "/api/unattachedfile/job-1/download", handler)
+    textual = TextualNer(fake_server.url, "key", verify=False)
+    textual.job_poller = JobPoller(initial_interval=0.01, max_interval=0.02)
+
+    future = textual.submit_download_redacted_file("job-1", wait_between_retries=1)
+
+    assert future.result(timeout=10) == b"redacted"
+    assert len(attempts) == 3
+    textual.job_poller.shutdown()
+
+
+def test_download_redacted_file_times_out(fake_server):
+    fake_server.route(
+        "POST", "/api/unattachedfile/job-2/download", lambda request: (409, {}, b"")
+    )
+    textual = TextualNer(fake_server.url, "key", verify=False)
+
+    with pytest.raises(FileNotReadyForDownload, match="After 1 retry"):
+        textual.download_redacted_file("job-2", num_retries=1)
+
+
+class _ThreadRecordingFile:
+    def __init__(self):
+        self.threads = set()
+        self.data = b""
+
+    def write(self, chunk):
+        self.threads.add(threading.current_thread().name)
+        self.data += chunk
+        return len(chunk)
+
+
+def test_files_are_transferred_off_the_poller(fake_server):
+    fake_server.route(
+        "POST",
+        "/api/unattachedfile/job-3/download",
+        lambda request: (200, {"Content-Type": "application/octet-stream"}, b"redacted"),
+    )
+    textual = TextualNer(fake_server.url, "key", verify=False)
+    textual.job_poller = JobPoller(initial_interval=0.01, max_interval=0.02)
+
+    on_caller = _ThreadRecordingFile()
+    textual.download_redacted_file("job-3", destination=on_caller)
+    assert on_caller.threads == {threading.current_thread().name}
+
+    on_executor = _ThreadRecordingFile()
+    with ThreadPoolExecutor(max_workers=1, thread_name_prefix="transfer") as executor:
+        future = textual.submit_download_redacted_file(
+            "job-3", destination=on_executor, download_executor=executor
+        )
+        assert future.result(timeout=10) == len(b"redacted")
+    assert on_executor.data == b"redacted"
+    assert all(name.startswith("transfer") for name in on_executor.threads)
+    textual.job_poller.shutdown()
+
+
+def test_cancelled_transfer_closes_the_response():
+    closed = threading.Event()
+
+    class Response:
+        def close(self):
+            closed.set()
+
+    ready = Future()
+    transfer = run_when_ready(ready, lambda response: "done", discard=Response.close)
+    transfer.cancel()
+
+    assert ready.cancelled()
+    ready = Future()
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        executor.submit(time.sleep, 0.1)
+        transfer = run_when_ready(ready, lambda r: "done", executor, Response.close)
+        ready.set_result(Response())
+        transfer.cancel()
+    assert closed.wait(1)
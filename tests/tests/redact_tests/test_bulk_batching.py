@@ -0,0 +1,55 @@
+import pytest
+
+from tests.utils.fake_textual_server import fake_redact_bulk_handler
+from tonic_textual.batch_utils import run_concurrently, split_into_batches
+from tonic_textual.redact_api import TextualNer
+
+
+def test_split_into_batches_by_chars():
+    strings = ["aaaa", "bb", "cccccc", "d", "ee"]
+
+    assert split_into_batches(strings, max_batch_chars=6) == [(0, 2), (2, 3), (3, 5)]
+
+
+def test_split_into_batches_by_size():
+    strings = ["a"] * 5
+
+    assert split_into_batches(strings, max_batch_size=2) == [(0, 2), (2, 4), (4, 5)]
+
+
+def test_split_into_batches_oversized_string_gets_own_batch():
+    strings = ["a", "bbbbbbbbbb", "c"]
+
+    assert split_into_batches(strings, max_batch_chars=3) == [(0, 1), (1, 2), (2, 3)]
+
+
+def test_split_into_batches_without_limits():
+    assert split_into_batches(["a", "b"]) == [(0, 2)]
+    assert split_into_batches([]) == []
+
+
+def test_split_into_batches_rejects_invalid_limits():
+    with pytest.raises(ValueError):
+        split_into_batches(["a"], max_batch_chars=0)
+
+
+def test_run_concurrently_preserves_order():
+    assert run_concurrently(lambda x: x * 2, list(range(50)), max_workers=8) == [
+        x * 2 for x in range(50)
+    ]
+
+
+def test_redact_bulk_in_batches_matches_single_request(fake_server):
+    fake_server.route("POST", "/api/redact/bulk", fake_redact_bulk_handler)
+    textual = TextualNer(fake_server.url, "key", verify=False)
+    strings = [f"Row {i}: John emailed jane@example.com from Paris" for i in range(25)]
+
+    expected = textual.redact_bulk(strings)
+    batched = textual.redact_bulk(strings, max_batch_chars=200, max_workers=3)
+
+    assert len(fake_server.requests) == 1 + len(split_into_batches(strings, max_batch_chars=200))
+    assert len(fake_server.requests) > 2
+    assert batched.bulk_text == strings
+    assert batched.bulk_redacted_text == expected.bulk_redacted_text
+    assert batched.usage == expected.usage
+    assert batched.de_identify_results == expected.de_identify_results
@@ -0,0 +1,132 @@
+import pytest
+
+from tests.utils.fake_textual_server import fake_redact_bulk_handler
+from tonic_textual.classes.common_api_responses.replacement import Replacement
+from tonic_textual.classes.redact_api_responses.bulk_redaction_response import (
+    BulkRedactionResponse,
+)
+from tonic_textual.classes.redact_api_responses.bulk_redaction_spans import (
+    BulkRedactionSpans,
+)
+from tonic_textual.redact_api import TextualNer
+
+STRINGS = ["John in Paris", "hello", "Mary and John", "hello"]
+
+
+def _rows(spans: BulkRedactionSpans):
+    return [
+        (
+            spans.idx[i],
+            spans.start[i],
+            spans.end[i],
+            spans.new_start[i],
+            spans.new_end[i],
+            spans.label(i),
+        )
+        for i in range(len(spans))
+    ]
+
+
+def _replacement_rows(response):
+    return [
+        (idx, r.start, r.end, r.new_start, r.new_end, r.label)
+        for idx, replacements in enumerate(response.de_identify_results)
+        for r in replacements
+    ]
+
+
+def test_columnar_matches_replacements(fake_server):
+    fake_server.route("POST", "/api/redact/bulk", fake_redact_bulk_handler)
+    textual = TextualNer(fake_server.url, "key", verify=False)
+
+    expected = textual.redact_bulk(STRINGS)
+    response = textual.redact_bulk(STRINGS, span_format="columnar")
+
+    assert response.de_identify_results == []
+    assert response.bulk_redacted_text == expected.bulk_redacted_text
+    assert _rows(response.spans) == _replacement_rows(expected)
+    assert _rows(expected.columnar()) == _replacement_rows(expected)
+    assert sorted(response.spans.labels) == sorted(set(response.spans.labels))
+
+
+def test_lean_mode_skips_spans(fake_server):
+    fake_server.route("POST", "/api/redact/bulk", fake_redact_bulk_handler)
+    textual = TextualNer(fake_server.url, "key", verify=False)
+
+    response = textual.redact_bulk(STRINGS, span_format="none")
+
+    assert response.de_identify_results == []
+    assert response.spans is None
+    assert "spans" not in response
+    assert response.bulk_redacted_text[0] == "[NAME_GIVEN] in [LOCATION_CITY]"
+
+
+def test_invalid_span_format(fake_server):
+    textual = TextualNer(fake_server.url, "key", verify=False)
+
+    with pytest.raises(ValueError):
+        textual.redact_bulk(STRINGS, span_format="objects")
+
+
+def test_columnar_with_batches_and_dedupe(fake_server):
+    fake_server.route("POST", "/api/redact/bulk", fake_redact_bulk_handler)
+    textual = TextualNer(fake_server.url, "key", verify=False)
+    strings = STRINGS * 3
+
+    expected = textual.redact_bulk(strings)
+    batched = textual.redact_bulk(strings, max_batch_size=2, span_format="columnar")
+    deduped = textual.redact_bulk(strings, dedupe=True, span_format="columnar")
+
+    assert _rows(batched.spans) == _replacement_rows(expected)
+    assert _rows(deduped.spans) == _replacement_rows(expected)
+
+
+def test_missing_and_null_new_offsets():
+    spans = BulkRedactionSpans.from_api_results(
+        [
+            {"idx": 0, "start": 0, "end": 4, "newStart": None, "newEnd": None, "label": "NAME_GIVEN", "score": 0.9},
+            {"idx": 1, "start": 5, "end": 9, "label": "NAME_GIVEN", "score": 0.8},
+        ]
+    )
+
+    assert list(spans.new_start) == [-1, -1]
+    assert list(spans.new_end) == [-1, -1]
+
+
+def test_null_new_offsets_in_replacements():
+    replacement = Replacement(0, 4, None, None, "NAME_GIVEN", "John", 0.9, "en")
+    response = BulkRedactionResponse(["John"], ["John"], 1, [[replacement]])
+
+    spans = response.columnar()
+
+    assert list(spans.new_start) == [-1]
+    assert list(spans.new_end) == [-1]
+
+
+def test_to_pandas():
+    pd = pytest.importorskip("pandas")
+    spans = BulkRedactionSpans()
+    spans.append(0, 0, 4, 0, 12, "NAME_GIVEN", 0.9)
+    spans.append(1, 5, 10, 5, 20, "LOCATION_CITY", 0.8)
+    spans.append(1, 11, 15, 21, 33, "NAME_GIVEN", 0.7)
+
+    df = spans.to_pandas()
+
+    assert isinstance(df["label"].dtype, pd.CategoricalDtype)
+    assert list(df["label"]) == ["NAME_GIVEN", "LOCATION_CITY", "NAME_GIVEN"]
+    assert list(df["idx"]) == [0, 1, 1]
+    assert list(df["new_end"]) == [12, 20, 33]
+    assert list(df["score"]) == [0.9, 0.8, 0.7]
+
+
+def test_to_arrow():
+    pytest.importorskip("pyarrow")
+    spans = BulkRedactionSpans()
+    spans.append(0, 0, 4, 0, 12, "NAME_GIVEN", 0.9)
+    spans.append(1, 5, 10, 5, 20, "LOCATION_CITY", 0.8)
+
+    table = spans.to_arrow()
+
+    assert table.column("label").to_pylist() == ["NAME_GIVEN", "LOCATION_CITY"]
+    assert table.column("start").to_pylist() == [0, 5]
+    assert table.column("score").to_pylist() == [0.9, 0.8]
@@ -0,0 +1,92 @@
+import pytest
+
+from tests.utils.fake_textual_server import (
+    fake_redact_bulk_handler,
+    fake_structured_table_handler,
+)
+from tonic_textual.helpers.column_profiler import ColumnProfiler
+from tonic_textual.redact_api import TextualNer
+
+COLUMNS = {
+    "email": ["a@x.com", "b@y.org", "c@z.net", "not an email", None],
+    "first_name": ["John", "Mary", "Adam", "Jane"],
+    "notes": ["John lives in Paris", "hello", "Mary called", "nothing here"],
+    "empty": [None, ""],
+}
+
+
+def test_profile_columns(fake_server):
+    fake_server.route("POST", "/api/redact/bulk", fake_redact_bulk_handler)
+    textual = TextualNer(fake_server.url, "key", verify=False)
+
+    profiles = textual.profile_columns(COLUMNS, min_confidence=0.75)
+
+    assert len(fake_server.requests) == 1
+    assert fake_server.requests[0].json()["generatorDefault"] == "Off"
+    assert profiles["email"].pii_type == "EMAIL_ADDRESS"
+    assert profiles["email"].confidence == 0.75
+    assert profiles["email"].structured
+    assert profiles["first_name"].pii_type == "NAME_GIVEN"
+    assert profiles["first_name"].confidence == 1.0
+    assert profiles["notes"].pii_type is None
+    assert not profiles["notes"].structured
+    assert profiles["empty"].sample_size == 0
+    assert not profiles["empty"].structured
+
+
+def test_profiler_samples_at_most_sample_size():
+    profiler = ColumnProfiler(sample_size=5, seed=1)
+    values = [str(i) for i in range(100)]
+
+    sample = profiler.sample(values)
+
+    assert len(sample) == 5
+    assert sample == profiler.sample(values)
+
+
+def test_redact_dataframe_routes_structured_columns(fake_server):
+    pd = pytest.importorskip("pandas")
+    fake_server.route("POST", "/api/redact/bulk", fake_redact_bulk_handler)
+    fake_server.route("POST", "/api/redact/structured_table", fake_structured_table_handler)
+    textual = TextualNer(fake_server.url, "key", verify=False)
+    df = pd.DataFrame(
+        {
+            "email": ["a@x.com", "b@y.org", "c@z.net", "d@w.io"],
+            "notes": ["John lives in Paris", "hello", "Mary called", "hi"],
+        }
+    )
+
+    redacted = textual.redact_dataframe(
+        df,
+        ["email", "notes"],
+        infer_pii_types=True,
+        generator_default="Synthesis",
+    )
+
+    bulk_requests = [
+        r.json() for r in fake_server.requests if r.path == "/api/redact/bulk"
+    ]
+    assert bulk_requests[-1]["bulkText"] == df["notes"].tolist()
+    assert redacted["email"].tolist() == [
+        "EMAIL_ADDRESS:moc.x@a",
+        "EMAIL_ADDRESS:gro.y@b",
+        "EMAIL_ADDRESS:ten.z@c",
+        "EMAIL_ADDRESS:oi.w@d",
+    ]
+    assert redacted["notes"][0] == "[NAME_GIVEN] lives in [LOCATION_CITY]"
+
+
+def test_redact_dataframe_leaves_off_columns(fake_server):
+    pd = pytest.importorskip("pandas")
+    textual = TextualNer(fake_server.url, "key", verify=False)
+    df = pd.DataFrame({"email": ["a@x.com"]})
+
+    redacted = textual.redact_dataframe(
+        df,
+        ["email"],
+        pii_types={"email": "EMAIL_ADDRESS"},
+        generator_config={"EMAIL_ADDRESS": "Off"},
+    )
+
+    assert fake_server.requests == []
+    assert redacted["email"].tolist() == ["a@x.com"]
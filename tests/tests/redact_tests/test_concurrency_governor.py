@@ -0,0 +1,104 @@
+import threading
+import time
+
+import pytest
+import requests
+
+from tests.utils.fake_textual_server import fake_redact_bulk_handler
+from tonic_textual.batch_utils import run_concurrently
+from tonic_textual.classes.concurrency_governor import ConcurrencyGovernor
+from tonic_textual.redact_api import TextualNer
+
+
+def http_error(status):
+    response = requests.Response()
+    response.status_code = status
+    return requests.HTTPError(response=response)
+
+
+def test_limit_grows_while_latency_is_flat():
+    governor = ConcurrencyGovernor(initial_limit=2, max_limit=10)
+
+    for _ in range(20):
+        governor.call(lambda: None)
+
+    assert governor.limit > 2
+    assert governor.stats()["successes"] == 20
+
+
+def test_limit_is_cut_once_per_overload():
+    governor = ConcurrencyGovernor(initial_limit=4)
+    first = governor.acquire()
+    second = governor.acquire()
+
+    governor.release(first, http_error(429))
+    assert governor.limit == 2
+    governor.release(second, http_error(503))
+    assert governor.limit == 2
+
+    governor.release(governor.acquire(), http_error(502))
+    assert governor.limit == 1
+
+
+def test_client_errors_do_not_cut_limit():
+    governor = ConcurrencyGovernor(initial_limit=4)
+
+    with pytest.raises(requests.HTTPError):
+        governor.call(lambda: (_ for _ in ()).throw(http_error(400)))
+
+    assert governor.limit == 4
+    assert governor.stats()["failures"] == 1
+
+
+def test_latency_spike_cuts_limit():
+    governor = ConcurrencyGovernor(initial_limit=8, smoothing=0.5)
+    for _ in range(5):
+        governor.release(governor.acquire() - 0.01)
+
+    governor.release(governor.acquire() - 1.0)
+
+    assert governor.limit == 4
+    assert governor.latency > governor.baseline_latency
+
+
+def test_unmeasured_latency_only_cuts_limit_on_errors():
+    governor = ConcurrencyGovernor(initial_limit=8, smoothing=0.5)
+    for _ in range(5):
+        governor.release(governor.acquire() - 0.01)
+
+    governor.release(governor.acquire() - 60.0, measure_latency=False)
+
+    assert governor.limit == 8
+    assert governor.latency < 0.1
+    governor.release(governor.acquire(), http_error(503), measure_latency=False)
+    assert governor.limit == 4
+
+
+def test_in_flight_stays_within_limit():
+    governor = ConcurrencyGovernor(initial_limit=2, max_limit=2)
+    lock = threading.Lock()
+    in_flight = [0, 0]
+
+    def work(item):
+        with lock:
+            in_flight[0] += 1
+            in_flight[1] = max(in_flight[1], in_flight[0])
+        time.sleep(0.01)
+        with lock:
+            in_flight[0] -= 1
+        return item * 2
+
+    assert run_concurrently(work, list(range(10)), 8, governor) == [i * 2 for i in range(10)]
+    assert in_flight[1] <= 2
+
+
+def test_redact_bulk_uses_governor(fake_server):
+    fake_server.route("POST", "/api/redact/bulk", fake_redact_bulk_handler)
+    governor = ConcurrencyGovernor()
+    textual = TextualNer(fake_server.url, "key", verify=False, concurrency_governor=governor)
+    texts = [f"John {i}" for i in range(10)]
+
+    response = textual.redact_bulk(texts, max_batch_size=2)
+
+    assert response.bulk_redacted_text == [f"[NAME_GIVEN] {i}" for i in range(10)]
+    assert governor.stats()["successes"] == 5
@@ -0,0 +1,46 @@
+from tests.utils.fake_textual_server import (
+    fake_redact_bulk_handler,
+    fake_structured_table_handler,
+)
+from tonic_textual.batch_utils import dedupe_strings
+from tonic_textual.redact_api import TextualNer
+
+
+def test_dedupe_strings():
+    assert dedupe_strings(["b", "a", "b", "c", "a"]) == (["b", "a", "c"], [0, 1, 0, 2, 1])
+
+
+def test_redact_bulk_dedupe_sends_distinct_strings(fake_server):
+    fake_server.route("POST", "/api/redact/bulk", fake_redact_bulk_handler)
+    textual = TextualNer(fake_server.url, "key", verify=False)
+    strings = ["John in Paris", "hello", "John in Paris", "Mary", "hello"]
+
+    expected = textual.redact_bulk(strings)
+    response = textual.redact_bulk(strings, dedupe=True)
+
+    assert fake_server.requests[-1].json()["bulkText"] == ["John in Paris", "hello", "Mary"]
+    assert response.bulk_text == strings
+    assert response.bulk_redacted_text == expected.bulk_redacted_text
+    assert response.de_identify_results == expected.de_identify_results
+    assert response.de_identify_results[0] is not response.de_identify_results[2]
+
+
+def test_redact_bulk_dedupe_with_batches(fake_server):
+    fake_server.route("POST", "/api/redact/bulk", fake_redact_bulk_handler)
+    textual = TextualNer(fake_server.url, "key", verify=False)
+    strings = ["John", "Mary", "Adam"] * 10
+
+    response = textual.redact_bulk(strings, dedupe=True, max_batch_size=2)
+
+    assert sorted(len(r.json()["bulkText"]) for r in fake_server.requests) == [1, 2]
+    assert response.bulk_redacted_text == ["[NAME_GIVEN]"] * 30
+
+
+def test_redact_structured_dedupe(fake_server):
+    fake_server.route("POST", "/api/redact/structured_table", fake_structured_table_handler)
+    textual = TextualNer(fake_server.url, "key", verify=False)
+
+    values = textual.redact_structured(["ab", "cd", "ab"], "NAME_GIVEN", dedupe=True)
+
+    assert fake_server.requests[-1].json()["columns"] == [["ab", "cd"]]
+    assert values == ["NAME_GIVEN:ba", "NAME_GIVEN:dc", "NAME_GIVEN:ba"]
@@ -0,0 +1,149 @@
+import json
+
+import pytest
+
+from tests.utils.fake_textual_server import (
+    fake_detect,
+    fake_redact_bulk_handler,
+    json_response,
+)
+from tonic_textual.classes.tonic_exception import (
+    TextualServerBadRequest,
+    TextualServerError,
+)
+from tonic_textual.redact_api import TextualNer
+
+
+def poisoned_bulk_handler(request):
+    bulk_text = request.json()["bulkText"]
+    if any("BAD" in text for text in bulk_text):
+        return json_response({"error": "Invalid text"}, 400)
+    if any("CRASH" in text for text in bulk_text):
+        return json_response({"error": "Internal error"}, 500)
+    return fake_redact_bulk_handler(request)
+
+
+def poisoned_json_handler(request):
+    document = json.loads(request.json()["jsonText"])
+    if "BAD" in document.values():
+        return json_response({"error": "Invalid JSON"}, 400)
+    redacted, results = fake_detect(document["name"])
+    return json_response(
+        {
+            "originalText": document["name"],
+            "redactedText": redacted,
+            "usage": 1,
+            "deIdentifyResults": results,
+        }
+    )
+
+
+@pytest.fixture
+def textual(fake_server):
+    fake_server.route("POST", "/api/redact/bulk", poisoned_bulk_handler)
+    fake_server.route("POST", "/api/redact/json", poisoned_json_handler)
+    return TextualNer(fake_server.url, "key", verify=False)
+
+
+def test_failing_strings_are_isolated(textual, fake_server):
+    strings = [f"John {i}" for i in range(16)]
+    strings[5] = "BAD"
+    strings[12] = "CRASH"
+
+    response = textual.redact_bulk(strings, isolate_failures=True)
+
+    assert [(f.index, f.text, f.status) for f in response.failures] == [
+        (5, "BAD", 400),
+        (12, "CRASH", 500),
+    ]
+    assert "Invalid text" in response.failures[0].error
+    assert response.failures[1].error == "Internal error"
+    assert response.bulk_redacted_text[5] is None
+    assert response.bulk_redacted_text[0] == "[NAME_GIVEN] 0"
+    assert response.bulk_redacted_text[15] == "[NAME_GIVEN] 15"
+    assert response.usage == 28
+    assert len(response.de_identify_results) == 16
+    assert len(fake_server.requests) < 16
+
+
+def test_failures_are_isolated_within_batches(textual):
+    strings = [f"Jane {i}" for i in range(10)]
+    strings[7] = "BAD"
+
+    response = textual.redact_bulk(
+        strings, max_batch_size=4, isolate_failures=True, span_format="columnar"
+    )
+
+    assert [f.index for f in response.failures] == [7]
+    assert response.bulk_redacted_text[8] == "[NAME_GIVEN] 8"
+    assert sorted(set(response.spans.idx)) == [i for i in range(10) if i != 7]
+
+
+def test_failures_map_to_every_duplicate(textual):
+    strings = ["John", "BAD", "Mary", "BAD"]
+
+    response = textual.redact_bulk(strings, dedupe=True, isolate_failures=True)
+
+    assert [f.index for f in response.failures] == [1, 3]
+    assert response.bulk_redacted_text == ["[NAME_GIVEN]", None, "[NAME_GIVEN]", None]
+
+
+def test_no_failures(textual):
+    response = textual.redact_bulk(["John"], isolate_failures=True)
+
+    assert response.failures == []
+
+
+def test_errors_are_raised_by_default(textual):
+    with pytest.raises(TextualServerBadRequest):
+        textual.redact_bulk(["John", "BAD"])
+
+    with pytest.raises(TextualServerError):
+        textual.redact_bulk(["CRASH"])
+
+
+def test_redact_json_batch(textual):
+    documents = [{"name": "John"}, {"name": "BAD"}, '{"name": "Mary"}']
+
+    response = textual.redact_json_batch(documents, isolate_failures=True)
+
+    assert response.results[0].redacted_text == "[NAME_GIVEN]"
+    assert response.results[1] is None
+    assert response.results[2].redacted_text == "[NAME_GIVEN]"
+    assert [(f.index, f.text, f.status) for f in response.failures] == [
+        (1, '{"name": "BAD"}', 400)
+    ]
+    assert response.usage == 2
+
+    with pytest.raises(TextualServerBadRequest):
+        textual.redact_json_batch(documents)
+
+
+def test_outage_is_raised_without_bisecting(fake_server):
+    fake_server.route(
+        "POST", "/api/redact/bulk", lambda r: json_response({"error": "Down"}, 500)
+    )
+    textual = TextualNer(fake_server.url, "key", verify=False)
+
+    with pytest.raises(TextualServerError):
+        textual.redact_bulk([f"John {i}" for i in range(64)], isolate_failures=True)
+
+    assert len(fake_server.requests) == 4
+
+
+def test_transient_server_error_is_retried(fake_server):
+    calls = []
+
+    def flaky_handler(request):
+        calls.append(request)
+        if len(calls) == 1:
+            return json_response({"error": "Busy"}, 500)
+        return fake_redact_bulk_handler(request)
+
+    fake_server.route("POST", "/api/redact/bulk", flaky_handler)
+    textual = TextualNer(fake_server.url, "key", verify=False)
+
+    response = textual.redact_bulk(["John", "Mary"], isolate_failures=True)
+
+    assert response.failures == []
+    assert len(calls) == 2
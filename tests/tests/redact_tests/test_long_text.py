@@ -0,0 +1,84 @@
+import random
+
+import pytest
+
+from tests.utils.fake_textual_server import fake_detect, fake_redact_handler
+from tonic_textual.classes.common_api_responses.replacement import Replacement
+from tonic_textual.classes.redact_api_responses.redaction_response import (
+    RedactionResponse,
+)
+from tonic_textual.helpers.long_text_helper import LongTextHelper
+from tonic_textual.redact_api import TextualNer
+
+
+def local_redact(text: str) -> RedactionResponse:
+    redacted, results = fake_detect(text)
+    return RedactionResponse(
+        text,
+        redacted,
+        len(text.split()),
+        [
+            Replacement(
+                r["start"], r["end"], r["newStart"], r["newEnd"], r["label"],
+                r["text"], r["score"], r["language"], r["newText"],
+            )
+            for r in results
+        ],
+    )
+
+
+def make_text(lines: int) -> str:
+    rng = random.Random(0)
+    words = ["John", "Mary", "Paris", "Atlanta", "john.smith@example.com", "the", "report", "was", "sent"]
+    return "".join(
+        " ".join(rng.choice(words) for _ in range(rng.randint(3, 15))) + rng.choice([".\n", ". ", "\n"])
+        for _ in range(lines)
+    )
+
+
+@pytest.mark.parametrize("window_size,overlap", [(40, 30), (64, 40), (200, 50), (10_000, 0)])
+def test_windowed_redaction_matches_single_request(window_size, overlap):
+    text = make_text(200)
+    expected = local_redact(text)
+
+    response = LongTextHelper(window_size, overlap, max_workers=3).redact(text, local_redact)
+
+    assert response.original_text == text
+    assert response.redacted_text == expected.redacted_text
+    assert [r.to_dict() for r in response.de_identify_results] == [
+        r.to_dict() for r in expected.de_identify_results
+    ]
+
+
+def test_entity_crossing_a_hard_window_boundary_is_kept_whole():
+    text = "-" * 30 + "jane.doe@example.com" + "-" * 30
+
+    response = LongTextHelper(window_size=40, overlap=25).redact(text, local_redact)
+
+    assert response.redacted_text == "-" * 30 + "[EMAIL_ADDRESS]" + "-" * 30
+    assert [(r.start, r.end, r.new_start, r.new_end) for r in response.de_identify_results] == [(30, 50, 30, 45)]
+
+
+def test_redact_file_streams_windows(tmp_path):
+    text = make_text(500)
+    source = tmp_path / "input.txt"
+    source.write_text(text, encoding="utf-8", newline="")
+    target = tmp_path / "output.txt"
+
+    LongTextHelper(window_size=100, overlap=40).redact_file(
+        str(source), str(target), local_redact, read_size=37
+    )
+
+    assert target.read_text(encoding="utf-8") == local_redact(text).redacted_text
+
+
+def test_redact_long_text_uses_redact(fake_server):
+    fake_server.route("POST", "/api/redact", fake_redact_handler)
+    textual = TextualNer(fake_server.url, "key", verify=False)
+    text = make_text(50)
+
+    response = textual.redact_long_text(text, window_size=200, overlap=50, random_seed=3)
+
+    assert len(fake_server.requests) > 1
+    assert all(r.headers["textual-random-seed"] == "3" for r in fake_server.requests)
+    assert response.redacted_text == local_redact(text).redacted_text
@@ -0,0 +1,98 @@
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+import requests
+
+from tests.utils.fake_textual_server import (
+    fake_redact_bulk_handler,
+    fake_redact_handler,
+    json_response,
+)
+from tonic_textual.classes.redaction_coalescer import _split_usage
+from tonic_textual.redact_api import TextualNer
+
+
+def make_textual(fake_server, max_batch_size=64, max_wait_seconds=0.2):
+    fake_server.route("POST", "/api/redact", fake_redact_handler)
+    fake_server.route("POST", "/api/redact/bulk", fake_redact_bulk_handler)
+    textual = TextualNer(fake_server.url, "key", verify=False)
+    textual.enable_redact_coalescing(max_batch_size, max_wait_seconds)
+    return textual
+
+
+def test_concurrent_redact_calls_are_coalesced(fake_server):
+    textual = make_textual(fake_server, max_batch_size=8)
+    texts = [f"Row {i}: John lives in Atlanta" for i in range(16)]
+
+    with ThreadPoolExecutor(max_workers=16) as executor:
+        results = list(executor.map(textual.redact, texts))
+
+    bulk_requests = [r for r in fake_server.requests if r.path == "/api/redact/bulk"]
+    assert len(bulk_requests) == 2
+    assert sorted(len(r.json()["bulkText"]) for r in bulk_requests) == [8, 8]
+    for text, result in zip(texts, results):
+        assert result.original_text == text
+        assert result.redacted_text == text.replace("John", "[NAME_GIVEN]").replace(
+            "Atlanta", "[LOCATION_CITY]"
+        )
+        assert [r.label for r in result.de_identify_results] == [
+            "NAME_GIVEN",
+            "LOCATION_CITY",
+        ]
+        assert result.usage == len(text.split())
+
+
+def test_calls_with_different_configs_are_not_combined(fake_server):
+    textual = make_textual(fake_server)
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        futures = [
+            executor.submit(textual.redact, "John", random_seed=seed)
+            for seed in [1, 1, 2, 2]
+        ]
+        [f.result() for f in futures]
+
+    seeds = sorted(
+        (r.headers["textual-random-seed"], len(r.json()["bulkText"]))
+        for r in fake_server.requests
+    )
+    assert seeds == [("1", 2), ("2", 2)]
+
+
+def test_single_call_keeps_usage(fake_server):
+    textual = make_textual(fake_server, max_wait_seconds=0)
+
+    result = textual.redact("John was here")
+
+    assert result.redacted_text == "[NAME_GIVEN] was here"
+    assert result.usage == 3
+
+
+def test_errors_are_raised_in_every_caller(fake_server):
+    textual = make_textual(fake_server, max_batch_size=3)
+    fake_server.route(
+        "POST", "/api/redact/bulk", lambda request: json_response({}, 503)
+    )
+
+    with ThreadPoolExecutor(max_workers=3) as executor:
+        futures = [executor.submit(textual.redact, "John") for _ in range(3)]
+
+    for future in futures:
+        with pytest.raises(requests.exceptions.HTTPError):
+            future.result()
+    assert len(fake_server.requests) == 1
+
+
+def test_disable_redact_coalescing(fake_server):
+    textual = make_textual(fake_server)
+    textual.disable_redact_coalescing()
+
+    textual.redact("John")
+
+    assert [r.path for r in fake_server.requests] == ["/api/redact"]
+
+
+def test_split_usage_adds_up():
+    assert _split_usage(10, ["a b", "c", "d e f g"]) == [3, 1, 6]
+    assert sum(_split_usage(7, ["a", "b", "c"])) == 7
+    assert _split_usage(0, ["", "a"]) == [0, 0]
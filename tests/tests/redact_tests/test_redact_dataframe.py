@@ -0,0 +1,130 @@
+import pytest
+
+from tests.utils.fake_textual_server import fake_redact_bulk_handler
+from tonic_textual.redact_api import TextualNer
+
+pd = pytest.importorskip("pandas")
+
+
+def test_redact_series_skips_nulls_and_empties(fake_server):
+    fake_server.route("POST", "/api/redact/bulk", fake_redact_bulk_handler)
+    textual = TextualNer(fake_server.url, "key", verify=False)
+    series = pd.Series(
+        ["John in Paris", None, "", "hello", "John in Paris"], index=[10, 11, 12, 13, 14]
+    )
+
+    redacted = textual.redact_series(series)
+
+    assert fake_server.requests[-1].json()["bulkText"] == ["John in Paris", "hello"]
+    assert redacted.index.tolist() == [10, 11, 12, 13, 14]
+    assert redacted[10] == "[NAME_GIVEN] in [LOCATION_CITY]"
+    assert pd.isna(redacted[11])
+    assert redacted[12] == ""
+    assert redacted[13] == "hello"
+    assert redacted[14] == redacted[10]
+    assert series[10] == "John in Paris"
+
+
+def test_redact_dataframe(fake_server):
+    fake_server.route("POST", "/api/redact/bulk", fake_redact_bulk_handler)
+    textual = TextualNer(fake_server.url, "key", verify=False)
+    df = pd.DataFrame(
+        {
+            "subject": ["John", "Mary in Paris", None],
+            "body": ["hello", "John", "Mary"],
+            "id": [1, 2, 3],
+        }
+    )
+
+    redacted = textual.redact_dataframe(df, ["subject", "body"], max_batch_size=2)
+
+    assert sorted(len(r.json()["bulkText"]) for r in fake_server.requests) == [2, 2]
+    assert redacted["subject"][:2].tolist() == [
+        "[NAME_GIVEN]",
+        "[NAME_GIVEN] in [LOCATION_CITY]",
+    ]
+    assert pd.isna(redacted["subject"][2])
+    assert redacted["body"].tolist() == ["hello", "[NAME_GIVEN]", "[NAME_GIVEN]"]
+    assert redacted["id"].tolist() == [1, 2, 3]
+    assert df["subject"][0] == "John"
+
+
+def test_redact_dataframe_spans(fake_server):
+    fake_server.route("POST", "/api/redact/bulk", fake_redact_bulk_handler)
+    textual = TextualNer(fake_server.url, "key", verify=False)
+    df = pd.DataFrame(
+        {"subject": ["John", "Mary in Paris"], "body": ["hello", "John"]},
+        index=["a", "b"],
+    )
+
+    redacted, spans = textual.redact_dataframe(
+        df, ["subject", "body"], include_spans=True
+    )
+
+    assert list(spans.columns) == [
+        "column",
+        "row",
+        "start",
+        "end",
+        "new_start",
+        "new_end",
+        "label",
+        "score",
+    ]
+    assert isinstance(spans["column"].dtype, pd.CategoricalDtype)
+    assert isinstance(spans["label"].dtype, pd.CategoricalDtype)
+    assert [tuple(r) for r in spans[["column", "row", "start", "end", "label"]].values] == [
+        ("subject", "a", 0, 4, "NAME_GIVEN"),
+        ("subject", "b", 0, 4, "NAME_GIVEN"),
+        ("subject", "b", 8, 13, "LOCATION_CITY"),
+        ("body", "b", 0, 4, "NAME_GIVEN"),
+    ]
+
+
+def test_redact_series_spans_without_values(fake_server):
+    textual = TextualNer(fake_server.url, "key", verify=False)
+
+    redacted, spans = textual.redact_series(pd.Series([None, ""]), include_spans=True)
+
+    assert fake_server.requests == []
+    assert pd.isna(redacted[0])
+    assert redacted[1] == ""
+    assert len(spans) == 0
+    assert "column" not in spans.columns
+
+
+def test_redact_dataframe_missing_column(fake_server):
+    textual = TextualNer(fake_server.url, "key", verify=False)
+
+    with pytest.raises(KeyError):
+        textual.redact_dataframe(pd.DataFrame({"a": ["x"]}), ["b"])
+
+
+@pytest.mark.parametrize("argument", ["dedupe", "span_format", "isolate_failures"])
+def test_reserved_arguments_are_rejected(fake_server, argument):
+    textual = TextualNer(fake_server.url, "key", verify=False)
+    df = pd.DataFrame({"notes": ["John"]})
+
+    with pytest.raises(TypeError, match=argument):
+        textual.redact_series(df["notes"], **{argument: True})
+    with pytest.raises(TypeError, match=argument):
+        textual.redact_dataframe(df, ["notes"], **{argument: True})
+    with pytest.raises(TypeError, match=argument):
+        textual.profile_columns(df, **{argument: True})
+    assert fake_server.requests == []
+
+
+def test_redact_dataframe_sends_other_states_to_ner(fake_server):
+    fake_server.route("POST", "/api/redact/bulk", fake_redact_bulk_handler)
+    textual = TextualNer(fake_server.url, "key", verify=False)
+    df = pd.DataFrame({"email": ["a@x.com"]})
+
+    redacted = textual.redact_dataframe(
+        df,
+        ["email"],
+        pii_types={"email": "EMAIL_ADDRESS"},
+        generator_config={"EMAIL_ADDRESS": "ReplacementSynthesis"},
+    )
+
+    assert fake_server.requests[-1].json()["bulkText"] == ["a@x.com"]
+    assert redacted["email"].tolist() == ["[EMAIL_ADDRESS]"]
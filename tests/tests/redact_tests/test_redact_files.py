@@ -0,0 +1,124 @@
+import os
+import re
+import threading
+
+from tests.utils.fake_textual_server import json_response
+from tonic_textual.classes.job_poller import JobPoller
+from tonic_textual.redact_api import TextualNer
+
+FILES = {
+    "a/x.txt": b"first",
+    "a/y.txt": b"second",
+    "b/x.txt": b"third",
+    "b/fail.txt": b"fourth",
+}
+
+
+def _serve_files(fake_server):
+    contents = {}
+    lock = threading.Lock()
+    polls = {}
+
+    def upload(request):
+        name = re.search(rb'"fileName": "([^"]+)"', request.body).group(1).decode()
+        content = request.body.split(b"\r\n\r\n")[2].split(b"\r\n")[0]
+        with lock:
+            job_id = f"job-{len(contents)}"
+            contents[job_id] = (name, content)
+        return json_response({"jobId": job_id})
+
+    def download(job_id):
+        def handler(request):
+            with lock:
+                polls[job_id] = polls.get(job_id, 0) + 1
+                first_poll = polls[job_id] == 1
+            name, content = contents[job_id]
+            if first_poll:
+                return 409, {}, b""
+            if name == "fail.txt":
+                return 503, {}, b"unavailable"
+            return 200, {"Content-Type": "application/octet-stream"}, content.upper()
+
+        return handler
+
+    fake_server.route("POST", "/api/unattachedfile/upload", upload)
+    for i in range(len(FILES)):
+        fake_server.route(
+            "POST", f"/api/unattachedfile/job-{i}/download", download(f"job-{i}")
+        )
+
+
+def test_redact_files(fake_server, tmp_path):
+    for name, content in FILES.items():
+        path = tmp_path / "in" / name
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_bytes(content)
+    _serve_files(fake_server)
+    textual = TextualNer(fake_server.url, "key", verify=False)
+    textual.job_poller = JobPoller(initial_interval=0.01, max_interval=0.02)
+    done = []
+
+    report = textual.redact_files(
+        str(tmp_path / "in" / "**" / "*.txt"),
+        str(tmp_path / "out"),
+        concurrency=2,
+        show_progress=False,
+        on_file_done=done.append,
+    )
+
+    assert report.succeeded == 3
+    assert report.failed == 1
+    assert len(done) == 4
+    assert [r.path for r in report.results] == sorted(
+        str(tmp_path / "in" / name) for name in FILES
+    )
+    assert (tmp_path / "out" / "a" / "x.txt").read_bytes() == b"FIRST"
+    assert (tmp_path / "out" / "a" / "y.txt").read_bytes() == b"SECOND"
+    assert (tmp_path / "out" / "b" / "x.txt").read_bytes() == b"THIRD"
+    failure = report.failures()[0]
+    assert failure.path.endswith("fail.txt")
+    assert failure.output_path is None
+    assert "503" in failure.error
+    assert not os.path.exists(tmp_path / "out" / "b" / "fail.txt")
+    textual.job_poller.shutdown()
+
+
+def test_redact_files_missing_file(fake_server, tmp_path):
+    textual = TextualNer(fake_server.url, "key", verify=False)
+
+    report = textual.redact_files(
+        [str(tmp_path / "missing.pdf")], str(tmp_path / "out"), show_progress=False
+    )
+
+    assert report.failed == 1
+    assert report.results[0].job_id is None
+    assert fake_server.requests == []
+
+
+def test_redact_files_runs_up_to_concurrency_files_at_once(fake_server, tmp_path):
+    count = 12
+    barrier = threading.Barrier(count, timeout=5)
+
+    def upload(request):
+        barrier.wait()
+        name = re.search(rb'"fileName": "([^"]+)"', request.body).group(1).decode()
+        return json_response({"jobId": name.split(".")[0]})
+
+    fake_server.route("POST", "/api/unattachedfile/upload", upload)
+    for i in range(count):
+        (tmp_path / f"job-{i}.txt").write_bytes(b"text")
+        fake_server.route(
+            "POST",
+            f"/api/unattachedfile/job-{i}/download",
+            lambda request: (200, {"Content-Type": "application/octet-stream"}, b"TEXT"),
+        )
+    textual = TextualNer(fake_server.url, "key", verify=False)
+
+    report = textual.redact_files(
+        str(tmp_path / "job-[0-9]*.txt"),
+        str(tmp_path / "out"),
+        concurrency=count,
+        show_progress=False,
+    )
+
+    assert report.succeeded == count
@@ -0,0 +1,76 @@
+import json
+
+import pytest
+
+from tests.utils.fake_textual_server import fake_redact_bulk_handler, fake_redact_handler
+from tonic_textual import generator_utils
+from tonic_textual.classes.generator_metadata.name_generator_metadata import NameGeneratorMetadata
+from tonic_textual.classes.redaction_config import RedactionConfig
+from tonic_textual.enums.pii_state import PiiState
+from tonic_textual.redact_api import TextualNer
+
+
+def make_config():
+    return RedactionConfig(
+        generator_default=PiiState.Off,
+        generator_config={"NAME_GIVEN": "Synthesis"},
+        generator_metadata={"NAME_GIVEN": NameGeneratorMetadata(preserve_gender=True)},
+        label_allow_lists={"NAME_GIVEN": ["There"]},
+    )
+
+
+def test_payload_serializes_like_a_dict():
+    payload = make_config().to_payload(text="John", recordApiRequestOptions=None)
+
+    assert json.loads(payload.to_json()) == json.loads(json.dumps(dict(payload)))
+    assert payload["text"] == "John"
+    assert payload["generatorDefault"] == "Off"
+
+
+def test_config_is_immutable():
+    config = make_config()
+
+    with pytest.raises(AttributeError):
+        config.generator_default = PiiState.Redaction
+    with pytest.raises(TypeError):
+        config.generator_config["NAME_FAMILY"] = "Redaction"
+
+
+def test_invalid_config_is_rejected_on_creation():
+    with pytest.raises(Exception, match="Invalid key for generator config"):
+        RedactionConfig(generator_config={"NOT_A_TYPE": "Redaction"})
+
+
+def test_config_produces_the_same_request_as_arguments(fake_server):
+    fake_server.route("POST", "/api/redact", fake_redact_handler)
+    textual = TextualNer(fake_server.url, "key", verify=False)
+
+    textual.redact(
+        "John",
+        generator_default=PiiState.Off,
+        generator_config={"NAME_GIVEN": "Synthesis"},
+        generator_metadata={"NAME_GIVEN": NameGeneratorMetadata(preserve_gender=True)},
+        label_allow_lists={"NAME_GIVEN": ["There"]},
+    )
+    textual.redact("John", config=make_config())
+
+    first, second = fake_server.requests
+    assert second.json() == first.json()
+    assert second.headers["Content-Type"] == "application/json"
+
+
+def test_config_is_not_validated_again_per_call(fake_server, monkeypatch):
+    fake_server.route("POST", "/api/redact/bulk", fake_redact_bulk_handler)
+    textual = TextualNer(fake_server.url, "key", verify=False)
+    config = make_config()
+
+    def fail(*args, **kwargs):
+        raise AssertionError("validated again")
+
+    monkeypatch.setattr(generator_utils, "validate_generator_default_and_config", fail)
+    monkeypatch.setattr(generator_utils, "validate_generator_metadata", fail)
+
+    response = textual.redact_bulk(["John", "Mary"], config=config, max_batch_size=1)
+
+    assert response.bulk_text == ["John", "Mary"]
+    assert [r.json()["generatorDefault"] for r in fake_server.requests] == ["Off", "Off"]
@@ -0,0 +1,185 @@
+import threading
+import time
+
+import pytest
+
+from tests.utils.fake_textual_server import FakeTextualServer, fake_redact_handler
+from tonic_textual.classes.request_hedger import RequestHedger
+from tonic_textual.redact_api import TextualNer
+
+
+def slow_first(seconds):
+    def send(attempt):
+        if attempt == 0:
+            time.sleep(seconds)
+            return "primary"
+        return "hedge"
+
+    return send
+
+
+def test_slow_call_is_hedged():
+    hedger = RequestHedger(initial_delay=0.02)
+
+    start = time.monotonic()
+    assert hedger.call(slow_first(0.5)) == "hedge"
+
+    assert time.monotonic() - start < 0.4
+    assert hedger.stats()["hedges"] == 1
+    assert hedger.stats()["hedge_wins"] == 1
+    hedger.shutdown()
+
+
+def test_fast_call_is_not_hedged():
+    hedger = RequestHedger(initial_delay=0.5)
+
+    assert hedger.call(lambda attempt: attempt) == 0
+    assert hedger.stats()["hedges"] == 0
+    hedger.shutdown()
+
+
+def test_hedges_are_rate_limited():
+    hedger = RequestHedger(initial_delay=0.01, max_hedge_ratio=0.1, max_burst=1)
+
+    for _ in range(10):
+        hedger.call(slow_first(0.05))
+
+    assert 1 <= hedger.stats()["hedges"] <= 2
+    hedger.shutdown()
+
+
+def test_errors_before_the_delay_are_raised():
+    hedger = RequestHedger(initial_delay=0.5)
+
+    def send(attempt):
+        raise ValueError(attempt)
+
+    with pytest.raises(ValueError, match="0"):
+        hedger.call(send)
+    assert hedger.stats()["hedges"] == 0
+    hedger.shutdown()
+
+
+def test_hedge_answers_when_primary_fails():
+    hedger = RequestHedger(initial_delay=0.01)
+
+    def send(attempt):
+        if attempt == 0:
+            time.sleep(0.05)
+            raise ValueError("primary")
+        time.sleep(0.1)
+        return "hedge"
+
+    assert hedger.call(send) == "hedge"
+    hedger.shutdown()
+
+
+def test_delay_follows_latency_percentile():
+    hedger = RequestHedger(percentile=50, min_samples=5, min_delay=0)
+
+    for _ in range(5):
+        hedger.call(lambda attempt: time.sleep(0.02))
+
+    assert 0.015 <= hedger.delay() < 0.1
+    hedger.shutdown()
+
+
+def test_unhedgeable_calls_run_on_the_caller_thread():
+    hedger = RequestHedger(initial_delay=0.01, max_hedge_ratio=0.1, max_burst=1)
+    caller = threading.current_thread().name
+
+    hedger.call(slow_first(0.05))
+    threads = [hedger.call(lambda attempt: threading.current_thread().name) for _ in range(3)]
+
+    assert threads == [caller] * 3
+    hedger.shutdown()
+
+
+def test_calls_do_not_wait_for_busy_threads():
+    hedger = RequestHedger(initial_delay=0.5, max_workers=2)
+    release = threading.Event()
+    busy = [
+        threading.Thread(target=hedger.call, args=(lambda attempt: release.wait(5),))
+        for _ in range(2)
+    ]
+    for thread in busy:
+        thread.start()
+    time.sleep(0.05)
+
+    assert hedger.call(lambda attempt: threading.current_thread().name) == (
+        threading.current_thread().name
+    )
+    release.set()
+    for thread in busy:
+        thread.join()
+    hedger.shutdown()
+
+
+def test_shutdown_lets_calls_in_progress_finish():
+    hedger = RequestHedger(initial_delay=0.02)
+    idle = threading.Event()
+    results = []
+    call = threading.Thread(target=lambda: results.append(hedger.call(slow_first(0.2))))
+    call.start()
+    time.sleep(0.1)
+
+    hedger.shutdown(idle.set)
+    assert hedger.call(lambda attempt: attempt) == 0
+    call.join()
+
+    assert results == ["hedge"]
+    assert idle.wait(1)
+
+
+@pytest.fixture
+def alternate_server():
+    server = FakeTextualServer().start()
+    server.route("POST", "/api/redact", fake_redact_handler)
+    yield server
+    server.stop()
+
+
+def test_redact_hedges_to_alternate_url(fake_server, alternate_server):
+    fake_server.route(
+        "POST", "/api/redact", lambda r: (time.sleep(0.5), fake_redact_handler(r))[1]
+    )
+    textual = TextualNer(fake_server.url, "key", verify=False)
+    textual.enable_redact_hedging(
+        alternate_base_url=alternate_server.url, initial_delay=0.02
+    )
+
+    start = time.monotonic()
+    response = textual.redact("John was here", random_seed=7)
+
+    assert time.monotonic() - start < 0.4
+    assert response.redacted_text == "[NAME_GIVEN] was here"
+    assert alternate_server.requests[0].headers["textual-random-seed"] == "7"
+
+    textual.redact("John was here")
+    assert len(alternate_server.requests) == 1
+    textual.disable_redact_hedging()
+
+
+def test_disable_hedging_during_a_call(fake_server, alternate_server):
+    fake_server.route(
+        "POST", "/api/redact", lambda r: (time.sleep(0.3), fake_redact_handler(r))[1]
+    )
+    textual = TextualNer(fake_server.url, "key", verify=False)
+    textual.enable_redact_hedging(
+        alternate_base_url=alternate_server.url, initial_delay=0.02
+    )
+    closed = threading.Event()
+    textual._redact_hedging[1].close = closed.set
+    responses = []
+    call = threading.Thread(
+        target=lambda: responses.append(textual.redact("John was here", random_seed=7))
+    )
+    call.start()
+    time.sleep(0.1)
+
+    textual.disable_redact_hedging()
+    call.join()
+
+    assert responses[0].redacted_text == "[NAME_GIVEN] was here"
+    assert textual.redaction_hedger is None
+    assert closed.wait(1)
@@ -0,0 +1,89 @@
+import json
+import pickle
+import tracemalloc
+
+from tonic_textual.classes.common_api_responses.replacement import Replacement
+from tonic_textual.classes.redact_api_responses.bulk_redaction_response import (
+    BulkRedactionResponse,
+)
+from tonic_textual.classes.audio.redact_audio_responses import TranscriptionWord
+
+
+class DictWithAttributesReplacement(dict):
+    """The previous Replacement layout, which stored every field twice."""
+
+    def __init__(self, start, end, new_start, new_end, label, text, score, language, new_text=None):
+        self.start = start
+        self.end = end
+        self.new_start = new_start
+        self.new_end = new_end
+        self.label = label
+        self.text = text
+        self.score = score
+        self.language = language
+        self.new_text = new_text
+        self.example_redaction = None
+        self.json_path = None
+        self.xml_path = None
+        dict.__init__(
+            self,
+            start=start,
+            end=end,
+            new_start=new_start,
+            new_end=new_end,
+            label=label,
+            text=text,
+            score=score,
+            language=language,
+            **({} if new_text is None else {"new_text": new_text}),
+        )
+
+
+def build(cls, count):
+    return [cls(i, i + 4, i, i + 12, "NAME_GIVEN", "John", 0.9, "en", "[NAME_GIVEN]") for i in range(count)]
+
+
+def test_fields_are_readable_as_keys_and_attributes():
+    r = Replacement(0, 4, 0, 12, "NAME_GIVEN", "John", 0.9, "en", "[NAME_GIVEN]")
+
+    assert r.start == r["start"] == 0
+    assert r.new_text == r["new_text"] == "[NAME_GIVEN]"
+    assert r.json_path is None and "json_path" not in r
+    assert not hasattr(r, "__dict__")
+
+
+def test_assignment_updates_the_mapping():
+    r = Replacement(0, 4, 0, 12, "NAME_GIVEN", "John", 0.9, "en", "[NAME_GIVEN]")
+
+    r.new_start = 5
+    r.new_text = None
+    word = TranscriptionWord(0.5, 0.9, "hello")
+    word.word = "bye"
+
+    assert r["new_start"] == 5
+    assert "new_text" not in r
+    assert word["word"] == "bye"
+
+
+def test_responses_serialize_and_pickle():
+    r = Replacement(0, 4, 0, 12, "NAME_GIVEN", "John", 0.9, "en", "[NAME_GIVEN]")
+    response = BulkRedactionResponse(["John"], ["[NAME_GIVEN]"], 1, [[r]])
+
+    restored = pickle.loads(pickle.dumps(response))
+
+    assert json.loads(json.dumps(response))["de_identify_results"][0][0] == dict(r)
+    assert restored == response
+    assert restored.de_identify_results[0][0].new_end == 12
+
+
+def test_compact_replacement_uses_less_memory():
+    count = 50_000
+    usage = {}
+    for cls in (DictWithAttributesReplacement, Replacement):
+        tracemalloc.start()
+        objects = build(cls, count)
+        usage[cls], _ = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        del objects
+
+    assert usage[Replacement] < 0.7 * usage[DictWithAttributesReplacement]
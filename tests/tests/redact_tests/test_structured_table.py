@@ -0,0 +1,71 @@
+import pytest
+
+from tests.utils.fake_textual_server import fake_structured_table_handler
+from tonic_textual.classes.generator_metadata.email_generator_metadata import (
+    EmailGeneratorMetadata,
+)
+from tonic_textual.classes.redaction_cache import RedactionCache
+from tonic_textual.redact_api import TextualNer
+
+
+def test_redact_structured_table_in_chunks(fake_server):
+    fake_server.route("POST", "/api/redact/structured_table", fake_structured_table_handler)
+    textual = TextualNer(fake_server.url, "key", verify=False)
+    names = [f"n{i}" for i in range(7)]
+    emails = [f"e{i}" for i in range(7)]
+
+    result = textual.redact_structured_table(
+        [names, emails], ["NAME_GIVEN", "EMAIL_ADDRESS"], max_batch_size=3
+    )
+
+    assert result == [
+        [f"NAME_GIVEN:{i}n" for i in range(7)],
+        [f"EMAIL_ADDRESS:{i}e" for i in range(7)],
+    ]
+    bodies = [r.json() for r in fake_server.requests]
+    assert sorted(len(b["columns"][0]) for b in bodies) == [1, 3, 3]
+    assert all(b["piiTypes"] == ["NAME_GIVEN", "EMAIL_ADDRESS"] for b in bodies)
+
+
+def test_redact_structured_table_conflicting_metadata(fake_server):
+    fake_server.route("POST", "/api/redact/structured_table", fake_structured_table_handler)
+    textual = TextualNer(fake_server.url, "key", verify=False)
+
+    result = textual.redact_structured_table(
+        [["a"], ["b"], ["c"]],
+        ["EMAIL_ADDRESS", "EMAIL_ADDRESS", "NAME_GIVEN"],
+        [None, EmailGeneratorMetadata(preserve_domain=True), None],
+    )
+
+    assert result == [["EMAIL_ADDRESS:a"], ["EMAIL_ADDRESS:b"], ["NAME_GIVEN:c"]]
+    bodies = sorted((r.json() for r in fake_server.requests), key=lambda b: len(b["columns"]))
+    assert bodies[0]["columns"] == [["b"]]
+    assert "EMAIL_ADDRESS" in bodies[0]["generatorMetadata"]
+    assert bodies[1]["columns"] == [["a"], ["c"]]
+    assert "generatorMetadata" not in bodies[1]
+
+
+def test_redact_structured_table_dedupe_and_cache(fake_server):
+    fake_server.route("POST", "/api/redact/structured_table", fake_structured_table_handler)
+    textual = TextualNer(fake_server.url, "key", verify=False, cache=RedactionCache())
+    textual.redact_structured(["ab"], "NAME_GIVEN", random_seed=1)
+
+    result = textual.redact_structured_table(
+        [["ab", "cd", "ab"], ["xy", "xy"]],
+        ["NAME_GIVEN", "EMAIL_ADDRESS"],
+        random_seed=1,
+        dedupe=True,
+    )
+
+    assert result == [
+        ["NAME_GIVEN:ba", "NAME_GIVEN:dc", "NAME_GIVEN:ba"],
+        ["EMAIL_ADDRESS:yx", "EMAIL_ADDRESS:yx"],
+    ]
+    assert fake_server.requests[-1].json()["columns"] == [["cd"], ["xy"]]
+
+
+def test_redact_structured_table_validates_lengths(fake_server):
+    textual = TextualNer(fake_server.url, "key", verify=False)
+
+    with pytest.raises(ValueError):
+        textual.redact_structured_table([["a"], ["b"]], ["NAME_GIVEN"])
@@ -0,0 +1,162 @@
+import json
+import re
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Callable, Dict, List, Optional, Tuple
+
+
+class RecordedRequest:
+    def __init__(self, method: str, path: str, headers: Dict[str, str], body: bytes, client_address):
+        self.method = method
+        self.path = path
+        self.headers = headers
+        self.body = body
+        self.client_address = client_address
+
+    def json(self):
+        return json.loads(self.body)
+
+
+# A handler receives the recorded request and returns (status, headers, body).
+Handler = Callable[[RecordedRequest], Tuple[int, Dict[str, str], bytes]]
+
+
+def json_response(payload, status: int = 200, headers: Optional[Dict[str, str]] = None):
+    return status, {"Content-Type": "application/json", **(headers or {})}, json.dumps(payload).encode("utf-8")
+
+
+class FakeTextualServer:
+    """A minimal in-process HTTP server used to exercise the client without a Textual instance."""
+
+    def __init__(self):
+        self.routes: Dict[Tuple[str, str], Handler] = {}
+        self.requests: List[RecordedRequest] = []
+        self._lock = threading.Lock()
+        server = self
+
+        class _RequestHandler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def log_message(self, format, *args):
+                pass
+
+            def _handle(self):
+                length = int(self.headers.get("Content-Length") or 0)
+                body = self.rfile.read(length) if length else b""
+                path = self.path.split("?")[0]
+                request = RecordedRequest(self.command, self.path, dict(self.headers), body, self.client_address)
+                with server._lock:
+                    server.requests.append(request)
+                handler = server.routes.get((self.command, path))
+                if handler is None:
+                    status, headers, payload = json_response({"error": "not found"}, 404)
+                else:
+                    status, headers, payload = handler(request)
+                self.send_response(status)
+                for key, value in headers.items():
+                    self.send_header(key, value)
+                self.send_header("Content-Length", str(len(payload)))
+                self.end_headers()
+                self.wfile.write(payload)
+
+            do_GET = _handle
+            do_POST = _handle
+            do_PUT = _handle
+            do_PATCH = _handle
+            do_DELETE = _handle
+
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), _RequestHandler)
+        self._server.daemon_threads = True
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+
+    @property
+    def url(self) -> str:
+        host, port = self._server.server_address
+        return f"http://{host}:{port}"
+
+    def route(self, method: str, path: str, handler: Handler):
+        self.routes[(method, path)] = handler
+
+    def start(self):
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._server.shutdown()
+        self._server.server_close()
+
+
+_ENTITY_PATTERN = re.compile(
+    r"(?P<EMAIL_ADDRESS>[\w.]+@[\w.]+\w)|\b(?P<NAME_GIVEN>John|Jane|Adam|Mary)\b|\b(?P<LOCATION_CITY>Atlanta|Paris)\b"
+)
+
+
+def fake_detect(text: str):
+    """A tiny deterministic stand-in for the Textual NER model."""
+    results = []
+    redacted = []
+    position = 0
+    shift = 0
+    for match in _ENTITY_PATTERN.finditer(text):
+        label = match.lastgroup
+        new_text = f"[{label}]"
+        redacted.append(text[position:match.start()])
+        redacted.append(new_text)
+        results.append(
+            {
+                "start": match.start(),
+                "end": match.end(),
+                "newStart": match.start() + shift,
+                "newEnd": match.start() + shift + len(new_text),
+                "label": label,
+                "text": match.group(0),
+                "newText": new_text,
+                "score": 0.9,
+                "language": "en",
+            }
+        )
+        shift += len(new_text) - (match.end() - match.start())
+        position = match.end()
+    redacted.append(text[position:])
+    return "".join(redacted), results
+
+
+def fake_redact_handler(request: RecordedRequest):
+    text = request.json()["text"]
+    redacted, results = fake_detect(text)
+    return json_response(
+        {
+            "originalText": text,
+            "redactedText": redacted,
+            "usage": len(text.split()),
+            "deIdentifyResults": results,
+        }
+    )
+
+
+def fake_redact_bulk_handler(request: RecordedRequest):
+    bulk_text = request.json()["bulkText"]
+    bulk_redacted = []
+    all_results = []
+    for idx, text in enumerate(bulk_text):
+        redacted, results = fake_detect(text)
+        bulk_redacted.append(redacted)
+        all_results += [{**r, "idx": idx} for r in results]
+    return json_response(
+        {
+            "bulkText": bulk_text,
+            "bulkRedactedText": bulk_redacted,
+            "usage": sum(len(t.split()) for t in bulk_text),
+            "deIdentifyResults": all_results,
+        }
+    )
+
+
+def fake_structured_table_handler(request: RecordedRequest):
+    body = request.json()
+    return json_response(
+        [
+            [f"{pii_type}:{value[::-1]}" for value in column]
+            for column, pii_type in zip(body["columns"], body["piiTypes"])
+        ]
+    )
@@ -0,0 +1,186 @@
+from typing import List, Optional, Union
+
+from tonic_textual.classes.async_httpclient import AsyncHttpClient
+from tonic_textual.classes.common_api_responses.replacement import Replacement
+from tonic_textual.classes.http_client_options import HttpClientOptions
+from tonic_textual.classes.llm_synthesis.llm_grouping_models import GroupResponse
+from tonic_textual.classes.redaction_cache import RedactionCache
+from tonic_textual.classes.redact_api_responses.bulk_redaction_response import (
+    BulkRedactionResponse,
+)
+from tonic_textual.classes.redact_api_responses.redaction_response import (
+    RedactionResponse,
+)
+from tonic_textual.redact_api import TextualNer
+
+
+class AsyncTextualNer:
+    """Asyncio wrapper class to invoke the Tonic Textual API
+
+    Each method is a coroutine that accepts the same arguments as the
+    corresponding :class:`TextualNer<tonic_textual.redact_api.TextualNer>`
+    method, plus an optional ``timeout``. A single event loop can keep up to
+    ``max_concurrency`` requests in flight. Additional requests wait for a free
+    slot.
+
+    The requests are sent by the synchronous client, with one worker thread
+    per request in flight, so max_concurrency is also the number of threads.
+    A running request cannot be aborted. A call that times out passes its
+    deadline to its request, so that the thread is released soon after the
+    deadline even if the server stops responding. A call that is cancelled
+    without a timeout keeps its thread until its request finishes, so set a
+    timeout when the server may hang.
+
+    Parameters
+    ----------
+    base_url : str
+        The URL to your Tonic Textual instance. Do not include trailing backslashes. The default value is https://textual.tonic.ai.
+    api_key : str
+        Optional. Your API token. Instead of providing the API token
+        here, we recommended that you set the API key in your environment as the
+        value of TONIC_TEXTUAL_API_KEY.
+    verify: bool
+        Whether to verify SSL certification. By default, this is enabled.
+    client_options: Optional[HttpClientOptions]
+        Optional connection pooling and keep-alive settings. By default, the
+        connection pool is sized to max_concurrency.
+    max_concurrency: int
+        The maximum number of requests in flight at the same time. The default
+        is 32.
+    timeout: Optional[float]
+        The default deadline, in seconds, for each call. A call that does not
+        complete within its deadline raises asyncio.TimeoutError. By default,
+        there is no deadline.
+    cache: Optional[RedactionCache]
+        Optional cache of redaction results. Only requests that provide a
+        random_seed are cached. By default, results are not cached.
+
+    Examples
+    --------
+    >>> from tonic_textual.async_redact_api import AsyncTextualNer
+    >>> async with AsyncTextualNer(max_concurrency=100) as textual:
+    >>>     results = await asyncio.gather(*[textual.redact(t) for t in texts])
+    """
+
+    def __init__(
+        self,
+        base_url: str = "https://textual.tonic.ai",
+        api_key: Optional[str] = None,
+        verify: bool = True,
+        client_options: Optional[HttpClientOptions] = None,
+        max_concurrency: int = 32,
+        timeout: Optional[float] = None,
+        cache: Optional[RedactionCache] = None,
+    ):
+        if client_options is None:
+            client_options = HttpClientOptions(
+                pool_maxsize=max(max_concurrency, HttpClientOptions().pool_maxsize)
+            )
+
+        self.ner = TextualNer(base_url, api_key, verify, client_options, cache)
+        self.client = AsyncHttpClient(self.ner.client, max_concurrency)
+        self.timeout = timeout
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.aclose()
+
+    def close(self):
+        """Stops the worker pool, waits for the calls that are running, and
+        closes pooled connections."""
+        self.client.close()
+        self.ner.client.close()
+
+    async def aclose(self):
+        """Closes the client like close, without blocking the event loop."""
+        await self.client.aclose()
+        self.ner.client.close()
+
+    def _deadline(self, timeout: Optional[float]) -> Optional[float]:
+        return self.timeout if timeout is None else timeout
+
+    async def redact(
+        self, string: str, timeout: Optional[float] = None, **kwargs
+    ) -> RedactionResponse:
+        """Redacts a string. See :meth:`TextualNer.redact<tonic_textual.redact_api.TextualNer.redact>`."""
+        return await self.client.run(
+            self.ner.redact, string, timeout=self._deadline(timeout), **kwargs
+        )
+
+    async def redact_bulk(
+        self, strings: List[str], timeout: Optional[float] = None, **kwargs
+    ) -> BulkRedactionResponse:
+        """Redacts a list of strings. See :meth:`TextualNer.redact_bulk<tonic_textual.redact_api.TextualNer.redact_bulk>`."""
+        return await self.client.run(
+            self.ner.redact_bulk, strings, timeout=self._deadline(timeout), **kwargs
+        )
+
+    async def redact_json(
+        self, json_data: Union[str, dict], timeout: Optional[float] = None, **kwargs
+    ) -> RedactionResponse:
+        """Redacts the values in a JSON blob. See :meth:`TextualNer.redact_json<tonic_textual.redact_api.TextualNer.redact_json>`."""
+        return await self.client.run(
+            self.ner.redact_json, json_data, timeout=self._deadline(timeout), **kwargs
+        )
+
+    async def redact_xml(
+        self, xml_data: str, timeout: Optional[float] = None, **kwargs
+    ) -> RedactionResponse:
+        """Redacts the values in an XML blob. See :meth:`TextualNer.redact_xml<tonic_textual.redact_api.TextualNer.redact_xml>`."""
+        return await self.client.run(
+            self.ner.redact_xml, xml_data, timeout=self._deadline(timeout), **kwargs
+        )
+
+    async def redact_html(
+        self, html_data: str, timeout: Optional[float] = None, **kwargs
+    ) -> RedactionResponse:
+        """Redacts the values in an HTML blob. See :meth:`TextualNer.redact_html<tonic_textual.redact_api.TextualNer.redact_html>`."""
+        return await self.client.run(
+            self.ner.redact_html, html_data, timeout=self._deadline(timeout), **kwargs
+        )
+
+    async def redact_structured(
+        self,
+        values: List[str],
+        pii_type: str,
+        timeout: Optional[float] = None,
+        **kwargs,
+    ) -> List[str]:
+        """Synthesizes a column of structured values. See :meth:`TextualNer.redact_structured<tonic_textual.redact_api.TextualNer.redact_structured>`."""
+        return await self.client.run(
+            self.ner.redact_structured,
+            values,
+            pii_type,
+            timeout=self._deadline(timeout),
+            **kwargs,
+        )
+
+    async def unredact_bulk(
+        self,
+        redacted_strings: List[str],
+        timeout: Optional[float] = None,
+        **kwargs,
+    ) -> List[str]:
+        """Removes redaction from a list of strings. See :meth:`TextualNer.unredact_bulk<tonic_textual.redact_api.TextualNer.unredact_bulk>`."""
+        return await self.client.run(
+            self.ner.unredact_bulk,
+            redacted_strings,
+            timeout=self._deadline(timeout),
+            **kwargs,
+        )
+
+    async def group_entities(
+        self,
+        ner_entities: List[Replacement],
+        original_text: str,
+        timeout: Optional[float] = None,
+    ) -> GroupResponse:
+        """Groups entities that refer to the same thing. See :meth:`TextualNer.group_entities<tonic_textual.redact_api.TextualNer.group_entities>`."""
+        return await self.client.run(
+            self.ner.group_entities,
+            ner_entities,
+            original_text,
+            timeout=self._deadline(timeout),
+        )
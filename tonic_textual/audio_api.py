@@ -1,17 +1,21 @@
 import json
 import os
-from time import sleep
 from typing import Dict, List, Optional
 
 import requests
 
 from tonic_textual.classes.generator_metadata.base_metadata import BaseMetadata
-from tonic_textual.classes.httpclient import HttpClient
+from tonic_textual.classes.http_client_options import HttpClientOptions
+from tonic_textual.classes.job_poller import (
+    NOT_READY,
+    JobPoller,
+    file_not_ready_error,
+    retries_to_timeout,
+)
 from tonic_textual.classes.audio.redacted_transcription_result import RedactedTranscriptionResult
 
 from tonic_textual.classes.tonic_exception import (
     AudioTranscriptionResultAlreadyRetrieved,
-    FileNotReadyForDownload,
 )
 from tonic_textual.classes.audio.redact_audio_responses import (
     TranscriptionResult
@@ -34,6 +38,9 @@ class TextualAudio:
         value of TONIC_TEXTUAL_API_KEY.
     verify: bool
         Whether to verify SSL certification. By default, this is enabled.
+    client_options: Optional[HttpClientOptions]
+        Optional connection pooling and keep-alive settings. All requests made
+        through this object share one pool of keep-alive connections.
     Examples
     --------
     >>> from tonic_textual.audio_api import TextualAudio
@@ -45,6 +52,7 @@ class TextualAudio:
         base_url: str = "https://textual.tonic.ai",
         api_key: Optional[str] = None,
         verify: bool = True,
+        client_options: Optional[HttpClientOptions] = None,
     ):
         if api_key is None:
             api_key = os.environ.get("TONIC_TEXTUAL_API_KEY")
@@ -56,9 +64,9 @@ class TextualAudio:
                 )
 
         self.api_key = api_key
-        self.client = HttpClient(base_url, self.api_key, verify)
+        self.ner = TextualNer(base_url, api_key, verify, client_options)
+        self.client = self.ner.client
         self.verify = verify
-        self.ner = TextualNer(base_url, api_key, verify)
 
     def redact_audio_transcript(
         self,
@@ -163,12 +171,13 @@ class TextualAudio:
             The path to the audio file.
 
         num_retries: Optional[int] = 30
-            Defaults to 30. An optional value to specify the number of times to attempt to
-            fetch the result. If a file is not yet ready for download, Textual
-            pauses for 10 seconds before each retrying.
+            Defaults to 30. Together with wait_between_retries, sets how long to
+            wait for the result. If the result is not ready, Textual checks
+            again, with waits that grow up to wait_between_retries, for up to
+            (num_retries - 1) * wait_between_retries seconds.
 
         wait_between_retries: int = 10
-            The number of seconds to wait between retry attempts. (The default
+            The longest wait, in seconds, between two checks. (The default
             value is 10)
                         
         Returns
@@ -197,33 +206,23 @@ class TextualAudio:
         
         job_id = start_response["jobId"]
         
-        retries = 1
-        transcription_result = None
-        while retries <= num_retries:
+        def poll():
             try:
-                with requests.Session() as session:
-                    transcription_result = self.client.http_get(
-                        f"/api/audio/{job_id}/transcribe/result",
-                        session=session
-                    )
-                    break
+                return self.client.http_get(f"/api/audio/{job_id}/transcribe/result")
             except requests.exceptions.HTTPError as err:
                 if err.response.status_code == 409:
-                    retries = retries + 1
-                    if retries <= num_retries:
-                        sleep(wait_between_retries)
+                    return NOT_READY
                 elif err.response.status_code == 410:
-                    raise AudioTranscriptionResultAlreadyRetrieved("The transcription result has already been retrieved and or was automatically deleted which happens after 5 minutes.")                
+                    raise AudioTranscriptionResultAlreadyRetrieved("The transcription result has already been retrieved and or was automatically deleted which happens after 5 minutes.")
                 else:
                     raise err
 
-        if transcription_result is None:
-            retryWord = "retry" if num_retries == 1 else "retries"
-            raise FileNotReadyForDownload(
-                f"After {num_retries} {retryWord}, the file is not yet ready to download. "
-                "This is likely due to a high service load. Try again later."
-            )
-        
+        transcription_result = JobPoller.default().wait(
+            poll,
+            timeout_seconds=retries_to_timeout(num_retries, wait_between_retries),
+            max_interval=wait_between_retries,
+            on_timeout=lambda: file_not_ready_error(num_retries),
+        )
         return TranscriptionResult.from_dict(transcription_result)
     
     def redact_audio_file(
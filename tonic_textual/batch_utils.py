@@ -0,0 +1,210 @@
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, List, Optional, Sequence, Tuple, TypeVar
+
+import requests
+
+from tonic_textual.classes.concurrency_governor import ConcurrencyGovernor
+from tonic_textual.classes.redact_api_responses.bulk_redaction_response import (
+    BulkRedactionResponse,
+)
+from tonic_textual.classes.redact_api_responses.bulk_redaction_spans import (
+    BulkRedactionSpans,
+)
+from tonic_textual.classes.redact_api_responses.redaction_failure import (
+    RedactionFailure,
+)
+from tonic_textual.classes.tonic_exception import (
+    InvalidJsonForRedactionRequest,
+    TextualServerBadRequest,
+    TextualServerError,
+)
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+
+def split_into_batches(
+    strings: Sequence[str],
+    max_batch_chars: Optional[int] = None,
+    max_batch_size: Optional[int] = None,
+) -> List[Tuple[int, int]]:
+    """Splits a list of strings into consecutive batches.
+
+    Each batch is returned as a (start, end) index range. A batch holds at most
+    max_batch_size strings, and at most max_batch_chars characters in total. A
+    string that is longer than max_batch_chars is placed in a batch of its own.
+    """
+    if max_batch_chars is not None and max_batch_chars < 1:
+        raise ValueError("max_batch_chars must be at least 1")
+    if max_batch_size is not None and max_batch_size < 1:
+        raise ValueError("max_batch_size must be at least 1")
+
+    batches = []
+    start = 0
+    chars = 0
+    for idx, s in enumerate(strings):
+        size = len(s)
+        batch_is_full = (
+            max_batch_size is not None and idx - start >= max_batch_size
+        ) or (max_batch_chars is not None and chars + size > max_batch_chars)
+        if idx > start and batch_is_full:
+            batches.append((start, idx))
+            start = idx
+            chars = 0
+        chars += size
+
+    if start < len(strings):
+        batches.append((start, len(strings)))
+    return batches
+
+
+def run_concurrently(
+    func: Callable[[T], R],
+    items: Sequence[T],
+    max_workers: int,
+    governor: Optional[ConcurrencyGovernor] = None,
+) -> List[R]:
+    """Calls func on each item using up to max_workers threads. Results are
+    returned in the order of items. The first exception raised by a call is
+    re-raised.
+
+    When a governor is provided, it decides how many calls run at the same
+    time, up to its max_limit, and max_workers is ignored."""
+    if max_workers < 1:
+        raise ValueError("max_workers must be at least 1")
+
+    if governor is not None:
+        if len(items) <= 1:
+            return [governor.call(func, item) for item in items]
+        with ThreadPoolExecutor(
+            max_workers=min(governor.max_limit, len(items))
+        ) as executor:
+            return list(executor.map(lambda item: governor.call(func, item), items))
+
+    if max_workers == 1 or len(items) <= 1:
+        return [func(item) for item in items]
+
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(items))) as executor:
+        return list(executor.map(func, items))
+
+
+def merge_bulk_redaction_responses(
+    responses: List[BulkRedactionResponse],
+) -> BulkRedactionResponse:
+    """Concatenates the responses for consecutive batches into a single response.
+    The usage is summed."""
+    bulk_text = []
+    bulk_redacted_text = []
+    de_identify_results = []
+    spans = None
+    failures = None
+    usage = 0
+    for response in responses:
+        if response.spans is not None:
+            if spans is None:
+                spans = BulkRedactionSpans()
+            spans.extend(response.spans, idx_offset=len(bulk_text))
+        if response.failures is not None:
+            if failures is None:
+                failures = []
+            failures += [
+                RedactionFailure(f.index + len(bulk_text), f.text, f.status, f.error)
+                for f in response.failures
+            ]
+        bulk_text += response.bulk_text
+        bulk_redacted_text += response.bulk_redacted_text
+        de_identify_results += response.de_identify_results
+        usage += response.usage
+
+    return BulkRedactionResponse(
+        bulk_text, bulk_redacted_text, usage, de_identify_results, spans, failures
+    )
+
+
+def dedupe_strings(strings: Sequence[str]) -> Tuple[List[str], List[int]]:
+    """Returns the distinct strings in order of first appearance, and for each
+    input string, the index of the string in the distinct list."""
+    index: Dict[str, int] = {}
+    positions = [index.setdefault(s, len(index)) for s in strings]
+    return list(index), positions
+
+
+def expand_bulk_redaction_response(
+    response: BulkRedactionResponse, positions: List[int]
+) -> BulkRedactionResponse:
+    """Expands the response for a list of distinct strings back to the original
+    positions returned by dedupe_strings. The usage is unchanged."""
+    spans = None
+    if response.spans is not None:
+        spans = response.spans.take(positions)
+    de_identify_results = []
+    if response.de_identify_results:
+        de_identify_results = [
+            list(response.de_identify_results[p]) for p in positions
+        ]
+    failures = None
+    if response.failures is not None:
+        failed = {f.index: f for f in response.failures}
+        failures = [
+            RedactionFailure(idx, failed[p].text, failed[p].status, failed[p].error)
+            for idx, p in enumerate(positions)
+            if p in failed
+        ]
+    return BulkRedactionResponse(
+        [response.bulk_text[p] for p in positions],
+        [response.bulk_redacted_text[p] for p in positions],
+        response.usage,
+        de_identify_results,
+        spans,
+        failures,
+    )
+
+
+def is_poison_error(error: BaseException) -> bool:
+    """Returns whether an error shows that the server could not redact the
+    content of a request: a 400 or 500 response. Such a request fails again
+    when it is resent as is."""
+    if isinstance(error, requests.exceptions.HTTPError) and error.response is not None:
+        return error.response.status_code in (400, 500)
+    return isinstance(
+        error,
+        (InvalidJsonForRedactionRequest, TextualServerBadRequest, TextualServerError),
+    )
+
+
+def is_server_error(error: BaseException) -> bool:
+    """Returns whether an error is a 5xx response. Unlike a 400 response, it
+    can also be caused by an outage rather than by the content of the
+    request."""
+    if isinstance(error, requests.exceptions.HTTPError) and error.response is not None:
+        return error.response.status_code >= 500
+    return isinstance(error, TextualServerError)
+
+
+def redaction_failure(index: int, text: str, error: BaseException) -> RedactionFailure:
+    """Returns the failure of one item from the error raised when it was sent."""
+    if isinstance(error, TextualServerError):
+        status = 500
+    elif isinstance(error, (InvalidJsonForRedactionRequest, TextualServerBadRequest)):
+        status = 400
+    elif isinstance(error, requests.exceptions.HTTPError) and error.response is not None:
+        status = error.response.status_code
+    else:
+        status = None
+    return RedactionFailure(index, text, status, str(error))
+
+
+def failed_bulk_redaction_response(
+    text: str, error: BaseException, span_format: str
+) -> BulkRedactionResponse:
+    """Returns the response for a single string that the server could not
+    redact, in the given span_format, so that it can be merged with the
+    responses of the other strings."""
+    return BulkRedactionResponse(
+        [text],
+        [None],
+        0,
+        [[]] if span_format == "replacements" else [],
+        BulkRedactionSpans() if span_format == "columnar" else None,
+        [redaction_failure(0, text, error)],
+    )
@@ -0,0 +1,151 @@
+import asyncio
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Optional
+
+from tonic_textual.classes.httpclient import HttpClient
+
+
+class AsyncHttpClient:
+    """Asyncio client used to handle requests to the Tonic Textual instance.
+
+    Requests are sent by the pooled HttpClient on a dedicated, bounded worker
+    pool, so that an event loop can keep many requests in flight without
+    blocking.
+
+    Each request in flight holds one worker thread, so max_concurrency
+    requests in flight use max_concurrency threads. A running request cannot
+    be aborted from the event loop. When a call has a timeout, the timeout is
+    also passed to the request, so that a server that stops responding
+    releases the thread soon after the deadline. A call that is cancelled
+    without a timeout keeps its thread until its request finishes.
+
+    Parameters
+    ----------
+    client : HttpClient
+        The client used to send the requests.
+    max_concurrency : int
+        The maximum number of requests in flight at the same time. Additional
+        requests wait for a free slot. The default is 32.
+    """
+
+    def __init__(self, client: HttpClient, max_concurrency: int = 32):
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency must be at least 1")
+
+        self.client = client
+        self.max_concurrency = max_concurrency
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_concurrency, thread_name_prefix="textual-async"
+        )
+
+    async def run(
+        self, func: Callable, *args, timeout: Optional[float] = None, **kwargs
+    ) -> Any:
+        """Runs a blocking call on the worker pool.
+
+        Parameters
+        ----------
+        func : Callable
+            The blocking function to call.
+        timeout : Optional[float]
+            The deadline in seconds for the call, including the time spent
+            waiting for a free slot. When the deadline passes,
+            asyncio.TimeoutError is raised, and the requests that the call
+            sends from its thread time out as well.
+
+        If the awaiting task is cancelled or times out before the call starts,
+        the call never runs. If the call is already running, its result is
+        discarded.
+        """
+        loop = asyncio.get_running_loop()
+        deadline = None if timeout is None else time.monotonic() + timeout
+
+        def call():
+            if deadline is not None and time.monotonic() >= deadline:
+                raise asyncio.TimeoutError()
+            with self.client.call_deadline(deadline):
+                return func(*args, **kwargs)
+
+        future = loop.run_in_executor(self._executor, call)
+        if timeout is None:
+            return await future
+        return await asyncio.wait_for(future, timeout)
+
+    async def http_get(self, url: str, params: dict = {}, timeout: Optional[float] = None):
+        return await self.run(self.client.http_get, url, params=params, timeout=timeout)
+
+    async def http_get_file(
+        self,
+        url: str,
+        params: dict = {},
+        additional_headers={},
+        timeout: Optional[float] = None,
+    ) -> bytes:
+        return await self.run(
+            self.client.http_get_file,
+            url,
+            params=params,
+            additional_headers=additional_headers,
+            timeout=timeout,
+        )
+
+    async def http_post(
+        self,
+        url,
+        params={},
+        data={},
+        files={},
+        additional_headers={},
+        timeout: Optional[float] = None,
+    ):
+        return await self.run(
+            self.client.http_post,
+            url,
+            params=params,
+            data=data,
+            files=files,
+            additional_headers=additional_headers,
+            timeout=timeout,
+        )
+
+    async def http_post_download_file(
+        self,
+        url: str,
+        params: dict = {},
+        data={},
+        additional_headers={},
+        timeout: Optional[float] = None,
+    ) -> bytes:
+        return await self.run(
+            self.client.http_post_download_file,
+            url,
+            params=params,
+            data=data,
+            additional_headers=additional_headers,
+            timeout=timeout,
+        )
+
+    async def http_put(self, url, params={}, data={}, timeout: Optional[float] = None):
+        return await self.run(
+            self.client.http_put, url, params=params, data=data, timeout=timeout
+        )
+
+    async def http_patch(self, url, data={}, timeout: Optional[float] = None):
+        return await self.run(self.client.http_patch, url, data=data, timeout=timeout)
+
+    async def http_delete(self, url, params={}, timeout: Optional[float] = None):
+        return await self.run(
+            self.client.http_delete, url, params=params, timeout=timeout
+        )
+
+    def close(self):
+        """Stops the worker pool. Calls that have not started are cancelled,
+        and this waits until the calls that are already running complete, so
+        that the HttpClient can then be closed safely."""
+        self._executor.shutdown(wait=True, cancel_futures=True)
+
+    async def aclose(self):
+        """Stops the worker pool like close, without blocking the event
+        loop."""
+        await asyncio.get_running_loop().run_in_executor(None, self.close)
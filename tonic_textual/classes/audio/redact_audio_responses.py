@@ -1,5 +1,7 @@
 from typing import List
 
+from tonic_textual.classes.common_api_responses.response_field import response_field
+
 class TranscriptionWord(dict):
     """
     Represents a single word in a transcription, including start and end timestamps.
@@ -14,16 +16,15 @@ class TranscriptionWord(dict):
         The spoken word.
 
     """
+
+    __slots__ = ()
+
     def __init__(
         self,
         start: float,
         end: float,
         word: str
     ):
-        self.start = start
-        self.end = end
-        self.word = word
-
         dict.__init__(
             self,
             start=start,
@@ -31,6 +32,10 @@ class TranscriptionWord(dict):
             word=word
         )
 
+    start = response_field("start")
+    end = response_field("end")
+    word = response_field("word")
+
     @classmethod
     def from_dict(cls, d):
         return cls(**d)
@@ -53,6 +58,9 @@ class TranscriptionSegment(dict):
         A list of words included in the segment.
 
     """
+
+    __slots__ = ()
+
     def __init__(
         self,
         start: float,
@@ -62,12 +70,6 @@ class TranscriptionSegment(dict):
         words: List[TranscriptionWord]
 
     ):
-        self.start = start
-        self.end = end
-        self.id = id
-        self.text = text
-        self.words = words
-
         dict.__init__(
             self,
             start=start,
@@ -77,6 +79,12 @@ class TranscriptionSegment(dict):
             words=words
         )
 
+    start = response_field("start")
+    end = response_field("end")
+    id = response_field("id")
+    text = response_field("text")
+    words = response_field("words")
+
     @classmethod
     def from_dict(cls, d):
         words = [TranscriptionWord.from_dict(w) for w in d["words"]]
@@ -96,16 +104,15 @@ class TranscriptionResult(dict):
     language : str, optional
         The detected language of the transcription (default is empty string).
     """
+
+    __slots__ = ()
+
     def __init__(
         self,
         text: str,
         segments: TranscriptionSegment,
         language: str = ""
     ):
-        self.text = text
-        self.segments = segments
-        self.language = language
-
         dict.__init__(
             self,
             text=text,
@@ -113,6 +120,10 @@ class TranscriptionResult(dict):
             language=language
         )
 
+    text = response_field("text")
+    segments = response_field("segments")
+    language = response_field("language")
+
     @classmethod
     def from_dict(cls, d):
         segments = [TranscriptionSegment.from_dict(s) for s in d["segments"]]
@@ -2,6 +2,7 @@ from typing import List
 
 from tonic_textual.classes.audio.redact_audio_responses import TranscriptionResult
 from tonic_textual.classes.common_api_responses.replacement import Replacement
+from tonic_textual.classes.common_api_responses.response_field import response_field
 
 class RedactedTranscriptionResult(dict):
     """Redaction response object
@@ -18,6 +19,8 @@ class RedactedTranscriptionResult(dict):
         The number of words used
     """
 
+    __slots__ = ()
+
     def __init__(
         self,
         original_transcript: TranscriptionResult,
@@ -25,14 +28,15 @@ class RedactedTranscriptionResult(dict):
         redacted_segments: List[List[Replacement]],
         usage: int,
     ):
-        self.original_transcript = original_transcript
-        self.redacted_text = redacted_text        
-        self.redacted_segments = redacted_segments
-        self.usage = usage
         dict.__init__(
             self,
             original_transcript=original_transcript,
             redacted_text=redacted_text,            
             redacted_segments = redacted_segments,
             usage=usage,
-        )
\ No newline at end of file
+        )
+
+    original_transcript = response_field("original_transcript")
+    redacted_text = response_field("redacted_text")
+    redacted_segments = response_field("redacted_segments")
+    usage = response_field("usage")
\ No newline at end of file
@@ -1,6 +1,16 @@
 import json
 from typing import Optional, Dict
 
+from tonic_textual.classes.common_api_responses.response_field import response_field
+
+
+_OPTIONAL_API_FIELDS = (
+    ("newText", "new_text"),
+    ("exampleRedaction", "example_redaction"),
+    ("jsonPath", "json_path"),
+    ("xmlPath", "xml_path"),
+)
+
 
 class Replacement(dict):
     """A span of text that was detected as a named entity.
@@ -39,6 +49,8 @@ class Replacement(dict):
         if the input text was an XML document. NOTE: Arrays in xpath are 1-based.
     """
 
+    __slots__ = ()
+
     def __init__(
         self,
         start: int,
@@ -54,19 +66,6 @@ class Replacement(dict):
         json_path: Optional[str] = None,
         xml_path: Optional[str] = None,
     ):
-        self.start = start
-        self.end = end
-        self.new_start = new_start
-        self.new_end = new_end
-        self.label = label
-        self.text = text
-        self.new_text = new_text
-        self.score = score
-        self.language = language
-        self.example_redaction = example_redaction
-        self.json_path = json_path
-        self.xml_path = xml_path
-
         dict.__init__(
             self,
             start=start,
@@ -77,15 +76,50 @@ class Replacement(dict):
             text=text,
             score=score,
             language=language,
-            **({} if new_text is None else {"new_text": new_text}),
-            **(
-                {}
-                if example_redaction is None
-                else {"example_redaction": example_redaction}
-            ),
-            **({} if json_path is None else {"json_path": json_path}),
-            **({} if xml_path is None else {"xml_path": xml_path}),
         )
+        if new_text is not None:
+            self["new_text"] = new_text
+        if example_redaction is not None:
+            self["example_redaction"] = example_redaction
+        if json_path is not None:
+            self["json_path"] = json_path
+        if xml_path is not None:
+            self["xml_path"] = xml_path
+
+    start = response_field("start")
+    end = response_field("end")
+    new_start = response_field("new_start")
+    new_end = response_field("new_end")
+    label = response_field("label")
+    text = response_field("text")
+    score = response_field("score")
+    language = response_field("language")
+    new_text = response_field("new_text", optional=True)
+    example_redaction = response_field("example_redaction", optional=True)
+    json_path = response_field("json_path", optional=True)
+    xml_path = response_field("xml_path", optional=True)
+
+    @classmethod
+    def from_api_result(cls, result: Dict) -> "Replacement":
+        """Builds a Replacement from an entity in a redaction API response, in
+        a single pass over its fields."""
+        replacement = cls.__new__(cls)
+        dict.__init__(
+            replacement,
+            start=result["start"],
+            end=result["end"],
+            new_start=result.get("newStart"),
+            new_end=result.get("newEnd"),
+            label=result["label"],
+            text=result["text"],
+            score=result["score"],
+            language=result.get("language"),
+        )
+        for api_name, name in _OPTIONAL_API_FIELDS:
+            value = result.get(api_name)
+            if value is not None:
+                dict.__setitem__(replacement, name, value)
+        return replacement
 
     def describe(self) -> str:
         return json.dumps(self.to_dict(), indent=2)
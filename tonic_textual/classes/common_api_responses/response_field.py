@@ -0,0 +1,27 @@
+from operator import itemgetter
+
+
+def response_field(key: str, optional: bool = False) -> property:
+    """Returns a property that reads and writes a key of a dict-based response
+    object, so that each value is stored only once.
+
+    When optional is True, a missing key reads as None, and assigning None
+    removes the key.
+    """
+    if not optional:
+
+        def set_value(self, value):
+            self[key] = value
+
+        return property(itemgetter(key), set_value)
+
+    def get_optional(self):
+        return self.get(key)
+
+    def set_optional(self, value):
+        if value is None:
+            self.pop(key, None)
+        else:
+            self[key] = value
+
+    return property(get_optional, set_optional)
@@ -1,6 +1,8 @@
 import json
 from typing import Optional, Dict
 
+from tonic_textual.classes.common_api_responses.response_field import response_field
+
 
 class SingleDetectionResult(dict):
     """A span of text that has been detected as a named entity.
@@ -22,6 +24,8 @@ class SingleDetectionResult(dict):
         present if the input text was a JSON document.
     """
 
+    __slots__ = ()
+
     def __init__(
         self,
         start: int,
@@ -31,26 +35,17 @@ class SingleDetectionResult(dict):
         score: float,
         json_path: Optional[str] = None,
     ):
-        self.start = start
-        self.end = end
-        self.label = label
-        self.text = text
-        self.score = score
-        self.jsonPath = json_path
-        if json_path is None:
-            dict.__init__(
-                self, start=start, end=end, label=label, text=text, score=score
-            )
-        else:
-            dict.__init__(
-                self,
-                start=start,
-                end=end,
-                label=label,
-                text=text,
-                score=score,
-                json_path=json_path,
-            )
+        dict.__init__(self, start=start, end=end, label=label, text=text, score=score)
+        if json_path is not None:
+            self["json_path"] = json_path
+
+    start = response_field("start")
+    end = response_field("end")
+    label = response_field("label")
+    text = response_field("text")
+    score = response_field("score")
+    json_path = response_field("json_path", optional=True)
+    jsonPath = json_path
 
     def describe(self) -> str:
         return json.dumps(self.to_dict(), indent=2)
@@ -0,0 +1,223 @@
+import threading
+import time
+from typing import Callable, Dict, Optional, TypeVar
+
+import requests
+
+from tonic_textual.classes.tonic_exception import (
+    ParseFileTimeoutException,
+    TextualServerError,
+)
+
+R = TypeVar("R")
+
+
+class ConcurrencyGovernor:
+    """Adapts the number of requests that batch methods send at the same time.
+
+    The governor uses additive increase, multiplicative decrease (AIMD). After
+    each round of successful requests whose latency stays close to the lowest
+    latency seen, the limit grows by increase. When the average latency
+    exceeds latency_tolerance times that baseline, or when the server responds
+    with 429 or 5xx or the connection fails, the limit is multiplied by
+    decrease. Requests that were already running when the limit was cut do
+    not cut it again.
+
+    One governor can be shared by several batch calls and threads, so that
+    together they stay within one limit.
+
+    Parameters
+    ----------
+    initial_limit : int
+        The number of requests allowed in flight at the start. The default is
+        4.
+    min_limit : int
+        The lowest limit. The default is 1.
+    max_limit : int
+        The highest limit. This is also the number of threads used by each
+        batch call. The default is 32.
+    increase : float
+        The amount by which the limit grows after each round of successful
+        requests. The default is 1.
+    decrease : float
+        The factor by which the limit is multiplied when the server is
+        overloaded. The default is 0.5.
+    latency_tolerance : float
+        How many times slower than the baseline a request can be before it
+        counts as a latency spike. The default is 2.
+    smoothing : float
+        The weight of each new latency sample in the moving average of the
+        latency. The default is 0.2.
+
+    Examples
+    --------
+    >>> governor = ConcurrencyGovernor(max_limit=64)
+    >>> textual = TextualNer(concurrency_governor=governor)
+    >>> textual.redact_bulk(strings, max_batch_size=500)
+    >>> governor.stats()
+    {'limit': 12.0, 'in_flight': 0, 'latency': 0.41, 'baseline_latency': 0.35, ...}
+    """
+
+    def __init__(
+        self,
+        initial_limit: int = 4,
+        min_limit: int = 1,
+        max_limit: int = 32,
+        increase: float = 1.0,
+        decrease: float = 0.5,
+        latency_tolerance: float = 2.0,
+        smoothing: float = 0.2,
+    ):
+        if min_limit < 1:
+            raise ValueError("min_limit must be at least 1")
+        if not min_limit <= initial_limit <= max_limit:
+            raise ValueError("initial_limit must be between min_limit and max_limit")
+        if increase <= 0:
+            raise ValueError("increase must be greater than 0")
+        if not 0 < decrease < 1:
+            raise ValueError("decrease must be greater than 0 and less than 1")
+        if latency_tolerance <= 1:
+            raise ValueError("latency_tolerance must be greater than 1")
+        if not 0 < smoothing <= 1:
+            raise ValueError("smoothing must be greater than 0 and at most 1")
+
+        self.min_limit = min_limit
+        self.max_limit = max_limit
+        self.increase = increase
+        self.decrease = decrease
+        self.latency_tolerance = latency_tolerance
+        self.smoothing = smoothing
+
+        self._condition = threading.Condition()
+        self._limit = float(initial_limit)
+        self._in_flight = 0
+        self._latency: Optional[float] = None
+        self._baseline: Optional[float] = None
+        self._last_decrease = float("-inf")
+        self._successes = 0
+        self._failures = 0
+        self._decreases = 0
+
+    @property
+    def limit(self) -> int:
+        """The number of requests currently allowed in flight."""
+        return int(self._limit)
+
+    @property
+    def in_flight(self) -> int:
+        """The number of requests in flight."""
+        return self._in_flight
+
+    @property
+    def latency(self) -> Optional[float]:
+        """The moving average of the request latency, in seconds."""
+        return self._latency
+
+    @property
+    def baseline_latency(self) -> Optional[float]:
+        """The latency, in seconds, against which spikes are measured."""
+        return self._baseline
+
+    def stats(self) -> Dict:
+        """Returns a snapshot of the limit, the latency, and the request
+        counts, for logging or graphing."""
+        with self._condition:
+            return {
+                "limit": self._limit,
+                "in_flight": self._in_flight,
+                "latency": self._latency,
+                "baseline_latency": self._baseline,
+                "successes": self._successes,
+                "failures": self._failures,
+                "decreases": self._decreases,
+            }
+
+    def call(self, func: Callable[..., R], *args, **kwargs) -> R:
+        """Waits until a request is allowed, calls func, and adjusts the limit
+        based on how long func took and whether it failed."""
+        start = self.acquire()
+        try:
+            result = func(*args, **kwargs)
+        except BaseException as e:
+            self.release(start, e)
+            raise
+        self.release(start)
+        return result
+
+    def acquire(self) -> float:
+        """Waits until a request is allowed. Returns the start time to pass to
+        release when the request is finished."""
+        with self._condition:
+            while self._in_flight >= int(self._limit):
+                self._condition.wait()
+            self._in_flight += 1
+        return time.monotonic()
+
+    def release(
+        self,
+        start: float,
+        error: Optional[BaseException] = None,
+        measure_latency: bool = True,
+    ):
+        """Records a finished request, and adjusts the limit based on how long
+        it took and whether it failed with error. Pass measure_latency=False
+        for work whose duration does not reflect the load on the server, such
+        as a whole file redaction job. Only its errors then cut the limit."""
+        if error is not None:
+            self._finish(start, None, overloaded=is_overload_error(error), succeeded=False)
+        elif measure_latency:
+            self._finish(start, time.monotonic() - start, overloaded=False, succeeded=True)
+        else:
+            self._finish(start, None, overloaded=False, succeeded=True)
+
+    def _finish(
+        self, start: float, latency: Optional[float], overloaded: bool, succeeded: bool
+    ):
+        with self._condition:
+            self._in_flight -= 1
+            if not succeeded:
+                self._failures += 1
+            else:
+                self._successes += 1
+            if latency is not None:
+                self._latency = (
+                    latency
+                    if self._latency is None
+                    else self.smoothing * latency + (1 - self.smoothing) * self._latency
+                )
+                # The baseline follows the lowest latency, and drifts up slowly
+                # so that a lasting change in latency becomes the new normal.
+                self._baseline = (
+                    self._latency
+                    if self._baseline is None
+                    else min(self._latency, self._baseline * 1.01)
+                )
+                overloaded = self._latency > self.latency_tolerance * self._baseline
+
+            if overloaded:
+                # Requests that started before the last cut saw the old load.
+                if start > self._last_decrease:
+                    self._limit = max(self.min_limit, self._limit * self.decrease)
+                    self._last_decrease = time.monotonic()
+                    self._decreases += 1
+            elif succeeded:
+                # Grows by increase once the whole limit has succeeded.
+                self._limit = min(self.max_limit, self._limit + self.increase / self._limit)
+            self._condition.notify_all()
+
+
+def is_overload_error(error: BaseException) -> bool:
+    """Returns whether an error shows that the server is overloaded: a 429 or
+    5xx response, a timeout, or a failed connection."""
+    if isinstance(error, requests.exceptions.HTTPError) and error.response is not None:
+        status = error.response.status_code
+        return status == 429 or status >= 500
+    return isinstance(
+        error,
+        (
+            requests.exceptions.ConnectionError,
+            requests.exceptions.Timeout,
+            TextualServerError,
+            ParseFileTimeoutException,
+        ),
+    )
@@ -29,6 +29,7 @@ from tonic_textual.classes.tonic_exception import (
     BadArgumentsException,
 )
 from tonic_textual.classes.httpclient import HttpClient
+from tonic_textual.classes.multipart_encoder import SizedReader
 from tonic_textual.classes.datasetfile import DatasetFile
 from tonic_textual.enums.pii_state import PiiState
 from tonic_textual.generator_utils import convert_generator_metadata_to_payload, validate_generator_default_and_config, \
@@ -165,11 +166,10 @@ class Dataset:
     @property
     def pii_info(self):
         if self._pii_info is None:
-            with requests.Session() as session:
-                data = self.client.http_get(
-                    f"/api/dataset/{self.id}/pii_info", session=session
-                )
-                self._pii_info = DatasetPiiInfo(data, self.files)
+            data = self.client.http_get(
+                f"/api/dataset/{self.id}/pii_info"
+            )
+            self._pii_info = DatasetPiiInfo(data, self.files)
         return self._pii_info
 
     def edit(
@@ -378,7 +378,9 @@ class Dataset:
             unit_scale=True,
             unit_divisor=1024,
         ) as t:
-            reader_wrapper = CallbackIOWrapper(t.update, f, "read")
+            reader_wrapper = SizedReader(
+                CallbackIOWrapper(t.update, f, "read"), file_size, file_name
+            )
 
             files = {
                 "document": (
@@ -510,27 +512,24 @@ class Dataset:
             The dataset data.
         """
         response = []
-        with requests.Session() as session:
-            for file in self.files:
-                try:
-                    if file.num_columns == 0:
-                        more_data = self.client.http_get_file(
-                            f"/api/dataset/{self.id}/files/{file.id}/get_data",
-                            session=session,
-                        ).decode("utf-8")
-                        response += [[more_data]]
-                    else:
-                        more_data = self.client.http_get(
-                            f"/api/dataset/{self.id}/files/{file.id}/get_data",
-                            session=session,
-                        )
-                        response += more_data
-                except requests.exceptions.HTTPError as e:
-                    if e.response.status_code == 409:
-                        continue
-                    else:
-                        raise e
-            return response
+        for file in self.files:
+            try:
+                if file.num_columns == 0:
+                    more_data = self.client.http_get_file(
+                        f"/api/dataset/{self.id}/files/{file.id}/get_data",
+                    ).decode("utf-8")
+                    response += [[more_data]]
+                else:
+                    more_data = self.client.http_get(
+                        f"/api/dataset/{self.id}/files/{file.id}/get_data",
+                    )
+                    response += more_data
+            except requests.exceptions.HTTPError as e:
+                if e.response.status_code == 409:
+                    continue
+                else:
+                    raise e
+        return response
 
     def get_processed_files(self, refetch: Optional[bool] = True) -> List[DatasetFile]:
         """
@@ -633,12 +632,10 @@ class Dataset:
             Entity mappings grouped by file. Files with no applicable entities are
             returned with an empty entity list.
         """
-        with requests.Session() as session:
-            response = self.client.http_get(
-                f"/api/dataset/{self.id}/entity_mappings",
-                session=session,
-            )
-            return DatasetEntityMappingsResponse.from_dict(response)
+        response = self.client.http_get(
+            f"/api/dataset/{self.id}/entity_mappings",
+        )
+        return DatasetEntityMappingsResponse.from_dict(response)
 
     def describe(self) -> str:
         """
@@ -669,24 +666,22 @@ class Dataset:
         """
         Updates dataset with latest state from server
         """
-        with requests.Session() as session:
-            updated_dataset = self.client.http_get(
-                f"/api/dataset/{self.id}",
-                session=session
-            )
-            self.__initialize(
-                self.client,
-                updated_dataset["id"],
-                updated_dataset["name"],
-                updated_dataset["files"],
-                updated_dataset["customPiiEntityIds"],
-                convert_payload_to_generator_config(updated_dataset["generatorSetup"]),
-                convert_payload_to_generator_metadata(updated_dataset["generatorMetadata"]),
-                updated_dataset["labelBlockLists"],
-                updated_dataset["labelAllowLists"],
-                updated_dataset["docXImagePolicy"],
-                updated_dataset["docXCommentPolicy"],
-                updated_dataset["docXTablePolicy"],
-                updated_dataset["pdfSignaturePolicy"],
-                updated_dataset["pdfSynthModePolicy"]
-            )
+        updated_dataset = self.client.http_get(
+            f"/api/dataset/{self.id}"
+        )
+        self.__initialize(
+            self.client,
+            updated_dataset["id"],
+            updated_dataset["name"],
+            updated_dataset["files"],
+            updated_dataset["customPiiEntityIds"],
+            convert_payload_to_generator_config(updated_dataset["generatorSetup"]),
+            convert_payload_to_generator_metadata(updated_dataset["generatorMetadata"]),
+            updated_dataset["labelBlockLists"],
+            updated_dataset["labelAllowLists"],
+            updated_dataset["docXImagePolicy"],
+            updated_dataset["docXCommentPolicy"],
+            updated_dataset["docXTablePolicy"],
+            updated_dataset["pdfSignaturePolicy"],
+            updated_dataset["pdfSynthModePolicy"]
+        )
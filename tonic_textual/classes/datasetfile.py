@@ -1,8 +1,13 @@
-import requests
-from time import sleep
-from typing import Optional, Dict, List, Union
+import os
+from typing import BinaryIO, Optional, Dict, List, Union
 
 from tonic_textual.classes.common_api_responses.label_custom_list import LabelCustomList
+from tonic_textual.classes.job_poller import (
+    NOT_READY,
+    JobPoller,
+    file_not_ready_error,
+    retries_to_timeout,
+)
 from tonic_textual.classes.common_api_responses.pii_occurences.ner_redaction_api_model import NerRedactionApiModel
 from tonic_textual.classes.common_api_responses.pii_occurences.ner_redaction_page_api_model import NerRedactionPageApiModel
 from tonic_textual.classes.common_api_responses.pii_occurences.paginated_pii_occurrence_response import PaginatedPiiOccurrenceResponse
@@ -123,7 +128,9 @@ class DatasetFile:
         random_seed: Optional[int] = None,
         num_retries: int = 6,
         wait_between_retries: int = 10,
-    ) -> bytes:
+        destination: Optional[Union[str, os.PathLike, BinaryIO]] = None,
+        checksum: Optional[str] = None,
+    ) -> Union[bytes, int]:
         """
         Download a redacted file
 
@@ -135,42 +142,66 @@ class DatasetFile:
             different random seeds.
 
         num_retries: int = 6
-            An optional value to specify the number of times to attempt to download the
-            file. If a file is not yet ready for download, there is a 10-second
-            pause before retrying. (The default value is 6)
+            Together with wait_between_retries, sets how long to wait for the
+            file. If the file is not ready, Textual checks again, with waits
+            that grow up to wait_between_retries, for up to
+            (num_retries - 1) * wait_between_retries seconds. (The default
+            value is 6)
 
         wait_between_retries: int = 10
-            The number of seconds to wait between retry attempts.
+            The longest wait, in seconds, between two checks.
+
+        destination: Optional[Union[str, os.PathLike, BinaryIO]] = None
+            A file path or a writable binary file object. When provided, the
+            file is streamed to destination in chunks instead of being held in
+            memory. A file path is written to destination.part and renamed when
+            the download is complete. An interrupted download resumes from
+            where it stopped, as long as the file on the server has the same
+            ETag and length.
+
+        checksum: Optional[str] = None
+            The expected checksum of the file, either as "algorithm:hex" or as
+            a hex SHA-256 digest. Only used with destination.
 
         Returns
         -------
-        bytes
-            The redacted file as a byte array.
+        Union[bytes, int]
+            The redacted file as a byte array or, when destination is provided,
+            the size of the file in bytes.
         """
-        retries = 1
-        while retries <= num_retries:
-            try:
-                if random_seed is not None:
-                    additional_headers = {"textual-random-seed": str(random_seed)}
-                else:
-                    additional_headers = {}
-                with requests.Session() as session:
-                    return self.client.http_get_file(
-                        f"/api/dataset/{self.dataset_id}/files/{self.id}/download",
-                        additional_headers=additional_headers,
-                        session=session,
-                    )
+        if random_seed is not None:
+            additional_headers = {"textual-random-seed": str(random_seed)}
+        else:
+            additional_headers = {}
+
+        url = f"/api/dataset/{self.dataset_id}/files/{self.id}/download"
 
+        def poll():
+            try:
+                return self.client.http_get_download_response(
+                    url, additional_headers=additional_headers
+                )
             except FileNotReadyForDownload:
-                retries = retries + 1
-                if retries <= num_retries:
-                    sleep(wait_between_retries)
-
-        retryWord = "retry" if num_retries == 1 else "retries"
-        raise FileNotReadyForDownload(
-            f"After {num_retries} {retryWord}, the file is not yet ready to download. "
-            "This is likely due to a high service load. Try again later."
+                return NOT_READY
+
+        # The poller only checks whether the file is ready. The file is
+        # transferred on this thread so that it does not hold a poller worker.
+        response = JobPoller.default().wait(
+            poll,
+            timeout_seconds=retries_to_timeout(num_retries, wait_between_retries),
+            max_interval=wait_between_retries,
+            on_timeout=lambda: file_not_ready_error(num_retries),
         )
+        if destination is not None:
+            return self.client.http_get_file_to(
+                url,
+                destination,
+                additional_headers=additional_headers,
+                checksum=checksum,
+                response=response,
+            )
+        with response:
+            return response.content
 
 
     def get_entities(self, pii_types: Optional[List[Union[PiiType, str]]] = None) -> Dict[PiiType, List[NerRedactionApiModel]]:        
@@ -188,40 +219,39 @@ class DatasetFile:
         pagination = {'fileOffset': offset, 'fileLimit': self._pii_occurence_file_limit, 'datasetFileId': self.id}
         
         occurences: List[NerRedactionApiModel] = []
-        with requests.Session() as session:
-            while True:
-                response = self.client.http_get(f"/api/dataset/{self.dataset_id}/pii_occurrences/{pii_type}", session=session, params=pagination)
-
-                records: List[PiiOccurrenceResponse] = []
-                for record in response["records"]:
-                    id = record["id"]
-                    file_name = record["fileName"]
-
-                    pages: List[NerRedactionPageApiModel] = []
-                    for page in record["pages"]:
-                        page_number = page["pageNumber"]
-                        continuation_token = page["continuationToken"]
-
-                        entities: List[NerRedactionApiModel] = []
-                        for entity in page["entities"]:
-                            entities.append(NerRedactionApiModel(entity["entity"], entity["head"], entity["tail"]))
+        while True:
+            response = self.client.http_get(f"/api/dataset/{self.dataset_id}/pii_occurrences/{pii_type}", params=pagination)
+
+            records: List[PiiOccurrenceResponse] = []
+            for record in response["records"]:
+                id = record["id"]
+                file_name = record["fileName"]
+
+                pages: List[NerRedactionPageApiModel] = []
+                for page in record["pages"]:
+                    page_number = page["pageNumber"]
+                    continuation_token = page["continuationToken"]
+
+                    entities: List[NerRedactionApiModel] = []
+                    for entity in page["entities"]:
+                        entities.append(NerRedactionApiModel(entity["entity"], entity["head"], entity["tail"]))
                         
-                        pages.append(NerRedactionPageApiModel(page_number, entities, continuation_token))
-                    records.append(PiiOccurrenceResponse(id, file_name, pages))
+                    pages.append(NerRedactionPageApiModel(page_number, entities, continuation_token))
+                records.append(PiiOccurrenceResponse(id, file_name, pages))
                 
-                paginated_response = PaginatedPiiOccurrenceResponse(response["offset"], response["limit"], response["pageNumber"], response["totalPages"], response["totalRecords"], response["hasNextPage"], records)                
+            paginated_response = PaginatedPiiOccurrenceResponse(response["offset"], response["limit"], response["pageNumber"], response["totalPages"], response["totalRecords"], response["hasNextPage"], records)                
 
-                for record in paginated_response.records:
-                    for page in record.pages:
-                        occurences = occurences + page.entities
+            for record in paginated_response.records:
+                for page in record.pages:
+                    occurences = occurences + page.entities
                 
-                if len(pages)>0:
-                    last_page = pages[-1]
-                    if last_page.continuation_token is not None:
-                        pagination["fileOffset"] = last_page.continuation_token
-                    else:
-                        break
+            if len(pages)>0:
+                last_page = pages[-1]
+                if last_page.continuation_token is not None:
+                    pagination["fileOffset"] = last_page.continuation_token
                 else:
-                    break                
+                    break
+            else:
+                break                
 
         return occurences
\ No newline at end of file
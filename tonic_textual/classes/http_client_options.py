@@ -0,0 +1,101 @@
+from typing import Optional
+
+from tonic_textual.classes.json_codec import get_json_codec
+from tonic_textual.classes.rate_limiter import RateLimiter
+from tonic_textual.classes.request_compression import check_request_encoding
+from tonic_textual.classes.retry_policy import RetryPolicy
+
+_DEFAULT_RETRY_POLICY = RetryPolicy()
+
+
+class HttpClientOptions:
+    """
+    Class to configure the connection handling of the HTTP client used by the
+    Textual wrappers.
+
+    Parameters
+    ----------
+    pool_connections : int
+        The number of distinct hosts for which connection pools are cached.
+        The default is 10.
+
+    pool_maxsize : int
+        The maximum number of connections kept alive per host. Set this to at
+        least the number of threads that call Textual concurrently. The default
+        is 10.
+
+    pool_block : bool
+        Whether to block when all pooled connections to a host are in use.
+        When False, extra connections are opened and discarded after use. The
+        default is False.
+
+    keep_alive : bool
+        Whether to reuse connections across requests. When False, every request
+        asks the server to close the connection. The default is True.
+
+    request_compression : Optional[str]
+        The Content-Encoding used to compress large JSON request bodies, such
+        as bulk redaction requests. Must be "gzip", "zstd", or None. zstd
+        requires the zstandard package. Your Textual deployment must accept
+        compressed requests. The default is None, which sends uncompressed
+        bodies.
+
+    compression_threshold : int
+        The size, in bytes, above which request bodies are compressed. Smaller
+        bodies are sent uncompressed. The default is 16384.
+
+    accept_encoding : Optional[str]
+        The Accept-Encoding header sent with every request. Compressed
+        responses are decompressed as they are read. The default lists every
+        encoding that can be decoded: gzip and deflate, and br and zstd when
+        brotli and zstandard are installed.
+
+    json_codec : Optional[str]
+        The library used to encode request bodies and decode responses. Must be
+        "orjson", "msgspec", "json", or None. The default is None, which uses
+        orjson or msgspec when one of them is installed, and otherwise the
+        json module from the standard library.
+
+    rate_limiter : Optional[RateLimiter]
+        Limits the rate of requests per endpoint class, and retries requests
+        that the server rejects with 429 or 503 after the time in their
+        Retry-After header. One limiter can be shared by several clients. The
+        default is None, which sends requests as soon as they are made.
+
+    retry_policy : Optional[RetryPolicy]
+        Retries idempotent requests, such as redaction requests, GET requests,
+        and downloads, after connection resets, timeouts, and 502 or 504
+        responses. The default retries each of them up to 3 times in total.
+        None disables retries.
+    """
+
+    def __init__(
+        self,
+        pool_connections: int = 10,
+        pool_maxsize: int = 10,
+        pool_block: bool = False,
+        keep_alive: bool = True,
+        request_compression: Optional[str] = None,
+        compression_threshold: int = 16 * 1024,
+        accept_encoding: Optional[str] = None,
+        json_codec: Optional[str] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+        retry_policy: Optional[RetryPolicy] = _DEFAULT_RETRY_POLICY,
+    ):
+        if pool_connections < 1 or pool_maxsize < 1:
+            raise ValueError("pool_connections and pool_maxsize must be at least 1")
+        if compression_threshold < 0:
+            raise ValueError("compression_threshold must be at least 0")
+        check_request_encoding(request_compression)
+        get_json_codec(json_codec)
+
+        self.pool_connections = pool_connections
+        self.pool_maxsize = pool_maxsize
+        self.pool_block = pool_block
+        self.keep_alive = keep_alive
+        self.request_compression = request_compression
+        self.compression_threshold = compression_threshold
+        self.accept_encoding = accept_encoding
+        self.json_codec = json_codec
+        self.rate_limiter = rate_limiter
+        self.retry_policy = retry_policy
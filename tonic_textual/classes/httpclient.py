@@ -1,10 +1,27 @@
-from typing import Optional, Dict, Union, List
+from typing import BinaryIO, Callable, Iterator, Optional, Dict, Union, List
+import contextlib
+import functools
+import hashlib
+import io
 import requests
 import os
 import json
+import re
+import threading
+import time
+import uuid
+from requests.adapters import HTTPAdapter
 from urllib3.exceptions import InsecureRequestWarning
 
+from tonic_textual.classes.http_client_options import HttpClientOptions
+from tonic_textual.classes.json_codec import get_json_codec
+from tonic_textual.classes.multipart_encoder import MultipartEncoder
+from tonic_textual.classes.redaction_config import RedactPayload
+from tonic_textual.classes.request_compression import compress, default_accept_encoding
+from tonic_textual.classes.retry_policy import RetryPolicy
+
 from tonic_textual.classes.tonic_exception import (
+    DownloadChecksumMismatch,
     ErrorWhenDownloadFile,
     FileNotReadyForDownload,
     LicenseInvalid,
@@ -19,6 +36,176 @@ requests.packages.urllib3.disable_warnings(  # type: ignore
 )
 
 
+class _IncompleteDownload(requests.exceptions.RequestException):
+    pass
+
+
+def _parse_checksum(checksum: Optional[str]):
+    if checksum is None:
+        return "sha256", None
+    algorithm, _, digest = checksum.rpartition(":")
+    algorithm = algorithm.lower() or "sha256"
+    if algorithm not in hashlib.algorithms_available:
+        raise ValueError(f"Unsupported checksum algorithm: {algorithm}")
+    return algorithm, digest.lower()
+
+
+_CONTENT_RANGE = re.compile(r"bytes (\d+)-\d+/(\d+|\*)")
+
+
+def _download_validator(res: requests.Response) -> Optional[Dict]:
+    """Returns what identifies the file that res sends: its strong ETag and
+    its length. Returns None when the response has neither, in which case a
+    partial copy of the file cannot be resumed safely."""
+    etag = res.headers.get("ETag")
+    if etag is not None and etag.startswith("W/"):
+        etag = None
+    length = res.headers.get("Content-Length")
+    total = None
+    if length is not None and "Content-Encoding" not in res.headers:
+        total = int(length)
+    if etag is None and total is None:
+        return None
+    return {"etag": etag, "total": total}
+
+
+def _resumes(res: requests.Response, written: int, validator: Dict) -> bool:
+    """Returns whether res continues, at byte written, the file that
+    validator identifies."""
+    if res.status_code != 206:
+        return False
+    match = _CONTENT_RANGE.fullmatch(res.headers.get("Content-Range", ""))
+    if match is None or int(match.group(1)) != written:
+        return False
+    if validator["total"] is not None and match.group(2) != str(validator["total"]):
+        return False
+    etag = res.headers.get("ETag")
+    return validator["etag"] is None or etag is None or etag == validator["etag"]
+
+
+def _read_validator(meta_path: str) -> Optional[Dict]:
+    try:
+        with open(meta_path) as f:
+            validator = json.load(f)
+        return {"etag": validator.get("etag"), "total": validator.get("total")}
+    except (OSError, ValueError, AttributeError):
+        return None
+
+
+def _write_validator(meta_path: str, validator: Optional[Dict]):
+    if validator is None:
+        _remove(meta_path)
+        return
+    with open(meta_path, "w") as f:
+        json.dump(validator, f)
+
+
+def _remove(path: str):
+    try:
+        os.remove(path)
+    except FileNotFoundError:
+        pass
+
+
+def _lock_part_file(part_path: str) -> Optional[BinaryIO]:
+    """Opens part_path and takes an exclusive lock on it, so that only one
+    download at a time writes to it. Returns None when the lock is held by
+    another download, or when file locks are not supported."""
+    try:
+        import fcntl
+    except ImportError:
+        return None
+    f = os.fdopen(os.open(part_path, os.O_RDWR | os.O_CREAT, 0o666), "r+b")
+    try:
+        fcntl.flock(f.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+        # A download that finished between the open and the lock has renamed
+        # the file that was opened.
+        if os.fstat(f.fileno()).st_ino != os.stat(part_path).st_ino:
+            raise BlockingIOError
+    except OSError:
+        f.close()
+        return None
+    return f
+
+
+def _rewind(body) -> bool:
+    """Prepares a request body to be sent again. Returns False when the body
+    is a stream that cannot be rewound."""
+    rewind = getattr(body, "rewind", None)
+    if rewind is None:
+        return not hasattr(body, "read")
+    try:
+        rewind()
+        return True
+    except io.UnsupportedOperation:
+        return False
+
+
+def _retry_delay(
+    policy: RetryPolicy, failures: int, deadline: Optional[float]
+) -> Optional[float]:
+    """Returns how long to wait before the next attempt, or None when the
+    attempts or the deadline are used up."""
+    if failures >= policy.max_attempts:
+        return None
+    delay = policy.backoff(failures)
+    if deadline is not None and time.monotonic() + delay >= deadline:
+        return None
+    return delay
+
+
+def _attach_attempts(func):
+    """Sets the attempts attribute of errors raised by an HttpClient method to
+    the number of attempts of its last request."""
+
+    @functools.wraps(func)
+    def wrapper(self, *args, **kwargs):
+        self._local.attempts = 0
+        try:
+            return func(self, *args, **kwargs)
+        except Exception as e:
+            if not hasattr(e, "attempts"):
+                e.attempts = getattr(self._local, "attempts", 0)
+            raise
+
+    return wrapper
+
+
+def _checked_response(
+    res: requests.Response, raise_for_status: Callable[[requests.Response], None]
+) -> requests.Response:
+    try:
+        raise_for_status(res)
+    except BaseException:
+        res.close()
+        raise
+    return res
+
+
+def _reuse_response(
+    response: Optional[requests.Response],
+    send: Callable[[Dict], requests.Response],
+) -> Callable[[Dict], requests.Response]:
+    """Returns a send function that answers its first request with response,
+    unless that request needs extra headers, such as a Range."""
+    pending = [] if response is None else [response]
+
+    def reuse(headers: Dict) -> requests.Response:
+        if pending:
+            res = pending.pop()
+            if not headers:
+                return res
+            res.close()
+        return send(headers)
+
+    return reuse
+
+
+def _seekable(f) -> bool:
+    seekable = getattr(f, "seekable", None)
+    return bool(seekable and seekable())
+
+
 class HttpClient:
     """Client used to handle requests to the Tonic Textual instance.
 
@@ -30,20 +217,201 @@ class HttpClient:
         The API token to use for the requests.
     verify : bool
         Whether to verify SSL certification.
+    options : Optional[HttpClientOptions]
+        Connection pooling and keep-alive settings. Every request made by this
+        client, from any thread, shares one pool of connections. The pool is
+        recreated in forked child processes so that workers never share
+        sockets with their parent.
     """
 
-    def __init__(self, base_url: str, api_key: str, verify: bool):
+    def __init__(
+        self,
+        base_url: str,
+        api_key: str,
+        verify: bool,
+        options: Optional[HttpClientOptions] = None,
+    ):
         self.base_url = base_url
+        self.options = options if options is not None else HttpClientOptions()
         self.headers = {
             "Authorization": api_key,
             "User-Agent": "tonic-textual-python-sdk",
         }
+        if not self.options.keep_alive:
+            self.headers["Connection"] = "close"
+        self.headers["Accept-Encoding"] = (
+            self.options.accept_encoding or default_accept_encoding()
+        )
         self.verify = verify
+        self.codec = get_json_codec(self.options.json_codec)
+
+        self._lock = threading.Lock()
+        self._deadlines = threading.local()
+        self._reset_pool()
+
+    def _reset_pool(self):
+        # requests.Session is not thread-safe, but its connection pool is. Each
+        # thread gets its own lightweight Session, and all of them are mounted
+        # on one shared adapter so that connections are reused across threads.
+        self._pid = os.getpid()
+        self._local = threading.local()
+        self._adapter = HTTPAdapter(
+            pool_connections=self.options.pool_connections,
+            pool_maxsize=self.options.pool_maxsize,
+            pool_block=self.options.pool_block,
+        )
 
+    @property
+    def session(self) -> requests.Session:
+        """The pooled session for the calling thread."""
+        if self._pid != os.getpid():
+            with self._lock:
+                if self._pid != os.getpid():
+                    # Forked child: drop the inherited pool without closing its
+                    # sockets, which still belong to the parent process.
+                    self._reset_pool()
+
+        session = getattr(self._local, "session", None)
+        if session is None:
+            session = requests.Session()
+            session.mount("http://", self._adapter)
+            session.mount("https://", self._adapter)
+            self._local.session = session
+        return session
+
+    @contextlib.contextmanager
+    def call_deadline(self, deadline: Optional[float]):
+        """Ends the requests that the calling thread sends inside the block,
+        including their retries, by deadline, a time.monotonic() value. Each
+        request's timeout is capped at the time that is left, so a request to
+        a server that stops responding raises requests.exceptions.Timeout once
+        the deadline has passed. The timeout applies to each connect and read,
+        so a server that keeps sending data slowly can still run past it."""
+        previous = getattr(self._deadlines, "deadline", None)
+        if previous is not None and deadline is not None:
+            deadline = min(previous, deadline)
+        self._deadlines.deadline = deadline if deadline is not None else previous
+        try:
+            yield
+        finally:
+            self._deadlines.deadline = previous
+
+    def close(self):
+        """Closes all pooled connections. The client can still be used afterwards,
+        in which case new connections are opened."""
+        with self._lock:
+            adapter = self._adapter
+            self._reset_pool()
+        adapter.close()
+
+    def _request_body(self, data, additional_headers: Dict, files=None) -> Dict:
+        """Returns the requests arguments for the headers and the request body.
+        JSON bodies are encoded with the client's codec, and redaction payloads
+        reuse their serialized configuration. Files are sent as a streamed
+        multipart body, with any data as form fields."""
+        headers = {**self.headers, **additional_headers}
+        if files:
+            fields = [(k, (None, str(v))) for k, v in (data or {}).items()]
+            fields += list(files.items()) if isinstance(files, dict) else list(files)
+            body = MultipartEncoder(fields)
+            headers["Content-Type"] = body.content_type
+            return {"data": body, "headers": headers}
+        if data is None:
+            return {"headers": headers}
+        if isinstance(data, RedactPayload):
+            body = data.to_json_bytes(self.codec)
+        else:
+            body = self.codec.dumps(data)
+
+        encoding = self.options.request_compression
+        headers["Content-Type"] = "application/json"
+        if encoding is not None and len(body) >= self.options.compression_threshold:
+            body = compress(body, encoding)
+            headers["Content-Encoding"] = encoding
+        return {"data": body, "headers": headers}
+
+    def _send(
+        self,
+        method: str,
+        url: str,
+        session: Optional[requests.Session] = None,
+        **kwargs,
+    ) -> requests.Response:
+        """Sends a request to self.base_url + url.
+
+        When the client has a rate limiter, waits for the limiter first, and
+        transparently retries requests that the server rejects with 429 or
+        503. Requests that the retry policy allows are retried after transient
+        connection errors and the policy's retry statuses. Inside
+        call_deadline, the requests and their retries end by the deadline.
+        Errors raised here
+        have an attempts attribute, and the number of attempts of the last
+        request is kept for _attach_attempts."""
+        session = session or self.session
+        limiter = self.options.rate_limiter
+        policy = self.options.retry_policy
+        if policy is not None and not policy.allows(method, url):
+            policy = None
+        endpoint_class = limiter.endpoint_class(method, url) if limiter else None
+        deadline = getattr(self._deadlines, "deadline", None)
+        if policy is not None and policy.deadline is not None:
+            policy_deadline = time.monotonic() + policy.deadline
+            deadline = policy_deadline if deadline is None else min(deadline, policy_deadline)
+        timeout = kwargs.get("timeout")
+
+        attempts = 0
+        failures = 0
+        limited = 0
+        while True:
+            if limiter is not None:
+                limiter.acquire(endpoint_class)
+            if deadline is not None and not isinstance(timeout, tuple):
+                remaining = max(0.001, deadline - time.monotonic())
+                kwargs["timeout"] = remaining if timeout is None else min(timeout, remaining)
+            attempts += 1
+            self._local.attempts = attempts
+            try:
+                res = session.request(
+                    method, self.base_url + url, verify=self.verify, **kwargs
+                )
+            except Exception as e:
+                failures += 1
+                delay = None
+                if policy is not None and policy.should_retry_error(e):
+                    delay = _retry_delay(policy, failures, deadline)
+                if delay is None or not _rewind(kwargs.get("data")):
+                    e.attempts = attempts
+                    raise
+                time.sleep(delay)
+                continue
+
+            if limiter is not None:
+                delay = limiter.retry_delay(res, limited)
+                if delay is not None and deadline is not None:
+                    if time.monotonic() + delay >= deadline:
+                        delay = None
+                if delay is not None and _rewind(kwargs.get("data")):
+                    res.close()
+                    limiter.pause(endpoint_class, delay)
+                    limited += 1
+                    continue
+                if res.status_code in limiter.RETRY_STATUSES:
+                    return res
+
+            if policy is not None and policy.should_retry_response(res):
+                failures += 1
+                delay = _retry_delay(policy, failures, deadline)
+                if delay is not None and _rewind(kwargs.get("data")):
+                    res.close()
+                    time.sleep(delay)
+                    continue
+            return res
+
+    @_attach_attempts
     def http_get_file(
         self,
         url: str,
-        session: requests.Session,
+        session: Optional[requests.Session] = None,
         params: dict = {},
         additional_headers={},
     ) -> bytes:
@@ -53,17 +421,100 @@ class HttpClient:
         ----------
         url : str
             URL to make the get request. The URL is appended to self.base_url.
+        session: Optional[requests.Session]
+            Deprecated. The client's pooled session is used when not provided.
         params: dict
             Passed as the params parameter of the requests.get request.
 
         """
-        res = session.get(
-            self.base_url + url,
+        res = self._send(
+            "GET",
+            url,
+            session=session,
+            params=params,
+            headers={**self.headers, **additional_headers},
+        )
+        self._raise_for_get_file_status(res)
+        return res.content
+
+    @_attach_attempts
+    def http_get_file_to(
+        self,
+        url: str,
+        destination: Union[str, os.PathLike, BinaryIO],
+        params: dict = {},
+        additional_headers={},
+        checksum: Optional[str] = None,
+        chunk_size: int = 1024 * 1024,
+        max_resumes: int = 3,
+        response: Optional[requests.Response] = None,
+    ) -> int:
+        """Makes a get request to get a file, and streams the file to
+        destination. See _stream_download for the handling of destination,
+        checksum, and max_resumes. When response is an open response from
+        http_get_download_response, the file is read from it instead of being
+        requested again.
+
+        Returns
+        -------
+        int
+            The size of the file.
+        """
+        return self._stream_download(
+            _reuse_response(
+                response,
+                lambda headers: self._send(
+                    "GET",
+                    url,
+                    params=params,
+                    headers={**self.headers, **additional_headers, **headers},
+                    stream=True,
+                ),
+            ),
+            self._raise_for_get_file_status,
+            destination,
+            checksum,
+            chunk_size,
+            max_resumes,
+        )
+
+    def http_get_file_chunks(
+        self,
+        url: str,
+        params: dict = {},
+        additional_headers={},
+        chunk_size: int = 1024 * 1024,
+    ) -> Iterator[bytes]:
+        """Makes a get request to get a file, and yields the file in chunks."""
+        with self._send(
+            "GET",
+            url,
+            params=params,
+            headers={**self.headers, **additional_headers},
+            stream=True,
+        ) as res:
+            self._raise_for_get_file_status(res)
+            yield from res.iter_content(chunk_size)
+
+    @_attach_attempts
+    def http_get_download_response(
+        self, url: str, params: dict = {}, additional_headers={}
+    ) -> requests.Response:
+        """Makes a get request to get a file, and returns the open response
+        without reading the file. Raises FileNotReadyForDownload when the file
+        is not ready, so that a poller can wait for the file without
+        transferring it."""
+        res = self._send(
+            "GET",
+            url,
             params=params,
             headers={**self.headers, **additional_headers},
-            verify=self.verify,
+            stream=True,
         )
+        return _checked_response(res, self._raise_for_get_file_status)
 
+    @staticmethod
+    def _raise_for_get_file_status(res: requests.Response):
         try:
             res.raise_for_status()
         except requests.exceptions.HTTPError as err:
@@ -81,8 +532,7 @@ class HttpClient:
                 raise TextualServerError(error_data)
             raise err
 
-        return res.content
-
+    @_attach_attempts
     def http_post_download_file(
         self, url: str, params: dict = {}, data={}, additional_headers={}, files={}
     ) -> bytes:
@@ -100,14 +550,99 @@ class HttpClient:
             Additional HTTP request headers.
         """
 
-        res = requests.post(
-            self.base_url + url,
+        res = self._send(
+            "POST",
+            url,
             params=params,
-            json=data,
-            headers={**self.headers, **additional_headers},
-            verify=self.verify,
-            files=files
+            **self._request_body(data, additional_headers, files),
+        )
+        self._raise_for_post_download_status(res)
+        return res.content
+
+    @_attach_attempts
+    def http_post_download_file_to(
+        self,
+        url: str,
+        destination: Union[str, os.PathLike, BinaryIO],
+        params: dict = {},
+        data={},
+        additional_headers={},
+        checksum: Optional[str] = None,
+        chunk_size: int = 1024 * 1024,
+        max_resumes: int = 3,
+        response: Optional[requests.Response] = None,
+    ) -> int:
+        """Makes a POST request to download a file, and streams the file to
+        destination. See _stream_download for the handling of destination,
+        checksum, and max_resumes. When response is an open response from
+        http_post_download_response, the file is read from it instead of being
+        requested again.
+
+        Returns
+        -------
+        int
+            The size of the file.
+        """
+
+        def send(headers: Dict) -> requests.Response:
+            body = self._request_body(data, additional_headers)
+            body["headers"].update(headers)
+            return self._send(
+                "POST",
+                url,
+                params=params,
+                stream=True,
+                **body,
+            )
+
+        return self._stream_download(
+            _reuse_response(response, send),
+            self._raise_for_post_download_status,
+            destination,
+            checksum,
+            chunk_size,
+            max_resumes,
+        )
+
+    def http_post_download_file_chunks(
+        self,
+        url: str,
+        params: dict = {},
+        data={},
+        additional_headers={},
+        chunk_size: int = 1024 * 1024,
+    ) -> Iterator[bytes]:
+        """Makes a POST request to download a file, and yields the file in
+        chunks."""
+        with self._send(
+            "POST",
+            url,
+            params=params,
+            stream=True,
+            **self._request_body(data, additional_headers),
+        ) as res:
+            self._raise_for_post_download_status(res)
+            yield from res.iter_content(chunk_size)
+
+    @_attach_attempts
+    def http_post_download_response(
+        self, url: str, params: dict = {}, data={}, additional_headers={}
+    ) -> requests.Response:
+        """Makes a POST request to download a file, and returns the open
+        response without reading the file. Raises FileNotReadyForDownload when
+        the file is not ready, so that a poller can wait for the file without
+        transferring it."""
+        res = self._send(
+            "POST",
+            url,
+            params=params,
+            stream=True,
+            **self._request_body(data, additional_headers),
         )
+        return _checked_response(res, self._raise_for_post_download_status)
+
+    @staticmethod
+    def _raise_for_post_download_status(res: requests.Response):
         try:
             res.raise_for_status()
         except requests.exceptions.HTTPError as err:
@@ -120,21 +655,205 @@ class HttpClient:
             else:
                 raise err
 
-        return res.content
+    def _stream_download(
+        self,
+        send: Callable[[Dict], requests.Response],
+        raise_for_status: Callable[[requests.Response], None],
+        destination: Union[str, os.PathLike, BinaryIO],
+        checksum: Optional[str],
+        chunk_size: int,
+        max_resumes: int,
+    ) -> int:
+        """Streams a download to destination in chunks.
+
+        When destination is a path, the file is written to destination.part
+        and renamed when it is complete. The ETag and length of the file are
+        kept in destination.part.json, and a .part file left by an earlier
+        interrupted call is resumed with a Range request only when they match
+        the file on the server. Otherwise, the download starts over. The .part
+        file is locked while it is written. If another download holds it, or
+        the platform does not support file locks, the file is written to a
+        uniquely named .part file instead, which is deleted if the download
+        fails. When destination is a writable binary file object, the file is
+        written at its current position.
+
+        If the connection drops during the download, the download resumes
+        from the last byte received, up to max_resumes times. A server that
+        does not support Range requests, or whose file has changed, sends the
+        whole file again, which then replaces what was written.
+
+        checksum is an optional expected digest, either as "algorithm:hex" or
+        as a hex SHA-256 digest. A file that does not match it raises
+        DownloadChecksumMismatch, and its .part file is deleted.
+        """
+        algorithm, expected = _parse_checksum(checksum)
+        if not isinstance(destination, (str, os.PathLike)):
+            start = destination.tell() if _seekable(destination) else None
+            return self._stream_to_file(
+                send, raise_for_status, destination, start, 0, algorithm,
+                expected, chunk_size, max_resumes,
+            )
 
-    def http_get(self, url: str, session: requests.Session, params: dict = {}):
+        path = os.fspath(destination)
+        part_path = path + ".part"
+        meta_path = part_path + ".json"
+        f = _lock_part_file(part_path)
+        if f is None:
+            # Another download holds the .part file, so this one writes to a
+            # file of its own, which is not resumed by later calls.
+            part_path = f"{path}.{uuid.uuid4().hex}.part"
+            meta_path = None
+            f = open(part_path, "x+b")
+        locked = meta_path is not None
+        try:
+            with f:
+                try:
+                    existing = f.seek(0, os.SEEK_END)
+                    validator = _read_validator(meta_path) if locked and existing else None
+                    size = self._stream_to_file(
+                        send, raise_for_status, f, 0, existing, algorithm,
+                        expected, chunk_size, max_resumes, validator,
+                        functools.partial(_write_validator, meta_path) if locked else None,
+                    )
+                    if locked:
+                        # Renamed while locked, so that no other download
+                        # opens the finished file as its .part file.
+                        os.replace(part_path, path)
+                        _remove(meta_path)
+                except BaseException as e:
+                    if locked and (
+                        isinstance(e, DownloadChecksumMismatch)
+                        or os.path.getsize(part_path) == 0
+                    ):
+                        _remove(part_path)
+                        _remove(meta_path)
+                    raise
+            if not locked:
+                os.replace(part_path, path)
+        except BaseException:
+            if not locked:
+                _remove(part_path)
+            raise
+        return size
+
+    def _stream_to_file(
+        self,
+        send: Callable[[Dict], requests.Response],
+        raise_for_status: Callable[[requests.Response], None],
+        f: BinaryIO,
+        start: Optional[int],
+        written: int,
+        algorithm: str,
+        expected: Optional[str],
+        chunk_size: int,
+        max_resumes: int,
+        validator: Optional[Dict] = None,
+        save_validator: Optional[Callable[[Optional[Dict]], None]] = None,
+    ) -> int:
+        hasher = hashlib.new(algorithm)
+        if written and expected is not None:
+            f.seek(start)
+            for chunk in iter(lambda: f.read(chunk_size), b""):
+                hasher.update(chunk)
+
+        resumes = 0
+        while True:
+            res = None
+            try:
+                if written and validator is None:
+                    # Nothing identifies the file that the written bytes came
+                    # from, so they cannot be resumed safely.
+                    written, hasher = self._restart_download(f, start, algorithm)
+                res = send(self._range_headers(written, validator) if written else {})
+                if written and res.status_code == 416:
+                    # The partial file no longer matches the file on the
+                    # server, so the download starts over.
+                    res.close()
+                    written, hasher = self._restart_download(f, start, algorithm)
+                    res = send({})
+                raise_for_status(res)
+                if written and not _resumes(res, written, validator):
+                    written, hasher = self._restart_download(f, start, algorithm)
+                    if res.status_code == 206:
+                        # The range is from a different file.
+                        res.close()
+                        res = send({})
+                        raise_for_status(res)
+                if not written:
+                    validator = _download_validator(res)
+                    if save_validator is not None:
+                        save_validator(validator)
+
+                length = res.headers.get("Content-Length")
+                total = None
+                if length is not None and "Content-Encoding" not in res.headers:
+                    total = written + int(length)
+                for chunk in res.iter_content(chunk_size):
+                    f.write(chunk)
+                    hasher.update(chunk)
+                    written += len(chunk)
+                if total is not None and written < total:
+                    raise _IncompleteDownload(f"Received {written} of {total} bytes")
+                break
+            except (
+                requests.exceptions.ConnectionError,
+                requests.exceptions.ChunkedEncodingError,
+                _IncompleteDownload,
+            ):
+                resumes += 1
+                if resumes > max_resumes:
+                    raise
+            finally:
+                if res is not None:
+                    res.close()
+
+        if expected is not None and hasher.hexdigest() != expected:
+            raise DownloadChecksumMismatch(
+                f"The downloaded file has {algorithm} checksum {hasher.hexdigest()}, but {expected} was expected"
+            )
+        return written
+
+    @staticmethod
+    def _range_headers(written: int, validator: Dict) -> Dict:
+        # Ranges count decoded bytes, so resumed requests ask for the file
+        # uncompressed. If-Range makes the server send the whole file when
+        # the file has changed.
+        headers = {"Range": f"bytes={written}-", "Accept-Encoding": "identity"}
+        if validator["etag"] is not None:
+            headers["If-Range"] = validator["etag"]
+        return headers
+
+    @staticmethod
+    def _restart_download(f: BinaryIO, start: Optional[int], algorithm: str):
+        if start is None:
+            raise io.UnsupportedOperation(
+                "The download cannot be resumed, and the destination cannot be rewound"
+            )
+        f.seek(start)
+        f.truncate()
+        return 0, hashlib.new(algorithm)
+
+    @_attach_attempts
+    def http_get(
+        self,
+        url: str,
+        session: Optional[requests.Session] = None,
+        params: dict = {},
+    ):
         """Makes a get request.
 
         Parameters
         ----------
         url : str
             URL to make the get request. The URL is appended to self.base_url.
+        session: Optional[requests.Session]
+            Deprecated. The client's pooled session is used when not provided.
         params: dict
             Passed as the params parameter of the requests.get request.
 
         """
-        res = session.get(
-            self.base_url + url, params=params, headers=self.headers, verify=self.verify
+        res = self._send(
+            "GET", url, session=session, params=params, headers=self.headers
         )
 
         try:
@@ -145,8 +864,9 @@ class HttpClient:
                 raise TextualServerError(error_data)
             raise err
 
-        return res.json()
+        return self.codec.loads(res.content)
 
+    @_attach_attempts
     def http_post(
         self,
         url,
@@ -182,14 +902,12 @@ class HttpClient:
                 pass
 
         try:
-            res = requests.post(
-                self.base_url + url,
+            res = self._send(
+                "POST",
+                url,
                 params=params,
-                json=data,
-                headers={**self.headers, **additional_headers},
-                verify=self.verify,
-                files=files,
                 timeout=timeout_seconds,
+                **self._request_body(data, additional_headers, files),
             )
         except requests.exceptions.Timeout:
             raise ParseFileTimeoutException()
@@ -221,12 +939,13 @@ class HttpClient:
                 raise err
         if res.content:
             try:
-                return res.json()
+                return self.codec.loads(res.content)
             except:  # noqa: E722
                 return res.text
         else:
             return None
 
+    @_attach_attempts
     def http_put(self, url, params={}, data={}, files={}):
         """Makes a put request.
 
@@ -239,12 +958,11 @@ class HttpClient:
         data: dict
             Passed as the data parameter of the requests.put request.
         """
-        res = requests.put(
-            self.base_url + url,
+        res = self._send(
+            "PUT",
+            url,
             params=params,
-            json=data,
-            headers=self.headers,
-            verify=self.verify,
+            **self._request_body(data, {}),
         )
         try:
             res.raise_for_status()
@@ -256,12 +974,11 @@ class HttpClient:
                 raise TextualServerError(error_data)
             raise err
 
-        return res.json()
+        return self.codec.loads(res.content)
 
+    @_attach_attempts
     def http_patch(self, url, data={}):
-        res = requests.patch(
-            self.base_url + url, json=data, headers=self.headers, verify=self.verify
-        )
+        res = self._send("PATCH", url, **self._request_body(data, {}))
 
         try:
             res.raise_for_status()
@@ -272,14 +989,13 @@ class HttpClient:
             raise err
 
         if res.content:
-            return res.json()
+            return self.codec.loads(res.content)
         else:
             return None
 
+    @_attach_attempts
     def http_delete(self, url, params={}):
-        res = requests.delete(
-            self.base_url + url, params=params, headers=self.headers, verify=self.verify
-        )
+        res = self._send("DELETE", url, params=params, headers=self.headers)
 
         try:
             res.raise_for_status()
@@ -290,6 +1006,6 @@ class HttpClient:
             raise err
 
         if res.content:
-            return res.json()
+            return self.codec.loads(res.content)
         else:
             return None
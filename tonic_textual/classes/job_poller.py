@@ -0,0 +1,315 @@
+import heapq
+import itertools
+import random
+import threading
+import time
+from concurrent.futures import Executor, Future, ThreadPoolExecutor
+from typing import Callable, List, Optional, Tuple
+
+from tonic_textual.classes.tonic_exception import FileNotReadyForDownload
+
+
+class _NotReady:
+    def __repr__(self):
+        return "NOT_READY"
+
+
+NOT_READY = _NotReady()
+"""Returned by a poll function when the job is not finished yet."""
+
+
+class _Job:
+    def __init__(
+        self,
+        poll: Callable,
+        future: Future,
+        interval: float,
+        max_interval: float,
+        deadline: Optional[float],
+        on_timeout: Callable[[], Exception],
+    ):
+        self.poll = poll
+        self.future = future
+        self.interval = interval
+        self.max_interval = max_interval
+        self.deadline = deadline
+        self.on_timeout = on_timeout
+
+
+class JobPoller:
+    """Polls many server jobs from a single scheduler thread.
+
+    Each job is a poll function that returns NOT_READY until the job is
+    finished, and then returns the result of the job. The poll functions run
+    on a small pool of worker threads, so a waiting job does not hold a thread.
+    After each poll that returns NOT_READY, the wait before the next poll grows
+    exponentially up to max_interval, with random jitter so that jobs that
+    start together do not poll together.
+
+    Poll functions should only check whether a job is finished. Slow work that
+    follows, such as downloading a large result, should run on the caller's
+    thread or with run_when_ready, so that it does not hold the poller's
+    workers and delay the polls of other jobs.
+
+    Parameters
+    ----------
+    initial_interval : float
+        The wait, in seconds, before the second poll of a job. The default is
+        0.5.
+    max_interval : float
+        The longest wait, in seconds, between two polls of a job. The default
+        is 10.
+    multiplier : float
+        The factor by which the wait grows after each poll. The default is 2.
+    jitter : float
+        The largest fraction by which a wait is randomly shortened. The default
+        is 0.5.
+    max_workers : int
+        The number of poll functions that can run at the same time. The default
+        is 8.
+
+    Examples
+    --------
+    >>> poller = JobPoller()
+    >>> future = poller.submit(lambda: check_job(job_id), timeout_seconds=60)
+    >>> future.add_done_callback(lambda f: print(f.result()))
+    """
+
+    _default: Optional["JobPoller"] = None
+    _default_lock = threading.Lock()
+
+    def __init__(
+        self,
+        initial_interval: float = 0.5,
+        max_interval: float = 10.0,
+        multiplier: float = 2.0,
+        jitter: float = 0.5,
+        max_workers: int = 8,
+    ):
+        if initial_interval <= 0:
+            raise ValueError("initial_interval must be greater than 0")
+        if max_interval < initial_interval:
+            raise ValueError("max_interval must be at least initial_interval")
+        if multiplier < 1:
+            raise ValueError("multiplier must be at least 1")
+        if not 0 <= jitter < 1:
+            raise ValueError("jitter must be at least 0 and less than 1")
+        if max_workers < 1:
+            raise ValueError("max_workers must be at least 1")
+
+        self.initial_interval = initial_interval
+        self.max_interval = max_interval
+        self.multiplier = multiplier
+        self.jitter = jitter
+        self.max_workers = max_workers
+        self._condition = threading.Condition()
+        self._queue: List[Tuple[float, int, _Job]] = []
+        self._counter = itertools.count()
+        self._thread: Optional[threading.Thread] = None
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._shutdown = False
+
+    @classmethod
+    def default(cls) -> "JobPoller":
+        """Returns the poller that is shared by all clients."""
+        with cls._default_lock:
+            if cls._default is None:
+                cls._default = cls()
+            return cls._default
+
+    def submit(
+        self,
+        poll: Callable,
+        timeout_seconds: Optional[float] = None,
+        max_interval: Optional[float] = None,
+        on_timeout: Optional[Callable[[], Exception]] = None,
+    ) -> Future:
+        """Starts polling a job. The first poll runs immediately.
+
+        Parameters
+        ----------
+        poll: Callable
+            Returns NOT_READY while the job is running, and the result of the
+            job when it is finished. An exception raised by poll fails the job.
+
+        timeout_seconds: Optional[float] = None
+            When set, the job fails if it is not finished this many seconds
+            after it is submitted. The job is always polled once at the
+            timeout.
+
+        max_interval: Optional[float] = None
+            The longest wait between two polls of this job. The default is the
+            max_interval of the poller.
+
+        on_timeout: Optional[Callable[[], Exception]] = None
+            Returns the exception for a job that times out. The default is a
+            TimeoutError.
+
+        Returns
+        -------
+        Future
+            Resolves to the result of the job. Cancel the future to stop
+            polling.
+        """
+        future = Future()
+        now = time.monotonic()
+        max_interval = self.max_interval if max_interval is None else max_interval
+        job = _Job(
+            poll,
+            future,
+            min(self.initial_interval, max_interval),
+            max_interval,
+            None if timeout_seconds is None else now + timeout_seconds,
+            on_timeout
+            or (lambda: TimeoutError(f"The job did not finish within {timeout_seconds} seconds")),
+        )
+        with self._condition:
+            if self._shutdown:
+                raise RuntimeError("The poller has been shut down")
+            if self._thread is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self.max_workers, thread_name_prefix="textual-poll"
+                )
+                self._thread = threading.Thread(
+                    target=self._run, name="textual-job-poller", daemon=True
+                )
+                self._thread.start()
+            self._schedule(job, now)
+        return future
+
+    def wait(
+        self,
+        poll: Callable,
+        timeout_seconds: Optional[float] = None,
+        max_interval: Optional[float] = None,
+        on_timeout: Optional[Callable[[], Exception]] = None,
+    ):
+        """Polls a job and blocks until it is finished. Returns the result of
+        the job, or raises the exception that failed it."""
+        return self.submit(poll, timeout_seconds, max_interval, on_timeout).result()
+
+    def shutdown(self):
+        """Stops polling. Jobs that are not finished are cancelled."""
+        with self._condition:
+            self._shutdown = True
+            queue, self._queue = self._queue, []
+            self._condition.notify()
+        for _, _, job in queue:
+            job.future.cancel()
+        if self._executor is not None:
+            self._executor.shutdown(wait=False)
+
+    def _schedule(self, job: _Job, due: float):
+        heapq.heappush(self._queue, (due, next(self._counter), job))
+        self._condition.notify()
+
+    def _run(self):
+        while True:
+            with self._condition:
+                while not self._shutdown and (
+                    not self._queue or self._queue[0][0] > time.monotonic()
+                ):
+                    timeout = self._queue[0][0] - time.monotonic() if self._queue else None
+                    self._condition.wait(timeout)
+                if self._shutdown:
+                    return
+                _, _, job = heapq.heappop(self._queue)
+            try:
+                self._executor.submit(self._poll, job)
+            except RuntimeError:
+                job.future.cancel()
+                return
+
+    def _poll(self, job: _Job):
+        if job.future.cancelled():
+            return
+        try:
+            result = job.poll()
+        except BaseException as e:
+            self._settle(job.future.set_exception, job, e)
+            return
+        if result is not NOT_READY:
+            self._settle(job.future.set_result, job, result)
+            return
+
+        now = time.monotonic()
+        if job.deadline is not None and now >= job.deadline:
+            self._settle(job.future.set_exception, job, job.on_timeout())
+            return
+
+        due = now + job.interval * (1 - self.jitter * random.random())
+        if job.deadline is not None:
+            due = min(due, job.deadline)
+        job.interval = min(job.interval * self.multiplier, job.max_interval)
+        with self._condition:
+            if not self._shutdown:
+                self._schedule(job, due)
+                return
+        job.future.cancel()
+
+    @staticmethod
+    def _settle(setter: Callable, job: _Job, value):
+        if job.future.set_running_or_notify_cancel():
+            setter(value)
+
+
+def run_when_ready(
+    ready: Future,
+    func: Callable,
+    executor: Optional[Executor] = None,
+    discard: Optional[Callable] = None,
+) -> Future:
+    """Returns a future for func(result), where result is the result of
+    ready. func runs on executor, or on a thread of its own when executor is
+    None. When the returned future is cancelled, polling stops, and if ready
+    already has a result, discard is called with it instead of func."""
+    future = Future()
+
+    def run(value):
+        if not future.set_running_or_notify_cancel():
+            if discard is not None:
+                discard(value)
+            return
+        try:
+            future.set_result(func(value))
+        except BaseException as e:
+            future.set_exception(e)
+
+    def on_ready(f: Future):
+        if f.cancelled():
+            future.cancel()
+            return
+        error = f.exception()
+        if error is not None:
+            if future.set_running_or_notify_cancel():
+                future.set_exception(error)
+            return
+        value = f.result()
+        try:
+            if executor is None:
+                threading.Thread(target=run, args=(value,), name="textual-transfer").start()
+            else:
+                executor.submit(run, value)
+        except RuntimeError as e:
+            if future.set_running_or_notify_cancel():
+                future.set_exception(e)
+            if discard is not None:
+                discard(value)
+
+    future.add_done_callback(lambda f: ready.cancel() if f.cancelled() else None)
+    ready.add_done_callback(on_ready)
+    return future
+
+
+def retries_to_timeout(num_retries: int, wait_between_retries: float) -> float:
+    """Returns the time that num_retries attempts with a fixed wait of
+    wait_between_retries between them used to take."""
+    return max(0, num_retries - 1) * wait_between_retries
+
+
+def file_not_ready_error(num_retries: int) -> FileNotReadyForDownload:
+    retryWord = "retry" if num_retries == 1 else "retries"
+    return FileNotReadyForDownload(
+        f"After {num_retries} {retryWord}, the file is not yet ready to download. "
+        "This is likely due to a high service load. Try again later."
+    )
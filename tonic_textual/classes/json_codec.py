@@ -0,0 +1,90 @@
+import json
+from typing import Any, Optional, Union
+
+
+class JsonCodec:
+    """Encodes request bodies and decodes responses.
+
+    The base class uses the json module from the standard library. The orjson
+    and msgspec codecs are several times faster on large bulk redaction and
+    parse results, and are used automatically when those packages are
+    installed.
+    """
+
+    name = "json"
+
+    def dumps(self, obj: Any) -> bytes:
+        """Returns obj as compact UTF-8 encoded JSON."""
+        return json.dumps(obj, separators=(",", ":"), allow_nan=False).encode("utf-8")
+
+    def loads(self, data: Union[bytes, str]) -> Any:
+        """Returns the value of a JSON document. Raises ValueError if the
+        document is not valid JSON."""
+        return json.loads(data)
+
+
+class _OrjsonCodec(JsonCodec):
+    name = "orjson"
+
+    def __init__(self):
+        import orjson
+
+        self._orjson = orjson
+        self._options = orjson.OPT_NON_STR_KEYS
+
+    def dumps(self, obj: Any) -> bytes:
+        try:
+            return self._orjson.dumps(obj, option=self._options)
+        except TypeError:
+            # Types that orjson does not know are left to the standard library.
+            return super().dumps(obj)
+
+    def loads(self, data: Union[bytes, str]) -> Any:
+        return self._orjson.loads(data)
+
+
+class _MsgspecCodec(JsonCodec):
+    name = "msgspec"
+
+    def __init__(self):
+        import msgspec
+
+        self._msgspec = msgspec
+        self._encoder = msgspec.json.Encoder()
+        self._decoder = msgspec.json.Decoder()
+
+    def dumps(self, obj: Any) -> bytes:
+        try:
+            return self._encoder.encode(obj)
+        except TypeError:
+            return super().dumps(obj)
+
+    def loads(self, data: Union[bytes, str]) -> Any:
+        try:
+            return self._decoder.decode(data)
+        except self._msgspec.DecodeError as e:
+            raise ValueError(str(e)) from e
+
+
+_CODECS = {"orjson": _OrjsonCodec, "msgspec": _MsgspecCodec, "json": JsonCodec}
+
+
+def get_json_codec(name: Optional[str] = None) -> JsonCodec:
+    """Returns the JSON codec with the given name: "orjson", "msgspec", or
+    "json". When name is None, returns the fastest codec that is installed."""
+    if name is not None:
+        if name not in _CODECS:
+            raise ValueError(f"json_codec must be one of {', '.join(_CODECS)}, or None")
+        try:
+            return _CODECS[name]()
+        except ImportError as e:
+            raise ImportError(
+                f"{name} is required to use the {name} JSON codec. Before you use this option, you must install {name}."
+            ) from e
+
+    for codec in (_OrjsonCodec, _MsgspecCodec):
+        try:
+            return codec()
+        except ImportError:
+            pass
+    return JsonCodec()
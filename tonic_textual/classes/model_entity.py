@@ -2,12 +2,12 @@
 
 from dataclasses import dataclass
 from enum import Enum
-from time import sleep
 from typing import Dict, List, Optional
 import io
 import json
 import os
-import requests
+
+from tonic_textual.classes.job_poller import NOT_READY, JobPoller
 
 
 class ModelEntityStatus(str, Enum):
@@ -136,11 +136,9 @@ class TrainedModel:
 
     def get_status(self) -> TrainedModelStatus:
         """Refresh and return current training status."""
-        with requests.Session() as session:
-            data = self._client.http_get(
-                f"/api/model-based-entities/{self._entity_id}/training/models/{self.id}",
-                session=session,
-            )
+        data = self._client.http_get(
+            f"/api/model-based-entities/{self._entity_id}/training/models/{self.id}",
+        )
         self.status = TrainedModelStatus(data["status"])
         self.f1_score = data.get("benchmarkScore")
         self.is_active = data.get("isActive", False)
@@ -165,19 +163,22 @@ class TrainedModel:
             TimeoutError: If not complete within timeout
             TrainingFailedError: If training fails
         """
-        elapsed = 0
-        while elapsed < timeout_seconds:
+        def poll():
             status = self.get_status()
             if status == TrainedModelStatus.READY:
                 return self
             if status == TrainedModelStatus.FAILED:
                 raise TrainingFailedError(f"Training failed for model {self.id}")
-            sleep(poll_interval)
-            elapsed += poll_interval
-
-        raise TimeoutError(
-            f"Training did not complete within {timeout_seconds} seconds. "
-            f"Current status: {self.status}"
+            return NOT_READY
+
+        return JobPoller.default().wait(
+            poll,
+            timeout_seconds=timeout_seconds,
+            max_interval=poll_interval,
+            on_timeout=lambda: TimeoutError(
+                f"Training did not complete within {timeout_seconds} seconds. "
+                f"Current status: {self.status}"
+            ),
         )
 
 
@@ -204,11 +205,9 @@ class ModelEntityVersion:
 
     def get_suggested_guidelines(self) -> Optional[str]:
         """Get LLM-suggested guidelines improvements (if ready)."""
-        with requests.Session() as session:
-            data = self._client.http_get(
-                f"/api/model-based-entities/{self._entity_id}/versions/{self.id}/suggested-guidelines",
-                session=session,
-            )
+        data = self._client.http_get(
+            f"/api/model-based-entities/{self._entity_id}/versions/{self.id}/suggested-guidelines",
+        )
         if data and data.get("status") == "Ready":
             return data.get("guidelines")
         return None
@@ -221,11 +220,9 @@ class ModelEntityVersion:
 
     def _refresh(self) -> None:
         """Refresh version data from server."""
-        with requests.Session() as session:
-            data = self._client.http_get(
-                f"/api/model-based-entities/{self._entity_id}/versions/{self.id}",
-                session=session,
-            )
+        data = self._client.http_get(
+            f"/api/model-based-entities/{self._entity_id}/versions/{self.id}",
+        )
         self.status = VersionStatus(data["status"])
         self._data = data
 
@@ -247,8 +244,7 @@ class ModelEntityVersion:
         Raises:
             TimeoutError: If not complete within timeout
         """
-        elapsed = 0
-        while elapsed < timeout_seconds:
+        def poll():
             self._refresh()
             if self.status == VersionStatus.READY:
                 return self
@@ -256,12 +252,16 @@ class ModelEntityVersion:
                 raise AnnotationTimeoutError(
                     f"Version {self.id} failed. Check error details."
                 )
-            sleep(poll_interval)
-            elapsed += poll_interval
-
-        raise TimeoutError(
-            f"Version did not complete within {timeout_seconds} seconds. "
-            f"Current status: {self.status}"
+            return NOT_READY
+
+        return JobPoller.default().wait(
+            poll,
+            timeout_seconds=timeout_seconds,
+            max_interval=poll_interval,
+            on_timeout=lambda: TimeoutError(
+                f"Version did not complete within {timeout_seconds} seconds. "
+                f"Current status: {self.status}"
+            ),
         )
 
 
@@ -298,11 +298,9 @@ class ModelEntity:
 
     def _refresh(self) -> None:
         """Refresh entity data from server."""
-        with requests.Session() as session:
-            data = self._client.http_get(
-                f"/api/model-based-entities/{self.id}",
-                session=session,
-            )
+        data = self._client.http_get(
+            f"/api/model-based-entities/{self.id}",
+        )
         self.status = ModelEntityStatus(data["status"])
         self._data = data
 
@@ -327,11 +325,9 @@ class ModelEntity:
 
     def get_version(self, version_id: str) -> ModelEntityVersion:
         """Get a specific version by ID."""
-        with requests.Session() as session:
-            data = self._client.http_get(
-                f"/api/model-based-entities/{self.id}/versions/{version_id}",
-                session=session,
-            )
+        data = self._client.http_get(
+            f"/api/model-based-entities/{self.id}/versions/{version_id}",
+        )
         return ModelEntityVersion(self._client, self.id, data)
 
     def get_latest_version(self) -> ModelEntityVersion:
@@ -343,11 +339,9 @@ class ModelEntity:
 
     def list_versions(self) -> List[ModelEntityVersion]:
         """List all versions."""
-        with requests.Session() as session:
-            data = self._client.http_get(
-                f"/api/model-based-entities/{self.id}/versions",
-                session=session,
-            )
+        data = self._client.http_get(
+            f"/api/model-based-entities/{self.id}/versions",
+        )
         # API returns {"versions": {1: "id1", 2: "id2", ...}}
         version_map = data.get("versions", {})
         versions = []
@@ -414,29 +408,25 @@ class ModelEntity:
     def _wait_for_files_ready(self, file_ids: List[str], timeout_seconds: int = 120) -> None:
         """Wait for files to be ready for review."""
         ready_statuses = {"ReadyForReview", "ReviewInProgress", "Reviewed"}
-        elapsed = 0
-        poll_interval = 2
-
-        while elapsed < timeout_seconds:
-            with requests.Session() as session:
-                files = self._client.http_get(
-                    f"/api/model-based-entities/{self.id}/test/files",
-                    session=session,
-                )
 
-            all_ready = True
+        def poll():
+            files = self._client.http_get(
+                f"/api/model-based-entities/{self.id}/test/files",
+            )
+
             for f in files:
                 if f["id"] in file_ids and f["status"] not in ready_statuses:
-                    all_ready = False
-                    break
-
-            if all_ready:
-                return
-
-            sleep(poll_interval)
-            elapsed += poll_interval
-
-        raise TimeoutError(f"Files not ready within {timeout_seconds} seconds")
+                    return NOT_READY
+            return None
+
+        JobPoller.default().wait(
+            poll,
+            timeout_seconds=timeout_seconds,
+            max_interval=2,
+            on_timeout=lambda: TimeoutError(
+                f"Files not ready within {timeout_seconds} seconds"
+            ),
+        )
 
     def upload_test_data_jsonl(self, file_path: str) -> List[str]:
         """
@@ -534,11 +524,9 @@ class ModelEntity:
             - status: Processing status (QueuedForAnalysis, ReadyForReview, Reviewed, etc.)
             - filePath: Path to the file
         """
-        with requests.Session() as session:
-            return self._client.http_get(
-                f"/api/model-based-entities/{self.id}/test/files",
-                session=session,
-            )
+        return self._client.http_get(
+            f"/api/model-based-entities/{self.id}/test/files",
+        )
 
     def list_training_files(self) -> List[Dict]:
         """
@@ -551,11 +539,9 @@ class ModelEntity:
             - status: Processing status
             - filePath: Path to the file
         """
-        with requests.Session() as session:
-            data = self._client.http_get(
-                f"/api/model-based-entities/{self.id}/training/files",
-                session=session,
-            )
+        data = self._client.http_get(
+            f"/api/model-based-entities/{self.id}/training/files",
+        )
         # Training files endpoint returns paginated response
         return data.get("records", [])
 
@@ -621,20 +607,16 @@ class ModelEntity:
 
     def get_trained_model(self, model_id: str) -> TrainedModel:
         """Get a trained model by ID."""
-        with requests.Session() as session:
-            data = self._client.http_get(
-                f"/api/model-based-entities/{self.id}/training/models/{model_id}",
-                session=session,
-            )
+        data = self._client.http_get(
+            f"/api/model-based-entities/{self.id}/training/models/{model_id}",
+        )
         return TrainedModel(self._client, self.id, data)
 
     def list_trained_models(self) -> List[TrainedModel]:
         """List all trained models for this entity."""
-        with requests.Session() as session:
-            data = self._client.http_get(
-                f"/api/model-based-entities/{self.id}/training/models",
-                session=session,
-            )
+        data = self._client.http_get(
+            f"/api/model-based-entities/{self.id}/training/models",
+        )
         return [TrainedModel(self._client, self.id, m) for m in data]
 
     def get_active_model(self) -> Optional[TrainedModel]:
@@ -0,0 +1,232 @@
+import binascii
+import io
+import mmap
+import os
+import stat
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+
+class SizedReader:
+    """Wraps a readable stream whose length is known but which cannot seek,
+    such as the body of an Amazon S3 object, so that it can be uploaded
+    without first reading it into memory.
+
+    Parameters
+    ----------
+    stream : Any
+        An object with a read(size) method.
+    length : int
+        The number of bytes that the stream will return.
+    name : Optional[str]
+        The file name to send with the stream.
+    """
+
+    def __init__(self, stream: Any, length: int, name: Optional[str] = None):
+        self.stream = stream
+        self.length = length
+        if name is not None:
+            self.name = name
+
+    def read(self, size: int = -1) -> bytes:
+        return self.stream.read(size)
+
+
+class _BytesPart:
+    def __init__(self, data: bytes):
+        self.data = memoryview(data)
+        self.length = len(data)
+        self.position = 0
+
+    def read(self, size: int) -> bytes:
+        chunk = self.data[self.position : self.position + size]
+        self.position += len(chunk)
+        return chunk.tobytes()
+
+    def rewind(self):
+        self.position = 0
+
+    def close(self):
+        pass
+
+
+class _MmapPart:
+    """Reads a regular file from its current position through a read-only
+    memory map, so that the file's pages are shared with the page cache
+    instead of being copied into the process."""
+
+    def __init__(self, f, size: int):
+        self.file = f
+        self.start = f.tell()
+        self.length = max(0, size - self.start)
+        self.position = self.start
+        self.map: Optional[mmap.mmap] = None
+
+    def read(self, size: int) -> bytes:
+        if self.map is None:
+            self.map = mmap.mmap(self.file.fileno(), 0, access=mmap.ACCESS_READ)
+        chunk = self.map[self.position : min(self.position + size, self.start + self.length)]
+        self.position += len(chunk)
+        return chunk
+
+    def rewind(self):
+        self.position = self.start
+
+    def close(self):
+        if self.map is not None:
+            self.map.close()
+            self.map = None
+
+
+class _StreamPart:
+    def __init__(self, stream, length: Optional[int]):
+        self.stream = stream
+        self.length = length
+        self.start = _tell(stream)
+
+    def read(self, size: int) -> bytes:
+        chunk = self.stream.read(size)
+        if isinstance(chunk, str):
+            chunk = chunk.encode("utf-8")
+        return chunk or b""
+
+    def rewind(self):
+        if self.start is None:
+            raise io.UnsupportedOperation("The upload cannot be rewound")
+        self.stream.seek(self.start)
+
+    def close(self):
+        pass
+
+
+def _tell(stream) -> Optional[int]:
+    try:
+        if stream.seekable():
+            return stream.tell()
+    except (AttributeError, OSError, ValueError):
+        pass
+    return None
+
+
+def _open_part(content) -> Union[_BytesPart, _MmapPart, _StreamPart]:
+    if isinstance(content, str):
+        return _BytesPart(content.encode("utf-8"))
+    if isinstance(content, (bytes, bytearray, memoryview)):
+        return _BytesPart(bytes(content))
+    if isinstance(content, SizedReader):
+        return _StreamPart(content.stream, content.length)
+
+    try:
+        status = os.fstat(content.fileno())
+        if stat.S_ISREG(status.st_mode) and status.st_size > 0:
+            return _MmapPart(content, status.st_size)
+    except (AttributeError, OSError, ValueError, io.UnsupportedOperation):
+        pass
+
+    start = _tell(content)
+    if start is None:
+        return _StreamPart(content, None)
+    end = content.seek(0, io.SEEK_END)
+    content.seek(start)
+    return _StreamPart(content, end - start)
+
+
+def _file_name(name: str, content) -> str:
+    file_name = getattr(content, "name", None)
+    if isinstance(file_name, str) and not (
+        file_name.startswith("<") and file_name.endswith(">")
+    ):
+        return os.path.basename(file_name)
+    return name
+
+
+class MultipartEncoder:
+    """Streams a multipart/form-data request body.
+
+    Accepts the same files argument as requests, but, unlike requests, never
+    reads a whole file into memory. Regular files are read through a memory
+    map, and other streams are read in chunks as the body is sent. When the
+    length of every part is known, the body is sent with a Content-Length
+    header. Otherwise, it is sent with chunked transfer encoding.
+
+    Parameters
+    ----------
+    fields : Union[Dict[str, Any], List[Tuple[str, Any]]]
+        The parts of the body, by field name. Each value is either the
+        content, or a tuple of (file name, content) or (file name, content,
+        content type). The content is bytes, a string, a readable file object,
+        or a SizedReader.
+    boundary : Optional[str]
+        The boundary between parts. By default, a random boundary is used.
+    """
+
+    def __init__(
+        self,
+        fields: Union[Dict[str, Any], List[Tuple[str, Any]]],
+        boundary: Optional[str] = None,
+    ):
+        self.boundary = boundary or binascii.hexlify(os.urandom(16)).decode("ascii")
+        self._segments: List[Union[_BytesPart, _MmapPart, _StreamPart]] = []
+
+        items = fields.items() if isinstance(fields, dict) else fields
+        for name, value in items:
+            if isinstance(value, (tuple, list)):
+                file_name, content = value[0], value[1]
+                content_type = value[2] if len(value) > 2 else None
+            else:
+                file_name, content, content_type = _file_name(name, value), value, None
+
+            disposition = f'form-data; name="{name}"'
+            if file_name is not None:
+                disposition += f'; filename="{file_name}"'
+            header = f"--{self.boundary}\r\nContent-Disposition: {disposition}\r\n"
+            if content_type is not None:
+                header += f"Content-Type: {content_type}\r\n"
+            self._segments.append(_BytesPart((header + "\r\n").encode("utf-8")))
+            self._segments.append(_open_part(content))
+            self._segments.append(_BytesPart(b"\r\n"))
+        self._segments.append(_BytesPart(f"--{self.boundary}--\r\n".encode("utf-8")))
+        self._index = 0
+
+    @property
+    def content_type(self) -> str:
+        """The Content-Type header of the body."""
+        return f"multipart/form-data; boundary={self.boundary}"
+
+    @property
+    def len(self) -> Optional[int]:
+        """The length of the body in bytes, or None when a part has an unknown
+        length. requests reads this attribute to set Content-Length."""
+        lengths = [s.length for s in self._segments]
+        if any(length is None for length in lengths):
+            return None
+        return sum(lengths)
+
+    def read(self, size: int = -1) -> bytes:
+        """Returns up to size bytes of the body, or the rest of the body when
+        size is negative. Returns b"" at the end of the body."""
+        if size is None or size < 0:
+            return b"".join(iter(lambda: self.read(1024 * 1024), b""))
+        while self._index < len(self._segments):
+            chunk = self._segments[self._index].read(size)
+            if chunk:
+                return chunk
+            self._segments[self._index].close()
+            self._index += 1
+        return b""
+
+    def __iter__(self):
+        return iter(lambda: self.read(64 * 1024), b"")
+
+    def rewind(self):
+        """Starts the body over, so that the request can be sent again. Raises
+        io.UnsupportedOperation when a part is a stream that cannot seek."""
+        for segment in self._segments:
+            segment.rewind()
+        self._index = 0
+
+    def close(self):
+        """Releases the memory maps of the body. This happens automatically
+        when the whole body has been read. The files themselves are left
+        open."""
+        for segment in self._segments:
+            segment.close()
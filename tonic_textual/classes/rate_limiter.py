@@ -0,0 +1,223 @@
+import json
+import os
+import random
+import threading
+import time
+from email.utils import parsedate_to_datetime
+from typing import Dict, List, Optional
+
+import requests
+
+
+class RateLimit:
+    """The request budget for one class of endpoints.
+
+    Parameters
+    ----------
+    requests_per_second : float
+        The sustained number of requests per second.
+    burst : Optional[int]
+        The number of requests that can be sent at once after a quiet period.
+        The default is requests_per_second, rounded up.
+    """
+
+    def __init__(self, requests_per_second: float, burst: Optional[int] = None):
+        if requests_per_second <= 0:
+            raise ValueError("requests_per_second must be greater than 0")
+        if burst is None:
+            burst = max(1, int(-(-requests_per_second // 1)))
+        if burst < 1:
+            raise ValueError("burst must be at least 1")
+        self.requests_per_second = requests_per_second
+        self.burst = burst
+
+
+class RateLimiter:
+    """Limits the rate of requests that a client sends, and backs off when the
+    server asks it to.
+
+    Every thread that uses the client shares the same budgets. Requests are
+    grouped into endpoint classes, each with its own token bucket:
+
+    - "redact": text redaction and synthesis, such as redact and redact_bulk
+    - "upload": file uploads, such as start_file_redaction and parse_file
+    - "read": GET requests and file downloads, such as dataset reads
+    - "default": every other request
+
+    A class that has no RateLimit is not limited. When the server responds
+    with 429 or 503, the request is retried after the time in its Retry-After
+    header, or after a growing delay if there is none. While it waits, every
+    other request of the same class waits too.
+
+    Parameters
+    ----------
+    limits : Optional[Dict[str, RateLimit]]
+        The budget of each endpoint class. The default is no budgets, which
+        only honors Retry-After.
+    lock_file : Optional[str]
+        A file in which to keep the budgets, so that they are shared by every
+        process that uses the same file. Requires a platform with fcntl. The
+        default is None, which shares the budgets only within this process.
+    max_retries : int
+        The number of times a request is retried after 429 or 503. The default
+        is 5.
+    max_retry_after : float
+        The longest wait, in seconds, before a retry. When the server asks for
+        a longer wait, the error response is returned instead. The default is
+        60.
+
+    Examples
+    --------
+    >>> limiter = RateLimiter({"redact": RateLimit(50), "upload": RateLimit(2, burst=4)})
+    >>> textual = TextualNer(client_options=HttpClientOptions(rate_limiter=limiter))
+    """
+
+    ENDPOINT_CLASSES = ("redact", "upload", "read", "default")
+    RETRY_STATUSES = (429, 503)
+
+    def __init__(
+        self,
+        limits: Optional[Dict[str, RateLimit]] = None,
+        lock_file: Optional[str] = None,
+        max_retries: int = 5,
+        max_retry_after: float = 60.0,
+    ):
+        limits = dict(limits or {})
+        unknown = set(limits) - set(self.ENDPOINT_CLASSES)
+        if unknown:
+            raise ValueError(
+                f"Unknown endpoint classes {sorted(unknown)}. Must be one of {', '.join(self.ENDPOINT_CLASSES)}."
+            )
+        if max_retries < 0:
+            raise ValueError("max_retries must be at least 0")
+
+        self.limits = limits
+        self.lock_file = lock_file
+        self.max_retries = max_retries
+        self.max_retry_after = max_retry_after
+        self._store = _MemoryStore() if lock_file is None else _FileStore(lock_file)
+
+    @staticmethod
+    def endpoint_class(method: str, url: str) -> str:
+        """Returns the endpoint class of a request."""
+        path = url.split("?")[0]
+        if method == "GET" or path.endswith("/download"):
+            return "read"
+        if method != "POST":
+            return "default"
+        if "upload" in path or path in ("/api/parse", "/api/audio/transcribe/start"):
+            return "upload"
+        if path.startswith("/api/redact") or path.startswith("/api/synthesis"):
+            return "redact"
+        return "default"
+
+    def acquire(self, endpoint_class: str):
+        """Blocks until a request of the given class can be sent."""
+        limit = self.limits.get(endpoint_class)
+        while True:
+            wait = self._store.update(
+                endpoint_class, lambda state, now: _take(state, now, limit)
+            )
+            if wait <= 0:
+                return
+            time.sleep(wait)
+
+    def pause(self, endpoint_class: str, seconds: float):
+        """Holds back every request of the given class for seconds."""
+
+        def extend(state: List[float], now: float) -> float:
+            state[2] = max(state[2], now + seconds)
+            return 0.0
+
+        self._store.update(endpoint_class, extend)
+
+    def retry_delay(self, response: requests.Response, attempt: int) -> Optional[float]:
+        """Returns how long to wait before retrying the response, or None when
+        it should not be retried."""
+        if response.status_code not in self.RETRY_STATUSES or attempt >= self.max_retries:
+            return None
+        delay = parse_retry_after(response.headers.get("Retry-After"))
+        if delay is None:
+            delay = min(self.max_retry_after, 0.5 * 2**attempt) * (0.5 + random.random() / 2)
+        if delay > self.max_retry_after:
+            return None
+        return delay
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """Returns the delay, in seconds, of a Retry-After header, which is either
+    a number of seconds or an HTTP date."""
+    if value is None:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
+
+
+def _take(state: List[float], now: float, limit: Optional[RateLimit]) -> float:
+    # state is [tokens, last refill time, paused until]
+    if state[2] > now:
+        return state[2] - now
+    if limit is None:
+        return 0.0
+    tokens = min(limit.burst, state[0] + (now - state[1]) * limit.requests_per_second)
+    state[1] = now
+    if tokens >= 1:
+        state[0] = tokens - 1
+        return 0.0
+    state[0] = tokens
+    return (1 - tokens) / limit.requests_per_second
+
+
+class _MemoryStore:
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._states: Dict[str, List[float]] = {}
+
+    def update(self, key: str, func) -> float:
+        with self._lock:
+            now = time.monotonic()
+            state = self._states.setdefault(key, [float("inf"), now, 0.0])
+            return func(state, now)
+
+
+class _FileStore:
+    """Keeps the bucket states in a JSON file that is locked with flock while
+    it is read and written. Wall-clock time is used, since it is shared by all
+    processes."""
+
+    def __init__(self, path: str):
+        try:
+            import fcntl
+        except ImportError as e:
+            raise ImportError(
+                "A lock_file requires fcntl, which is not available on this platform."
+            ) from e
+        self._fcntl = fcntl
+        self._lock = threading.Lock()
+        self.path = path
+
+    def update(self, key: str, func) -> float:
+        fd = os.open(self.path, os.O_RDWR | os.O_CREAT, 0o644)
+        with self._lock, os.fdopen(fd, "r+") as f:
+            self._fcntl.flock(f, self._fcntl.LOCK_EX)
+            try:
+                try:
+                    states = json.loads(f.read() or "{}")
+                except ValueError:
+                    states = {}
+                now = time.time()
+                state = states.setdefault(key, [float("inf"), now, 0.0])
+                result = func(state, now)
+                f.seek(0)
+                f.truncate()
+                f.write(json.dumps(states))
+                f.flush()
+                return result
+            finally:
+                self._fcntl.flock(f, self._fcntl.LOCK_UN)
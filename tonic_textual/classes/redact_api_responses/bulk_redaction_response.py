@@ -1,6 +1,13 @@
-from typing import List
+from typing import List, Optional
 
 from tonic_textual.classes.common_api_responses.replacement import Replacement
+from tonic_textual.classes.common_api_responses.response_field import response_field
+from tonic_textual.classes.redact_api_responses.bulk_redaction_spans import (
+    BulkRedactionSpans,
+)
+from tonic_textual.classes.redact_api_responses.redaction_failure import (
+    RedactionFailure,
+)
 
 
 class BulkRedactionResponse(dict):
@@ -10,25 +17,33 @@ class BulkRedactionResponse(dict):
     ----------
     bulk_text : List[str]
         The original text.
-    bulk_redacted_text : List[str]
-        The redacted and synthesized text.
+    bulk_redacted_text : List[Optional[str]]
+        The redacted and synthesized text. This is None for the strings that
+        failed.
     usage : int
         The number of words used
     de_identify_results : List[Replacement]
-        The list of named entities that were found in bulk_text.
+        The list of named entities that were found in bulk_text. This is empty
+        when the response was requested without Replacement objects.
+    spans : Optional[BulkRedactionSpans]
+        The named entities as parallel arrays. This is only present when the
+        response was requested in columnar format.
+    failures : Optional[List[RedactionFailure]]
+        The strings that the server could not redact. This is only present
+        when the response was requested with isolate_failures.
     """
 
+    __slots__ = ()
+
     def __init__(
         self,
         bulk_text: List[str],
         bulk_redacted_text: List[str],
         usage: int,
         de_identify_results: List[Replacement],
+        spans: Optional[BulkRedactionSpans] = None,
+        failures: Optional[List[RedactionFailure]] = None,
     ):
-        self.bulk_text = bulk_text
-        self.bulk_redacted_text = bulk_redacted_text
-        self.usage = usage
-        self.de_identify_results = de_identify_results
         dict.__init__(
             self,
             bulk_text=bulk_text,
@@ -36,6 +51,23 @@ class BulkRedactionResponse(dict):
             usage=usage,
             de_identify_results=de_identify_results,
         )
+        if spans is not None:
+            self["spans"] = spans
+        if failures is not None:
+            self["failures"] = failures
+
+    bulk_text = response_field("bulk_text")
+    bulk_redacted_text = response_field("bulk_redacted_text")
+    usage = response_field("usage")
+    de_identify_results = response_field("de_identify_results")
+    spans = response_field("spans", optional=True)
+    failures = response_field("failures", optional=True)
+
+    def columnar(self) -> BulkRedactionSpans:
+        """Returns the named entities as parallel arrays."""
+        if self.spans is not None:
+            return self.spans
+        return BulkRedactionSpans.from_replacements(self.de_identify_results)
 
     def describe(self) -> str:
         result = ""
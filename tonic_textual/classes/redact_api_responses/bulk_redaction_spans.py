@@ -0,0 +1,204 @@
+from array import array
+from typing import Dict, Iterable, List, Optional
+
+from tonic_textual.classes.common_api_responses.replacement import Replacement
+
+
+class BulkRedactionSpans:
+    """The entities found by a bulk redaction, stored as parallel arrays.
+
+    Each entity is one position in the arrays. Labels are stored once in
+    labels, and label_codes holds the position of each entity's label in that
+    list. No Python object is created per entity.
+
+    Attributes
+    ----------
+    idx : array
+        The index of the string in which the entity was found.
+    start : array
+        The start index of the entity in the original string.
+    end : array
+        The end index of the entity in the original string. The end index is
+        exclusive.
+    new_start : array
+        The start index of the entity in the redacted string.
+    new_end : array
+        The end index of the entity in the redacted string. The end index is
+        exclusive.
+    label_codes : array
+        The position of the entity's label in labels.
+    score : array
+        The confidence score of the detection.
+    labels : List[str]
+        The distinct labels.
+    """
+
+    def __init__(self, labels: Optional[List[str]] = None):
+        self.idx = array("q")
+        self.start = array("q")
+        self.end = array("q")
+        self.new_start = array("q")
+        self.new_end = array("q")
+        self.label_codes = array("i")
+        self.score = array("d")
+        self.labels: List[str] = []
+        self._label_codes: Dict[str, int] = {}
+        for label in labels or []:
+            self._code(label)
+
+    def __len__(self):
+        return len(self.idx)
+
+    def _code(self, label: str) -> int:
+        code = self._label_codes.get(label)
+        if code is None:
+            code = len(self.labels)
+            self._label_codes[label] = code
+            self.labels.append(label)
+        return code
+
+    def append(
+        self,
+        idx: int,
+        start: int,
+        end: int,
+        new_start: Optional[int],
+        new_end: Optional[int],
+        label: str,
+        score: float,
+    ):
+        """Appends an entity. A new_start or new_end of None, which the
+        server returns for entities that are not in the redacted string, is
+        stored as -1."""
+        self.idx.append(idx)
+        self.start.append(start)
+        self.end.append(end)
+        self.new_start.append(-1 if new_start is None else new_start)
+        self.new_end.append(-1 if new_end is None else new_end)
+        self.label_codes.append(self._code(label))
+        self.score.append(score)
+
+    @classmethod
+    def from_api_results(cls, results: Iterable[Dict]) -> "BulkRedactionSpans":
+        """Builds the arrays from the deIdentifyResults of a bulk response."""
+        spans = cls()
+        for result in results:
+            spans.append(
+                result["idx"],
+                result["start"],
+                result["end"],
+                result.get("newStart"),
+                result.get("newEnd"),
+                result["label"],
+                result["score"],
+            )
+        return spans
+
+    @classmethod
+    def from_replacements(
+        cls, de_identify_results: List[List[Replacement]]
+    ) -> "BulkRedactionSpans":
+        spans = cls()
+        for idx, replacements in enumerate(de_identify_results):
+            for r in replacements:
+                spans.append(
+                    idx, r.start, r.end, r.new_start, r.new_end, r.label, r.score
+                )
+        return spans
+
+    def label(self, position: int) -> str:
+        """Returns the label of the entity at position."""
+        return self.labels[self.label_codes[position]]
+
+    def extend(self, other: "BulkRedactionSpans", idx_offset: int = 0):
+        """Appends the entities of other, adding idx_offset to their idx."""
+        codes = array("i", (self._code(label) for label in other.labels))
+        self.idx.extend(i + idx_offset for i in other.idx)
+        self.start.extend(other.start)
+        self.end.extend(other.end)
+        self.new_start.extend(other.new_start)
+        self.new_end.extend(other.new_end)
+        self.label_codes.extend(codes[c] for c in other.label_codes)
+        self.score.extend(other.score)
+
+    def take(self, positions: List[int]) -> "BulkRedactionSpans":
+        """Returns the entities for a new list of strings, where string i of the
+        new list is string positions[i] of this one."""
+        rows_by_idx: Dict[int, List[int]] = {}
+        for row, idx in enumerate(self.idx):
+            rows_by_idx.setdefault(idx, []).append(row)
+
+        spans = BulkRedactionSpans(self.labels)
+        for new_idx, idx in enumerate(positions):
+            for row in rows_by_idx.get(idx, ()):
+                spans.idx.append(new_idx)
+                spans.start.append(self.start[row])
+                spans.end.append(self.end[row])
+                spans.new_start.append(self.new_start[row])
+                spans.new_end.append(self.new_end[row])
+                spans.label_codes.append(self.label_codes[row])
+                spans.score.append(self.score[row])
+        return spans
+
+    def to_pandas(self):
+        """Returns the entities as a pandas DataFrame with one row per entity.
+        The label column is categorical."""
+        try:
+            import numpy as np
+            import pandas as pd
+        except ImportError as e:
+            raise ImportError(
+                "Pandas is required to convert the spans to a pandas dataframe. Before you use this method, you must install pandas."
+            ) from e
+
+        return pd.DataFrame(
+            {
+                "idx": np.frombuffer(self.idx, dtype=np.int64),
+                "start": np.frombuffer(self.start, dtype=np.int64),
+                "end": np.frombuffer(self.end, dtype=np.int64),
+                "new_start": np.frombuffer(self.new_start, dtype=np.int64),
+                "new_end": np.frombuffer(self.new_end, dtype=np.int64),
+                "label": pd.Categorical.from_codes(
+                    np.frombuffer(self.label_codes, dtype=np.int32),
+                    categories=self.labels,
+                ),
+                "score": np.frombuffer(self.score, dtype=np.float64),
+            }
+        )
+
+    def to_arrow(self):
+        """Returns the entities as a pyarrow Table with one row per entity. The
+        label column is dictionary encoded. The table shares memory with the
+        arrays, so no more entities can be appended while the table exists."""
+        try:
+            import pyarrow as pa
+        except ImportError as e:
+            raise ImportError(
+                "PyArrow is required to convert the spans to an arrow table. Before you use this method, you must install pyarrow."
+            ) from e
+
+        def int64(values: array):
+            return pa.Array.from_buffers(
+                pa.int64(), len(values), [None, pa.py_buffer(values)]
+            )
+
+        return pa.table(
+            {
+                "idx": int64(self.idx),
+                "start": int64(self.start),
+                "end": int64(self.end),
+                "new_start": int64(self.new_start),
+                "new_end": int64(self.new_end),
+                "label": pa.DictionaryArray.from_arrays(
+                    pa.Array.from_buffers(
+                        pa.int32(),
+                        len(self.label_codes),
+                        [None, pa.py_buffer(self.label_codes)],
+                    ),
+                    pa.array(self.labels, type=pa.string()),
+                ),
+                "score": pa.Array.from_buffers(
+                    pa.float64(), len(self.score), [None, pa.py_buffer(self.score)]
+                ),
+            }
+        )
@@ -0,0 +1,90 @@
+from typing import List, Optional
+
+from tonic_textual.classes.common_api_responses.response_field import response_field
+
+
+class FileRedactionResult(dict):
+    """The outcome of redacting one file with redact_files.
+
+    Attributes
+    ----------
+    path : str
+        The path of the original file.
+    output_path : Optional[str]
+        The path of the redacted file. This is None when the file failed.
+    job_id : Optional[str]
+        The identifier of the redaction job. This is None when the upload
+        failed.
+    status : str
+        Either "succeeded" or "failed".
+    error : Optional[str]
+        The error that caused the file to fail.
+    seconds : float
+        The time from the start of the upload until the redacted file was
+        written or the file failed.
+    """
+
+    __slots__ = ()
+
+    def __init__(
+        self,
+        path: str,
+        output_path: Optional[str],
+        job_id: Optional[str],
+        status: str,
+        error: Optional[str],
+        seconds: float,
+    ):
+        dict.__init__(
+            self,
+            path=path,
+            output_path=output_path,
+            job_id=job_id,
+            status=status,
+            error=error,
+            seconds=seconds,
+        )
+
+    path = response_field("path")
+    output_path = response_field("output_path")
+    job_id = response_field("job_id")
+    status = response_field("status")
+    error = response_field("error")
+    seconds = response_field("seconds")
+
+
+class FileRedactionReport(dict):
+    """The outcome of redacting many files with redact_files.
+
+    Attributes
+    ----------
+    results : List[FileRedactionResult]
+        The result for each file, in the order in which the files were listed.
+    succeeded : int
+        The number of files that were redacted and written.
+    failed : int
+        The number of files that failed.
+    seconds : float
+        The total time taken.
+    """
+
+    __slots__ = ()
+
+    def __init__(self, results: List[FileRedactionResult], seconds: float):
+        succeeded = sum(1 for r in results if r.status == "succeeded")
+        dict.__init__(
+            self,
+            results=results,
+            succeeded=succeeded,
+            failed=len(results) - succeeded,
+            seconds=seconds,
+        )
+
+    results = response_field("results")
+    succeeded = response_field("succeeded")
+    failed = response_field("failed")
+    seconds = response_field("seconds")
+
+    def failures(self) -> List[FileRedactionResult]:
+        """Returns the results of the files that failed."""
+        return [r for r in self.results if r.status == "failed"]
@@ -0,0 +1,42 @@
+from typing import List, Optional
+
+from tonic_textual.classes.common_api_responses.response_field import response_field
+from tonic_textual.classes.redact_api_responses.redaction_failure import (
+    RedactionFailure,
+)
+from tonic_textual.classes.redact_api_responses.redaction_response import (
+    RedactionResponse,
+)
+
+
+class JsonBatchRedactionResponse(dict):
+    """The outcome of redacting many JSON documents with redact_json_batch.
+
+    Attributes
+    ----------
+    results : List[Optional[RedactionResponse]]
+        The response for each document, in the order in which the documents
+        were listed. This is None for the documents that failed.
+    failures : List[RedactionFailure]
+        The documents that failed, with the error returned by the server.
+    usage : int
+        The number of words used by the documents that were redacted.
+    """
+
+    __slots__ = ()
+
+    def __init__(
+        self,
+        results: List[Optional[RedactionResponse]],
+        failures: List[RedactionFailure],
+    ):
+        dict.__init__(
+            self,
+            results=results,
+            failures=failures,
+            usage=sum(r.usage for r in results if r is not None),
+        )
+
+    results = response_field("results")
+    failures = response_field("failures")
+    usage = response_field("usage")
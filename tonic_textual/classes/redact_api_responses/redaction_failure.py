@@ -0,0 +1,29 @@
+from typing import Optional
+
+from tonic_textual.classes.common_api_responses.response_field import response_field
+
+
+class RedactionFailure(dict):
+    """An item that the server could not redact.
+
+    Attributes
+    ----------
+    index : int
+        The position of the item in the list that was sent.
+    text : str
+        The item that failed.
+    status : Optional[int]
+        The HTTP status of the error response, such as 400 or 500.
+    error : str
+        The error returned by the server.
+    """
+
+    __slots__ = ()
+
+    def __init__(self, index: int, text: str, status: Optional[int], error: str):
+        dict.__init__(self, index=index, text=text, status=status, error=error)
+
+    index = response_field("index")
+    text = response_field("text")
+    status = response_field("status")
+    error = response_field("error")
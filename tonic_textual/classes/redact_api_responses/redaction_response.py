@@ -1,6 +1,7 @@
 from typing import List
 
 from tonic_textual.classes.common_api_responses.replacement import Replacement
+from tonic_textual.classes.common_api_responses.response_field import response_field
 
 
 class RedactionResponse(dict):
@@ -18,6 +19,8 @@ class RedactionResponse(dict):
         The list of named entities that were found in original_text.
     """
 
+    __slots__ = ()
+
     def __init__(
         self,
         original_text: str,
@@ -25,10 +28,6 @@ class RedactionResponse(dict):
         usage: int,
         de_identify_results: List[Replacement],
     ):
-        self.original_text = original_text
-        self.redacted_text = redacted_text
-        self.usage = usage
-        self.de_identify_results = de_identify_results
         dict.__init__(
             self,
             original_text=original_text,
@@ -37,6 +36,11 @@ class RedactionResponse(dict):
             de_identify_results=de_identify_results,
         )
 
+    original_text = response_field("original_text")
+    redacted_text = response_field("redacted_text")
+    usage = response_field("usage")
+    de_identify_results = response_field("de_identify_results")
+
     def describe(self) -> str:
         result = f"{self.redacted_text}\n"
         for x in self.de_identify_results:
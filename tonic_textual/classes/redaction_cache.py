@@ -0,0 +1,219 @@
+import hashlib
+import json
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import Future
+from typing import Any, Callable, Dict, List, Optional
+
+from tonic_textual.classes.sqlite_redaction_cache import SqliteRedactionCache
+
+
+def make_cache_key(
+    endpoint: str, payload: Dict, random_seed: Optional[int], scope: str = ""
+) -> str:
+    """Returns a hash of the scope, the endpoint, the normalized request
+    payload, and the random seed. The scope identifies the Textual instance
+    and the credentials, so that a cache shared by several clients never
+    returns one instance's or workspace's results to another."""
+    canonical = json.dumps(
+        [scope, endpoint, payload, random_seed],
+        sort_keys=True,
+        separators=(",", ":"),
+        ensure_ascii=False,
+        default=str,
+    )
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
+class RedactionCache:
+    """In-memory cache of redaction results, optionally backed by a persistent
+    store.
+
+    Results are only cached for requests that provide a random seed, because
+    only those requests return the same output for the same input. Results are
+    kept separately for each Textual instance and API key, so one cache can be
+    shared by clients of different instances or workspaces. Concurrent
+    requests for the same uncached input are combined, so that only one of
+    them is sent to the server.
+
+    Parameters
+    ----------
+    max_entries : int
+        The maximum number of results to keep. When the cache is full, the least
+        recently used result is evicted. The default is 10000.
+    ttl_seconds : Optional[float]
+        The time, in seconds, after which a result expires. By default, results
+        do not expire.
+    backing_store : Optional[SqliteRedactionCache]
+        An optional persistent store. Results that are not in memory are looked
+        up in the store, and new results are written to it. The TTL applies
+        only to the results in memory.
+
+    Examples
+    --------
+    >>> from tonic_textual.classes.redaction_cache import RedactionCache
+    >>> cache = RedactionCache(max_entries=100_000, ttl_seconds=3600)
+    >>> textual = TextualNer(cache=cache)
+    >>> textual.redact("My name is John", random_seed=42)
+    """
+
+    def __init__(
+        self,
+        max_entries: int = 10000,
+        ttl_seconds: Optional[float] = None,
+        backing_store: Optional[SqliteRedactionCache] = None,
+    ):
+        if max_entries < 1:
+            raise ValueError("max_entries must be at least 1")
+        if ttl_seconds is not None and ttl_seconds <= 0:
+            raise ValueError("ttl_seconds must be positive")
+
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self.backing_store = backing_store
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        self._entries: "OrderedDict[str, tuple]" = OrderedDict()
+        self._inflight: Dict[str, Future] = {}
+
+    def __len__(self):
+        with self._lock:
+            return len(self._entries)
+
+    def clear(self):
+        """Removes all results from memory and resets the hit and miss counters.
+        The backing store is not cleared."""
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def get(self, key: str) -> Optional[Any]:
+        """Returns the cached result for key, or None."""
+        with self._lock:
+            found, value = self._lookup(key)
+            if found:
+                self.hits += 1
+                return value
+
+        value = None
+        if self.backing_store is not None:
+            value = self.backing_store.get(key)
+        with self._lock:
+            if value is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+                self._store(key, value)
+        return value
+
+    def put(self, key: str, value: Any):
+        with self._lock:
+            self._store(key, value)
+        if self.backing_store is not None:
+            self.backing_store.put(key, value)
+
+    def get_or_compute(self, key: str, compute: Callable[[], Any]) -> Any:
+        """Returns the cached result for key. On a miss, calls compute once,
+        even if other threads request the same key at the same time."""
+        return self.get_many_or_compute([key], lambda indices: [compute()])[0]
+
+    def get_many_or_compute(
+        self, keys: List[str], compute: Callable[[List[int]], List[Any]]
+    ) -> List[Any]:
+        """Returns the results for keys, in order.
+
+        compute receives the indices of the keys that are neither cached nor
+        being computed by another thread, and returns their results in the same
+        order. Each distinct key is computed at most once.
+        """
+        results: List[Any] = [None] * len(keys)
+        owned: Dict[str, Future] = {}
+        owned_indices = []
+        waiting = []
+        with self._lock:
+            for idx, key in enumerate(keys):
+                found, value = self._lookup(key)
+                if found:
+                    self.hits += 1
+                    results[idx] = value
+                    continue
+                future = owned.get(key) or self._inflight.get(key)
+                if future is not None:
+                    self.hits += 1
+                    waiting.append((idx, future))
+                    continue
+                self.misses += 1
+                future = Future()
+                owned[key] = future
+                self._inflight[key] = future
+                owned_indices.append(idx)
+
+        try:
+            if owned_indices and self.backing_store is not None:
+                stored = self.backing_store.get_many(
+                    [keys[idx] for idx in owned_indices]
+                )
+                if stored:
+                    with self._lock:
+                        self.hits += len(stored)
+                        self.misses -= len(stored)
+                    self._resolve(
+                        [(idx, stored[keys[idx]]) for idx in owned_indices if keys[idx] in stored],
+                        keys,
+                        owned,
+                        results,
+                    )
+                    owned_indices = [idx for idx in owned_indices if keys[idx] not in stored]
+
+            if owned_indices:
+                values = compute(owned_indices)
+                if self.backing_store is not None:
+                    self.backing_store.put_many(
+                        (keys[idx], value) for idx, value in zip(owned_indices, values)
+                    )
+                self._resolve(list(zip(owned_indices, values)), keys, owned, results)
+        except BaseException as e:
+            with self._lock:
+                for key, future in owned.items():
+                    if not future.done():
+                        self._inflight.pop(key, None)
+            for future in owned.values():
+                if not future.done():
+                    future.set_exception(e)
+            raise
+
+        for idx, future in waiting:
+            results[idx] = future.result()
+        return results
+
+    def _resolve(self, computed, keys, owned, results):
+        with self._lock:
+            for idx, value in computed:
+                self._store(keys[idx], value)
+                self._inflight.pop(keys[idx], None)
+        for idx, value in computed:
+            owned[keys[idx]].set_result(value)
+            results[idx] = value
+
+    def _lookup(self, key: str):
+        entry = self._entries.get(key)
+        if entry is None:
+            return False, None
+        value, expires_at = entry
+        if expires_at is not None and expires_at <= time.monotonic():
+            del self._entries[key]
+            return False, None
+        self._entries.move_to_end(key)
+        return True, value
+
+    def _store(self, key: str, value: Any):
+        expires_at = (
+            None if self.ttl_seconds is None else time.monotonic() + self.ttl_seconds
+        )
+        self._entries[key] = (value, expires_at)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
@@ -0,0 +1,135 @@
+import json
+import threading
+from concurrent.futures import Future
+from typing import Callable, Dict, List, Optional, Tuple
+
+from tonic_textual.classes.redact_api_responses.bulk_redaction_response import (
+    BulkRedactionResponse,
+)
+from tonic_textual.classes.redact_api_responses.redaction_response import (
+    RedactionResponse,
+)
+from tonic_textual.classes.redaction_config import payload_with_fields
+
+
+class _PendingBatch:
+    def __init__(self, payload: Dict, random_seed: Optional[int]):
+        self.payload = payload
+        self.random_seed = random_seed
+        self.strings: List[str] = []
+        self.futures: List[Future] = []
+        self.full = threading.Event()
+
+
+class RedactionCoalescer:
+    """Groups individual redact calls made from many threads into bulk requests.
+
+    The first call with a given configuration opens a batch and waits up to
+    max_wait_seconds for other calls with the same configuration to join. The
+    batch is then sent as a single bulk request, and each caller receives its
+    own RedactionResponse. A batch that reaches max_batch_size is sent
+    immediately.
+
+    Parameters
+    ----------
+    send_bulk : Callable[[Dict, Optional[int]], BulkRedactionResponse]
+        Sends a bulk redaction payload with an optional random seed.
+    max_batch_size : int
+        The maximum number of strings in a bulk request. The default is 64.
+    max_wait_seconds : float
+        The maximum time that a call waits for other calls to join its batch.
+        The default is 0.005.
+    """
+
+    def __init__(
+        self,
+        send_bulk: Callable[[Dict, Optional[int]], BulkRedactionResponse],
+        max_batch_size: int = 64,
+        max_wait_seconds: float = 0.005,
+    ):
+        if max_batch_size < 1:
+            raise ValueError("max_batch_size must be at least 1")
+        if max_wait_seconds < 0:
+            raise ValueError("max_wait_seconds must not be negative")
+
+        self.send_bulk = send_bulk
+        self.max_batch_size = max_batch_size
+        self.max_wait_seconds = max_wait_seconds
+        self._lock = threading.Lock()
+        self._pending: Dict[Tuple[str, Optional[int]], _PendingBatch] = {}
+
+    def redact(
+        self, string: str, payload: Dict, random_seed: Optional[int] = None
+    ) -> RedactionResponse:
+        """Redacts a string as part of a batch of calls that share the same
+        payload and random seed.
+
+        When the string was sent together with other strings, the server
+        reports usage for the whole request. That usage is split across the
+        strings in proportion to their word counts, so that the usages of the
+        calls add up to the usage of the request.
+        """
+        key = (json.dumps(payload, sort_keys=True, default=str), random_seed)
+        future = Future()
+        with self._lock:
+            batch = self._pending.get(key)
+            is_leader = batch is None
+            if is_leader:
+                batch = _PendingBatch(payload, random_seed)
+                self._pending[key] = batch
+            batch.strings.append(string)
+            batch.futures.append(future)
+            is_full = len(batch.strings) >= self.max_batch_size
+            if is_full:
+                del self._pending[key]
+                batch.full.set()
+
+        if is_full:
+            self._flush(batch)
+        elif is_leader:
+            batch.full.wait(self.max_wait_seconds)
+            with self._lock:
+                owns_batch = self._pending.get(key) is batch
+                if owns_batch:
+                    del self._pending[key]
+            if owns_batch:
+                self._flush(batch)
+
+        return future.result()
+
+    def _flush(self, batch: _PendingBatch):
+        try:
+            response = self.send_bulk(
+                payload_with_fields(batch.payload, bulkText=batch.strings),
+                batch.random_seed,
+            )
+        except BaseException as e:
+            for future in batch.futures:
+                future.set_exception(e)
+            return
+
+        usages = _split_usage(response.usage, batch.strings)
+        for idx, future in enumerate(batch.futures):
+            future.set_result(
+                RedactionResponse(
+                    response.bulk_text[idx],
+                    response.bulk_redacted_text[idx],
+                    usages[idx],
+                    response.de_identify_results[idx],
+                )
+            )
+
+
+def _split_usage(usage: int, strings: List[str]) -> List[int]:
+    """Splits the usage of a bulk request across its strings in proportion to
+    their word counts. The parts add up to usage."""
+    weights = [max(1, len(s.split())) for s in strings]
+    total = sum(weights)
+    parts = [usage * w // total for w in weights]
+    # The remainder goes to the strings with the largest fractional parts.
+    by_remainder = sorted(
+        range(len(strings)), key=lambda i: usage * weights[i] % total, reverse=True
+    )
+    for i in by_remainder[: usage - sum(parts)]:
+        parts[i] += 1
+    return parts
@@ -0,0 +1,143 @@
+import json
+from types import MappingProxyType
+from typing import Dict, List, Optional, Union
+
+from tonic_textual.classes.generator_metadata.base_metadata import BaseMetadata
+from tonic_textual.classes.json_codec import JsonCodec
+from tonic_textual.enums.pii_state import PiiState
+from tonic_textual.generator_utils import generate_redact_payload
+
+
+class RedactionConfig:
+    """A validated, reusable redaction configuration.
+
+    The configuration is validated and serialized once, when it is created.
+    Pass it as the config argument of the redact methods to skip that work on
+    every call. A RedactionConfig cannot be changed after it is created.
+
+    Parameters
+    ----------
+    generator_default: Union[PiiState, str] = PiiState.Redaction
+        The default redaction used for types that are not specified in
+        generator_config. Value must be one of "Redaction", "Synthesis", or
+        "Off".
+
+    generator_config: Dict[str, Union[PiiState, str]]
+        A dictionary of sensitive data entities. For each entity, indicates
+        whether to redact, synthesize, or ignore it. Values must be one of
+        "Redaction", "Synthesis", or "Off".
+
+    generator_metadata: Dict[str, BaseMetadata]
+        A dictionary of sensitive data entities. For each entity, indicates
+        generator configuration in case synthesis is selected.  Values must
+        be of types appropriate to the PII type.
+
+    label_block_lists: Optional[Dict[str, List[str]]]
+        A dictionary of (entity type, ignored values). When a value for an
+        entity type matches a listed regular expression, the value is
+        ignored and is not redacted or synthesized.
+
+    label_allow_lists: Optional[Dict[str, List[str]]]
+        A dictionary of (entity type, additional values). When a piece of
+        text matches a listed regular expression, the text is marked as the
+        entity type and is included in the redaction or synthesis.
+
+    custom_entities: Optional[List[str]]
+        A list of custom entity type identifiers to include.
+
+    Examples
+    --------
+    >>> config = RedactionConfig(
+    >>>     generator_config={"NAME_GIVEN": "Synthesis"},
+    >>>     generator_default="Off",
+    >>> )
+    >>> for text in texts:
+    >>>     textual.redact(text, config=config)
+    """
+
+    def __init__(
+        self,
+        generator_default: Union[PiiState, str] = PiiState.Redaction,
+        generator_config: Dict[str, Union[PiiState, str]] = dict(),
+        generator_metadata: Dict[str, BaseMetadata] = dict(),
+        label_block_lists: Optional[Dict[str, List[str]]] = None,
+        label_allow_lists: Optional[Dict[str, List[str]]] = None,
+        custom_entities: Optional[List[str]] = None,
+    ):
+        payload = generate_redact_payload(
+            generator_default,
+            generator_config,
+            generator_metadata,
+            label_block_lists,
+            label_allow_lists,
+            None,
+            custom_entities,
+        )
+        del payload["recordApiRequestOptions"]
+        payload["generatorDefault"] = PiiState(generator_default).value
+
+        set_attribute = object.__setattr__
+        set_attribute(self, "generator_default", PiiState(generator_default))
+        set_attribute(self, "generator_config", MappingProxyType(dict(generator_config)))
+        set_attribute(self, "generator_metadata", MappingProxyType(dict(generator_metadata)))
+        set_attribute(self, "custom_entities", None if custom_entities is None else tuple(custom_entities))
+        set_attribute(self, "_payload", payload)
+        set_attribute(self, "_json_fragment", json.dumps(payload, separators=(",", ":"))[1:-1])
+
+    def __setattr__(self, name, value):
+        raise AttributeError("RedactionConfig cannot be changed after it is created")
+
+    def __delattr__(self, name):
+        raise AttributeError("RedactionConfig cannot be changed after it is created")
+
+    def __repr__(self):
+        return f"RedactionConfig({self._json_fragment})"
+
+    def to_payload(self, **fields) -> "RedactPayload":
+        """Returns a request payload that combines this configuration with the
+        given request fields."""
+        return RedactPayload(self, fields)
+
+
+class RedactPayload(dict):
+    """A redaction request payload. The configuration part is serialized only
+    once, when the RedactionConfig is created."""
+
+    def __init__(self, config: RedactionConfig, fields: Dict):
+        dict.__init__(self, config._payload)
+        dict.update(self, fields)
+        self.config = config
+        self.fields = dict(fields)
+
+    def __setitem__(self, key, value):
+        dict.__setitem__(self, key, value)
+        self.fields[key] = value
+
+    def with_fields(self, **fields) -> "RedactPayload":
+        return RedactPayload(self.config, {**self.fields, **fields})
+
+    def to_json(self) -> str:
+        if not self.fields.keys().isdisjoint(self.config._payload):
+            return json.dumps(self, separators=(",", ":"))
+        fields = json.dumps(self.fields, separators=(",", ":"))[1:-1]
+        if not fields:
+            return "{" + self.config._json_fragment + "}"
+        return "{" + self.config._json_fragment + "," + fields + "}"
+
+    def to_json_bytes(self, codec: JsonCodec) -> bytes:
+        """Returns the payload as UTF-8 encoded JSON. Only the request fields
+        are encoded with codec; the configuration is reused as is."""
+        if not self.fields.keys().isdisjoint(self.config._payload):
+            return codec.dumps(dict(self))
+        fields = codec.dumps(self.fields)[1:-1]
+        fragment = self.config._json_fragment.encode("utf-8")
+        if not fields:
+            return b"{" + fragment + b"}"
+        return b"{" + fragment + b"," + fields + b"}"
+
+
+def payload_with_fields(payload: Dict, **fields) -> Dict:
+    """Returns a copy of payload with the given fields added or replaced."""
+    if isinstance(payload, RedactPayload):
+        return payload.with_fields(**fields)
+    return {**payload, **fields}
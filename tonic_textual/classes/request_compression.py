@@ -0,0 +1,41 @@
+import gzip
+from typing import Optional
+
+from urllib3.util.request import ACCEPT_ENCODING
+
+REQUEST_ENCODINGS = ("gzip", "zstd")
+
+
+def default_accept_encoding() -> str:
+    """Returns every response encoding that the installed urllib3 can decode.
+    This includes br and zstd when brotli and zstandard are installed."""
+    return ACCEPT_ENCODING.replace(",", ", ")
+
+
+def check_request_encoding(encoding: Optional[str]):
+    if encoding is None:
+        return
+    if encoding not in REQUEST_ENCODINGS:
+        raise ValueError(
+            f"request_compression must be one of {', '.join(REQUEST_ENCODINGS)}, or None"
+        )
+    if encoding == "zstd":
+        _zstandard()
+
+
+def compress(body: bytes, encoding: str) -> bytes:
+    """Compresses a request body with the given Content-Encoding."""
+    if encoding == "gzip":
+        # mtime=0 keeps the output the same for the same body.
+        return gzip.compress(body, compresslevel=6, mtime=0)
+    return _zstandard().ZstdCompressor(level=3).compress(body)
+
+
+def _zstandard():
+    try:
+        import zstandard
+    except ImportError as e:
+        raise ImportError(
+            "zstandard is required to compress requests with zstd. Before you use this option, you must install zstandard."
+        ) from e
+    return zstandard
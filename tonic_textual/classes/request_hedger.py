@@ -0,0 +1,228 @@
+import threading
+import time
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import Callable, Dict, Optional, TypeVar
+
+R = TypeVar("R")
+
+
+class RequestHedger:
+    """Sends a second copy of a slow request, and returns whichever copy
+    answers first.
+
+    Each call is sent right away. If it has not answered after the hedge
+    delay, a hedge copy is sent, and the first successful answer is returned.
+    The other copy is cancelled if it has not started yet, and otherwise its
+    answer is discarded. The hedge delay is the given percentile of recent
+    request latencies, so that only the slowest requests are hedged.
+
+    To keep the extra load bounded, each call earns max_hedge_ratio of a
+    hedge, and a hedge is only sent when a whole one has been earned. At most
+    max_hedge_ratio of the calls are hedged over time, plus a burst of up to
+    max_burst hedges after a quiet period.
+
+    At most max_workers requests run on the hedger's threads at a time, and a
+    call never waits for a thread. A call runs on the caller's thread, and is
+    not hedged, when no hedge has been earned, when all of the threads are
+    busy, or after the hedger is shut down. Otherwise the call is sent from
+    one of the threads, so that the caller can return the hedge's answer
+    while the first copy is still waiting for its own.
+
+    Only use a hedger for requests that can be sent twice without side
+    effects.
+
+    Parameters
+    ----------
+    percentile : float
+        The percentile of recent latencies after which a request is hedged.
+        The default is 95.
+    initial_delay : float
+        The hedge delay, in seconds, until min_samples latencies have been
+        measured. The default is 0.1.
+    min_delay : float
+        The shortest hedge delay, in seconds. The default is 0.005.
+    max_hedge_ratio : float
+        The largest fraction of calls that are hedged. The default is 0.05.
+    max_burst : int
+        The number of hedges that can be sent at once after a quiet period.
+        The default is 5.
+    window : int
+        The number of recent latencies from which the percentile is computed.
+        The default is 1000.
+    min_samples : int
+        The number of latencies to measure before the percentile is used. The
+        default is 20.
+    max_workers : int
+        The largest number of requests that are sent from the hedger's
+        threads at a time. Each hedged call uses two of them. The default is
+        32.
+
+    Examples
+    --------
+    >>> hedger = RequestHedger(percentile=99, max_hedge_ratio=0.02)
+    >>> response = hedger.call(lambda attempt: send(urls[attempt]))
+    """
+
+    def __init__(
+        self,
+        percentile: float = 95.0,
+        initial_delay: float = 0.1,
+        min_delay: float = 0.005,
+        max_hedge_ratio: float = 0.05,
+        max_burst: int = 5,
+        window: int = 1000,
+        min_samples: int = 20,
+        max_workers: int = 32,
+    ):
+        if not 0 < percentile < 100:
+            raise ValueError("percentile must be greater than 0 and less than 100")
+        if initial_delay < 0 or min_delay < 0:
+            raise ValueError("initial_delay and min_delay must not be negative")
+        if not 0 < max_hedge_ratio <= 1:
+            raise ValueError("max_hedge_ratio must be greater than 0 and at most 1")
+        if max_burst < 1:
+            raise ValueError("max_burst must be at least 1")
+        if window < 1 or min_samples < 1:
+            raise ValueError("window and min_samples must be at least 1")
+        if max_workers < 2:
+            raise ValueError("max_workers must be at least 2")
+
+        self.percentile = percentile
+        self.initial_delay = initial_delay
+        self.min_delay = min_delay
+        self.max_hedge_ratio = max_hedge_ratio
+        self.max_burst = max_burst
+        self.min_samples = min(min_samples, window)
+
+        self._lock = threading.Lock()
+        self._latencies: deque = deque(maxlen=window)
+        self._budget = float(max_burst)
+        self._calls = 0
+        self._hedges = 0
+        self._hedge_wins = 0
+        self.max_workers = max_workers
+        self._tasks = 0
+        self._closed = False
+        self._on_idle: Optional[Callable[[], None]] = None
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="textual-hedge"
+        )
+
+    def delay(self) -> float:
+        """Returns the time, in seconds, after which a call is hedged."""
+        with self._lock:
+            if len(self._latencies) < self.min_samples:
+                return max(self.min_delay, self.initial_delay)
+            latencies = sorted(self._latencies)
+        index = int(self.percentile / 100 * (len(latencies) - 1))
+        return max(self.min_delay, latencies[index])
+
+    def stats(self) -> Dict:
+        """Returns the number of calls, hedges, and hedges that answered
+        first, and the current hedge delay."""
+        delay = self.delay()
+        with self._lock:
+            return {
+                "calls": self._calls,
+                "hedges": self._hedges,
+                "hedge_wins": self._hedge_wins,
+                "delay": delay,
+            }
+
+    def call(self, send: Callable[[int], R]) -> R:
+        """Calls send(0), and if it is slow, also send(1). Returns the first
+        successful result. When both fail, the error of send(0) is raised."""
+        delay = self.delay()
+        with self._lock:
+            self._calls += 1
+            self._budget = min(self.max_burst, self._budget + self.max_hedge_ratio)
+            hedgeable = self._budget >= 1
+
+        primary = self._submit(send, 0) if hedgeable else None
+        if primary is None:
+            return self._timed(send, 0, time.monotonic())
+        done, _ = wait([primary], timeout=delay)
+        if done or not self._take_hedge():
+            return primary.result()
+
+        hedge = self._submit(send, 1)
+        if hedge is None:
+            with self._lock:
+                self._budget += 1
+                self._hedges -= 1
+            return primary.result()
+        pending = {primary, hedge}
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in (primary, hedge):
+                if future in done and future.exception() is None:
+                    for other in pending:
+                        other.cancel()
+                    if future is hedge:
+                        with self._lock:
+                            self._hedge_wins += 1
+                    return future.result()
+        return primary.result()
+
+    def shutdown(self, on_idle: Optional[Callable[[], None]] = None):
+        """Stops the threads once the requests in progress are finished.
+        Calls that are in progress are completed, and later calls are sent
+        from the caller's thread without a hedge. on_idle is called once no
+        request is running on the hedger's threads, for example to close the
+        client that the hedges use."""
+        with self._lock:
+            self._closed = True
+            if self._tasks:
+                self._on_idle = on_idle
+                on_idle = None
+        self._executor.shutdown(wait=False)
+        if on_idle is not None:
+            on_idle()
+
+    def _take_hedge(self) -> bool:
+        with self._lock:
+            if self._budget < 1:
+                return False
+            self._budget -= 1
+            self._hedges += 1
+            return True
+
+    def _timed(self, send: Callable[[int], R], attempt: int, start: float) -> R:
+        result = send(attempt)
+        with self._lock:
+            self._latencies.append(time.monotonic() - start)
+        return result
+
+    def _submit(self, send: Callable[[int], R], attempt: int) -> Optional[Future]:
+        """Sends send(attempt) from one of the hedger's threads. Returns None
+        when no thread is free, or when the hedger is shut down."""
+        with self._lock:
+            if self._closed or self._tasks >= self.max_workers:
+                return None
+            self._tasks += 1
+        start = time.monotonic()
+
+        def run():
+            try:
+                return self._timed(send, attempt, start)
+            finally:
+                self._finish_task()
+
+        try:
+            future = self._executor.submit(run)
+        except RuntimeError:
+            self._finish_task()
+            return None
+        # A task that is cancelled before it starts never runs its finally.
+        future.add_done_callback(lambda f: self._finish_task() if f.cancelled() else None)
+        return future
+
+    def _finish_task(self):
+        with self._lock:
+            self._tasks -= 1
+            on_idle = self._on_idle if self._tasks == 0 else None
+            if on_idle is not None:
+                self._on_idle = None
+        if on_idle is not None:
+            on_idle()
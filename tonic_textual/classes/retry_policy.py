@@ -0,0 +1,121 @@
+import random
+from typing import Iterable, Optional
+
+import requests
+
+
+class RetryPolicy:
+    """Retries requests that fail because of a transient network or gateway
+    error.
+
+    A request is retried when the connection is reset or times out, or when
+    the server responds with one of retry_statuses. Each retry waits for an
+    exponentially growing delay with random jitter, so that clients that
+    failed together do not retry together.
+
+    By default only idempotent requests are retried, which are requests that
+    can be sent twice without side effects: GET requests, text redaction and
+    synthesis, and file downloads. Uploads, parse requests, and requests that
+    create or change objects are not retried, since the server might have
+    processed the first attempt.
+
+    When a request fails after its last attempt, the raised exception has an
+    attempts attribute with the number of attempts that were made.
+
+    Parameters
+    ----------
+    max_attempts : int
+        The maximum number of times a request is sent, including the first
+        attempt. 1 disables retries. The default is 3.
+    initial_backoff : float
+        The delay, in seconds, before the first retry. The default is 0.5.
+    max_backoff : float
+        The longest delay, in seconds, between two attempts. The default is 8.
+    jitter : float
+        The fraction of each delay that is random. 0 gives fixed delays and 1
+        gives delays anywhere between 0 and the full delay. The default is
+        0.5.
+    retry_statuses : Iterable[int]
+        The response statuses that are retried. The default is 502 and 504. 429
+        and 503 are left to a RateLimiter when the client has one.
+    deadline : Optional[float]
+        The total time, in seconds, that a request can take across all of its
+        attempts. No attempt is started, and no read waits, beyond the
+        deadline. The default is None, which has no deadline.
+    retry_non_idempotent : bool
+        Whether requests that are not idempotent are retried too. The default
+        is False.
+
+    Examples
+    --------
+    >>> policy = RetryPolicy(max_attempts=5, deadline=120)
+    >>> textual = TextualNer(client_options=HttpClientOptions(retry_policy=policy))
+    """
+
+    IDEMPOTENT_METHODS = ("GET", "HEAD", "OPTIONS")
+    IDEMPOTENT_POST_PREFIXES = ("/api/redact", "/api/synthesis", "/api/unredact")
+    RETRY_EXCEPTIONS = (
+        requests.exceptions.ConnectionError,
+        requests.exceptions.Timeout,
+        requests.exceptions.ChunkedEncodingError,
+    )
+
+    def __init__(
+        self,
+        max_attempts: int = 3,
+        initial_backoff: float = 0.5,
+        max_backoff: float = 8.0,
+        jitter: float = 0.5,
+        retry_statuses: Iterable[int] = (502, 504),
+        deadline: Optional[float] = None,
+        retry_non_idempotent: bool = False,
+    ):
+        if max_attempts < 1:
+            raise ValueError("max_attempts must be at least 1")
+        if initial_backoff < 0 or max_backoff < initial_backoff:
+            raise ValueError(
+                "initial_backoff must be at least 0, and max_backoff at least initial_backoff"
+            )
+        if not 0 <= jitter <= 1:
+            raise ValueError("jitter must be between 0 and 1")
+        if deadline is not None and deadline <= 0:
+            raise ValueError("deadline must be greater than 0")
+
+        self.max_attempts = max_attempts
+        self.initial_backoff = initial_backoff
+        self.max_backoff = max_backoff
+        self.jitter = jitter
+        self.retry_statuses = frozenset(retry_statuses)
+        self.deadline = deadline
+        self.retry_non_idempotent = retry_non_idempotent
+
+    @classmethod
+    def is_idempotent(cls, method: str, url: str) -> bool:
+        """Returns whether a request can be sent twice without side effects."""
+        path = url.split("?")[0]
+        if method in cls.IDEMPOTENT_METHODS:
+            return True
+        return method == "POST" and (
+            path.startswith(cls.IDEMPOTENT_POST_PREFIXES) or path.endswith("/download")
+        )
+
+    def allows(self, method: str, url: str) -> bool:
+        """Returns whether the policy retries a request."""
+        return (
+            self.max_attempts > 1
+            and (self.retry_non_idempotent or self.is_idempotent(method, url))
+        )
+
+    def should_retry_response(self, response: requests.Response) -> bool:
+        """Returns whether a response has a retryable status."""
+        return response.status_code in self.retry_statuses
+
+    def should_retry_error(self, error: BaseException) -> bool:
+        """Returns whether an error from sending a request is transient."""
+        return isinstance(error, self.RETRY_EXCEPTIONS)
+
+    def backoff(self, attempt: int) -> float:
+        """Returns the delay, in seconds, before the retry that follows the
+        given attempt, where the first attempt is 1."""
+        delay = min(self.max_backoff, self.initial_backoff * 2 ** (attempt - 1))
+        return delay * (1 - self.jitter * random.random())
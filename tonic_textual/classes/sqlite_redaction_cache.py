@@ -0,0 +1,211 @@
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from tonic_textual import __version__
+
+_SELECT_CHUNK_SIZE = 500
+# Access times are only refreshed when they are older than this, so that reads
+# rarely need to write.
+_ACCESS_TIME_RESOLUTION_SECONDS = 60
+
+
+class SqliteRedactionCache:
+    """Persistent cache of redaction results that is stored in a SQLite file.
+
+    The file uses write-ahead logging, so that many processes can read and
+    write the same cache at the same time. Results survive restarts. When the
+    total size of the stored results exceeds max_bytes, the least recently used
+    results are evicted.
+
+    Cache keys include the SDK version and an optional namespace, so that
+    results stored by a different SDK version or namespace are never returned.
+
+    Use this as the backing store of a
+    :class:`RedactionCache<tonic_textual.classes.redaction_cache.RedactionCache>`.
+
+    Parameters
+    ----------
+    path : str
+        The path to the SQLite file. The file is created if it does not exist.
+    max_bytes : int
+        The maximum total size of the stored results. The default is 1 GB.
+    namespace : Optional[str]
+        An optional value to include in every cache key. Change it to
+        invalidate all of the stored results.
+    eviction_interval : int
+        The number of writes between checks of the total size. The default is
+        256.
+
+    Examples
+    --------
+    >>> from tonic_textual.classes.redaction_cache import RedactionCache
+    >>> from tonic_textual.classes.sqlite_redaction_cache import SqliteRedactionCache
+    >>> cache = RedactionCache(backing_store=SqliteRedactionCache("redactions.db"))
+    >>> textual = TextualNer(cache=cache)
+    """
+
+    def __init__(
+        self,
+        path: str,
+        max_bytes: int = 1024 * 1024 * 1024,
+        namespace: Optional[str] = None,
+        eviction_interval: int = 256,
+    ):
+        if max_bytes < 1:
+            raise ValueError("max_bytes must be at least 1")
+        if eviction_interval < 1:
+            raise ValueError("eviction_interval must be at least 1")
+
+        self.path = path
+        self.max_bytes = max_bytes
+        self.namespace = namespace
+        self.eviction_interval = eviction_interval
+        self._key_prefix = f"{__version__}\0{namespace or ''}\0"
+        self._lock = threading.Lock()
+        self._writes_since_eviction = 0
+        self._reset_connections()
+
+        connection = self._connection
+        connection.execute("PRAGMA journal_mode=WAL")
+        with connection:
+            connection.execute(
+                "CREATE TABLE IF NOT EXISTS redaction_cache ("
+                "key TEXT PRIMARY KEY, "
+                "value TEXT NOT NULL, "
+                "size INTEGER NOT NULL, "
+                "accessed_at REAL NOT NULL)"
+            )
+            connection.execute(
+                "CREATE INDEX IF NOT EXISTS redaction_cache_accessed_at "
+                "ON redaction_cache (accessed_at)"
+            )
+        self.evict()
+
+    def _reset_connections(self):
+        self._pid = os.getpid()
+        self._local = threading.local()
+
+    @property
+    def _connection(self) -> sqlite3.Connection:
+        # SQLite connections must not be shared across forks or threads.
+        if self._pid != os.getpid():
+            with self._lock:
+                if self._pid != os.getpid():
+                    self._reset_connections()
+        connection = getattr(self._local, "connection", None)
+        if connection is None:
+            connection = sqlite3.connect(self.path, timeout=30)
+            connection.execute("PRAGMA synchronous=NORMAL")
+            self._local.connection = connection
+        return connection
+
+    def _stored_key(self, key: str) -> str:
+        return hashlib.sha256((self._key_prefix + key).encode("utf-8")).hexdigest()
+
+    def __len__(self):
+        return self._connection.execute(
+            "SELECT COUNT(*) FROM redaction_cache"
+        ).fetchone()[0]
+
+    def get(self, key: str) -> Optional[Any]:
+        """Returns the stored result for key, or None."""
+        return self.get_many([key]).get(key)
+
+    def get_many(self, keys: List[str]) -> Dict[str, Any]:
+        """Returns the stored results for the keys that are found."""
+        stored_keys = {self._stored_key(key): key for key in keys}
+        found = {}
+        stale = []
+        now = time.time()
+        connection = self._connection
+        for chunk in _chunks(list(stored_keys), _SELECT_CHUNK_SIZE):
+            rows = connection.execute(
+                "SELECT key, value, accessed_at FROM redaction_cache "
+                f"WHERE key IN ({','.join('?' * len(chunk))})",
+                chunk,
+            ).fetchall()
+            for stored_key, value, accessed_at in rows:
+                found[stored_keys[stored_key]] = json.loads(value)
+                if accessed_at < now - _ACCESS_TIME_RESOLUTION_SECONDS:
+                    stale.append((now, stored_key))
+
+        if stale:
+            with connection:
+                connection.executemany(
+                    "UPDATE redaction_cache SET accessed_at = ? WHERE key = ?", stale
+                )
+        return found
+
+    def put(self, key: str, value: Any):
+        self.put_many([(key, value)])
+
+    def put_many(self, items: Iterable[Tuple[str, Any]]):
+        now = time.time()
+        rows = []
+        for key, value in items:
+            serialized = json.dumps(value, separators=(",", ":"), ensure_ascii=False)
+            rows.append((self._stored_key(key), serialized, len(serialized), now))
+        if not rows:
+            return
+
+        with self._connection as connection:
+            connection.executemany(
+                "INSERT OR REPLACE INTO redaction_cache (key, value, size, accessed_at) "
+                "VALUES (?, ?, ?, ?)",
+                rows,
+            )
+
+        with self._lock:
+            self._writes_since_eviction += len(rows)
+            should_evict = self._writes_since_eviction >= self.eviction_interval
+            if should_evict:
+                self._writes_since_eviction = 0
+        if should_evict:
+            self.evict()
+
+    def evict(self):
+        """Removes the least recently used results until the total size is at
+        most max_bytes."""
+        connection = self._connection
+        total = connection.execute(
+            "SELECT COALESCE(SUM(size), 0) FROM redaction_cache"
+        ).fetchone()[0]
+        if total <= self.max_bytes:
+            return
+
+        to_delete = []
+        for stored_key, size in connection.execute(
+            "SELECT key, size FROM redaction_cache ORDER BY accessed_at"
+        ):
+            if total <= self.max_bytes:
+                break
+            to_delete.append((stored_key,))
+            total -= size
+
+        with connection:
+            connection.executemany(
+                "DELETE FROM redaction_cache WHERE key = ?", to_delete
+            )
+
+    def clear(self):
+        """Removes all stored results, including those of other SDK versions
+        and namespaces."""
+        with self._connection as connection:
+            connection.execute("DELETE FROM redaction_cache")
+
+    def close(self):
+        """Closes the connection that the calling thread uses."""
+        connection = getattr(self._local, "connection", None)
+        if connection is not None:
+            connection.close()
+            self._local.connection = None
+
+
+def _chunks(items: List, size: int):
+    for start in range(0, len(items), size):
+        yield items[start : start + size]
@@ -171,4 +171,12 @@ class TextualServerBadRequest(RequestException):
         self.message = message
 
     def __str__(self):
-        return self.message
\ No newline at end of file
+        return self.message
+
+class DownloadChecksumMismatch(Exception):
+    """
+    Raised when a downloaded file does not match the expected checksum
+    """
+
+    def __init__(self, msg):
+        super().__init__(msg)
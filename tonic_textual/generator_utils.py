@@ -21,6 +21,9 @@ from tonic_textual.enums.pii_type import PiiType
 
 default_record_options = RecordApiRequestOptions(False, 0, [])
 
+_PII_STATE_NAMES = frozenset(PiiState._member_names_)
+_PII_TYPE_NAMES = frozenset(PiiType._member_names_)
+
 def utf16len(c):
     """Returns the length of the single character 'c'
     in UTF-16 code units."""
@@ -70,14 +73,14 @@ def validate_generator_default_and_config(
     generator_config: Dict[str, Union[PiiState, str]],
     custom_entities: Optional[List[str]] = None
 ) -> None:
-    if generator_default not in PiiState._member_names_:
+    if generator_default not in _PII_STATE_NAMES:
         raise Exception(
             "Invalid value for generator default. "
             "The allowed values are Off, Synthesis, and Redaction."
         )
 
     invalid_keys = [
-        key for key in list(generator_config.keys()) if key not in PiiType._member_names_
+        key for key in generator_config.keys() if key not in _PII_TYPE_NAMES
     ]
 
     if custom_entities is not None:
@@ -92,7 +95,7 @@ def validate_generator_default_and_config(
         )
 
     invalid_values = [
-        value for value in list(generator_config.values()) if value not in PiiState._member_names_
+        value for value in generator_config.values() if value not in _PII_STATE_NAMES
     ]
     if len(invalid_values) > 0:
         raise Exception(
@@ -134,7 +137,7 @@ def validate_generator_metadata(
     custom_entities: Optional[List[str]] = None
 ) -> None:
     invalid_keys = [
-        key for key in list(generator_metadata.keys()) if key not in PiiType._member_names_
+        key for key in generator_metadata.keys() if key not in _PII_TYPE_NAMES
     ]
 
     if custom_entities is not None:
@@ -282,7 +285,7 @@ def convert_payload_to_generator_metadata(
             result[pii] = BaseMetadata.from_payload(payload.get(pii, dict()))
 
     for (pii, metadata) in payload.items():
-        if pii not in PiiType._member_names_:
+        if pii not in _PII_TYPE_NAMES:
             generator = metadata.get("customGenerator", None)
 
             if generator == GeneratorType.Email:
@@ -345,26 +348,31 @@ def generate_redact_payload(
                 for k, v in label_allow_lists.items()
             }
 
-        if record_options is not None and record_options.record:
-            if (
-                    record_options.retention_time_in_hours <= 0
-                    or record_options.retention_time_in_hours > 720
-            ):
-                raise BadArgumentsException(
-                    "The retention time must be set between 1 and 720 hours"
-                )
-
-            record_payload = {
-                "retentionTimeInHours": record_options.retention_time_in_hours,
-                "tags": record_options.tags,
-                "record": True,
-            }
-            payload["recordApiRequestOptions"] = record_payload
-        else:
-            payload["recordApiRequestOptions"] = None
+        payload["recordApiRequestOptions"] = generate_record_options_payload(record_options)
         
         return payload
 
+
+def generate_record_options_payload(
+    record_options: Optional[RecordApiRequestOptions],
+) -> Optional[Dict]:
+    if record_options is None or not record_options.record:
+        return None
+
+    if (
+            record_options.retention_time_in_hours <= 0
+            or record_options.retention_time_in_hours > 720
+    ):
+        raise BadArgumentsException(
+            "The retention time must be set between 1 and 720 hours"
+        )
+
+    return {
+        "retentionTimeInHours": record_options.retention_time_in_hours,
+        "tags": record_options.tags,
+        "record": True,
+    }
+
 def generate_grouping_playload(replacements: List[Replacement], text: str) -> dict:
     """Construct a grouping request from a list of Replacement objects."""
     entities = [replacement_to_grouping_entity(rep, text) for rep in replacements]
@@ -0,0 +1,161 @@
+import random
+from collections import Counter
+from typing import Callable, Dict, Hashable, List, Optional, Sequence
+
+from tonic_textual.classes.common_api_responses.response_field import response_field
+from tonic_textual.classes.redact_api_responses.bulk_redaction_response import (
+    BulkRedactionResponse,
+)
+
+
+class ColumnProfile(dict):
+    """The entity type inferred for a column of values.
+
+    Attributes
+    ----------
+    column : Hashable
+        The name of the column.
+    pii_type : Optional[str]
+        The most common entity type among the sampled values, or None if most
+        of the sampled values are not a single entity.
+    confidence : float
+        The fraction of the sampled values that are a single entity of type
+        pii_type or, when pii_type is None, that are not a single entity. This
+        is 0 when no values were sampled.
+    sample_size : int
+        The number of values that were sampled.
+    structured : bool
+        Whether the confidence is high enough to treat every value in the
+        column as an entity of type pii_type.
+    """
+
+    __slots__ = ()
+
+    def __init__(
+        self,
+        column: Hashable,
+        pii_type: Optional[str],
+        confidence: float,
+        sample_size: int,
+        structured: bool,
+    ):
+        dict.__init__(
+            self,
+            column=column,
+            pii_type=pii_type,
+            confidence=confidence,
+            sample_size=sample_size,
+            structured=structured,
+        )
+
+    column = response_field("column")
+    pii_type = response_field("pii_type")
+    confidence = response_field("confidence")
+    sample_size = response_field("sample_size")
+    structured = response_field("structured")
+
+
+class ColumnProfiler:
+    """A helper class for inferring the entity type of columns of values.
+
+    A sample of the values in each column is sent through NER detection in a
+    single bulk request. A sampled value counts toward an entity type when one
+    detected entity of that type covers most of the value. The most common
+    type in a column is its inferred type. Columns in which enough of the
+    sampled values are that type can be synthesized with the much cheaper
+    structured redaction, instead of NER.
+
+    Parameters
+    ----------
+    sample_size : int
+        The maximum number of non-empty values to sample from each column. The
+        default is 100.
+    min_confidence : float
+        The fraction of the sampled values that must be the inferred entity
+        type for the column to be treated as structured. The default is 0.9.
+    min_coverage : float
+        The fraction of a value's characters that an entity must cover for the
+        value to count as that entity. The default is 0.8.
+    seed : Optional[int]
+        The seed used to choose the sampled values. The default is 0, so that
+        the same columns are always profiled the same way.
+    """
+
+    def __init__(
+        self,
+        sample_size: int = 100,
+        min_confidence: float = 0.9,
+        min_coverage: float = 0.8,
+        seed: Optional[int] = 0,
+    ):
+        if sample_size < 1:
+            raise ValueError("sample_size must be at least 1")
+        if not 0 < min_confidence <= 1:
+            raise ValueError("min_confidence must be greater than 0 and at most 1")
+        if not 0 < min_coverage <= 1:
+            raise ValueError("min_coverage must be greater than 0 and at most 1")
+
+        self.sample_size = sample_size
+        self.min_confidence = min_confidence
+        self.min_coverage = min_coverage
+        self.seed = seed
+
+    def sample(self, values: Sequence) -> List[str]:
+        """Returns up to sample_size of the non-empty string values."""
+        candidates = [
+            v for v in values if isinstance(v, str) and v.strip() != ""
+        ]
+        if len(candidates) <= self.sample_size:
+            return candidates
+        return random.Random(self.seed).sample(candidates, self.sample_size)
+
+    def profile(
+        self,
+        columns: Dict[Hashable, Sequence],
+        redact_bulk_func: Callable[[List[str]], BulkRedactionResponse],
+    ) -> Dict[Hashable, ColumnProfile]:
+        """Infers the entity type of each column.
+
+        Parameters
+        ----------
+        columns: Dict[Hashable, Sequence]
+            The values of each column, by column name.
+
+        redact_bulk_func: Callable[[List[str]], BulkRedactionResponse]
+            The function you use to make the Textual bulk redaction call. For
+            example, lambda x: ner.redact_bulk(x, generator_default="Off").
+
+        Returns
+        -------
+        Dict[Hashable, ColumnProfile]
+            The profile of each column, by column name.
+        """
+        samples = {name: self.sample(values) for name, values in columns.items()}
+        strings = [s for sample in samples.values() for s in sample]
+        response = redact_bulk_func(strings) if strings else None
+
+        profiles = {}
+        offset = 0
+        for name, sample in samples.items():
+            votes = Counter(
+                self._vote(sample[i], response.de_identify_results[offset + i])
+                for i in range(len(sample))
+            )
+            offset += len(sample)
+            pii_type, count = votes.most_common(1)[0] if votes else (None, 0)
+            confidence = count / len(sample) if sample else 0.0
+            profiles[name] = ColumnProfile(
+                name,
+                pii_type,
+                confidence,
+                len(sample),
+                pii_type is not None and confidence >= self.min_confidence,
+            )
+        return profiles
+
+    def _vote(self, value: str, replacements) -> Optional[str]:
+        length = len(value.strip())
+        for replacement in replacements:
+            if replacement.end - replacement.start >= self.min_coverage * length:
+                return replacement.label
+        return None
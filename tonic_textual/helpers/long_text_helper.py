@@ -0,0 +1,283 @@
+import re
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Iterable, Iterator, List, Tuple
+
+from tonic_textual.classes.common_api_responses.replacement import Replacement
+from tonic_textual.classes.redact_api_responses.redaction_response import (
+    RedactionResponse,
+)
+
+_SENTENCE_END = re.compile(r"[.!?]\s")
+_WHITESPACE = re.compile(r"\s")
+# How far past a context boundary to look for whitespace, so that the context
+# does not end in the middle of a word.
+_BOUNDARY_SLACK = 256
+
+
+class _Window:
+    def __init__(self, text: str, offset: int, core_start: int, core_end: int):
+        self.text = text
+        self.offset = offset
+        self.core_start = core_start
+        self.core_end = core_end
+
+
+class LongTextHelper:
+    """A helper class for redacting text that is too long for a single request.
+
+    The text is split into windows that end at line or sentence boundaries.
+    Each window is sent with up to overlap characters of surrounding context on
+    both sides. An entity belongs to the window in which it starts, so an
+    entity that crosses a window boundary is taken whole from the window that
+    contains its start. The results are stitched back together with start,
+    end, new_start, and new_end relative to the full text.
+
+    Parameters
+    ----------
+    window_size : int
+        The target number of characters in each window, not including the
+        context. The default is 100000.
+    overlap : int
+        The number of context characters to send on each side of a window.
+        Entities longer than this may be split at a window boundary. The
+        default is 1000.
+    max_workers : int
+        The number of windows to redact concurrently. The default is 4.
+    """
+
+    def __init__(
+        self, window_size: int = 100000, overlap: int = 1000, max_workers: int = 4
+    ):
+        if window_size < 1:
+            raise ValueError("window_size must be at least 1")
+        if overlap < 0:
+            raise ValueError("overlap must not be negative")
+        if max_workers < 1:
+            raise ValueError("max_workers must be at least 1")
+
+        self.window_size = window_size
+        self.overlap = overlap
+        self.max_workers = max_workers
+
+    def redact(
+        self, text: str, redact_func: Callable[[str], RedactionResponse]
+    ) -> RedactionResponse:
+        """Redacts a long string.
+
+        Parameters
+        ----------
+        text: str
+            The text to redact.
+
+        redact_func: Callable[[str], RedactionResponse]
+            The function you use to make the Textual redaction call. For
+            example, lambda x: ner.redact(x, random_seed=42).
+
+        Returns
+        -------
+        RedactionResponse
+            The redacted text. The usage is the total for all windows, including
+            the context.
+        """
+        redacted = []
+        entities = []
+        usage = 0
+        for piece, replacements, window_usage in self.redact_stream(
+            [text], redact_func
+        ):
+            redacted.append(piece)
+            entities += replacements
+            usage += window_usage
+        return RedactionResponse(text, "".join(redacted), usage, entities)
+
+    def redact_file(
+        self,
+        path: str,
+        out_path: str,
+        redact_func: Callable[[str], RedactionResponse],
+        encoding: str = "utf-8",
+        read_size: int = 1024 * 1024,
+    ) -> int:
+        """Redacts a text file and writes the result to out_path. The file is
+        read and written incrementally, so memory use does not depend on the
+        file size.
+
+        Parameters
+        ----------
+        path: str
+            The path of the text file to redact.
+
+        out_path: str
+            The path of the redacted file to write.
+
+        redact_func: Callable[[str], RedactionResponse]
+            The function you use to make the Textual redaction call.
+
+        encoding: str
+            The encoding of both files. The default is utf-8.
+
+        read_size: int
+            The number of characters to read at a time. The default is 1048576.
+
+        Returns
+        -------
+        int
+            The total usage for all windows.
+        """
+        usage = 0
+        with open(path, "r", encoding=encoding, newline="") as source, open(
+            out_path, "w", encoding=encoding, newline=""
+        ) as target:
+            chunks = iter(lambda: source.read(read_size), "")
+            for piece, _, window_usage in self.redact_stream(chunks, redact_func):
+                target.write(piece)
+                usage += window_usage
+        return usage
+
+    def redact_stream(
+        self,
+        chunks: Iterable[str],
+        redact_func: Callable[[str], RedactionResponse],
+    ) -> Iterator[Tuple[str, List[Replacement], int]]:
+        """Redacts text that is provided as a sequence of chunks. For each
+        window, in order, yields the redacted text, the entities with offsets
+        relative to the full text, and the usage."""
+        cursor = 0
+        new_position = 0
+        pending = deque()
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            for window in self._iter_windows(chunks):
+                pending.append((window, executor.submit(redact_func, window.text)))
+                if len(pending) < 2 * self.max_workers:
+                    continue
+                window, future = pending.popleft()
+                piece, replacements, cursor, new_position = self._stitch(
+                    window, future.result(), cursor, new_position
+                )
+                yield piece, replacements, future.result().usage
+
+            while pending:
+                window, future = pending.popleft()
+                piece, replacements, cursor, new_position = self._stitch(
+                    window, future.result(), cursor, new_position
+                )
+                yield piece, replacements, future.result().usage
+
+    def _iter_windows(self, chunks: Iterable[str]) -> Iterator[_Window]:
+        chunks = iter(chunks)
+        buffer = ""
+        buffer_start = 0
+        core_start = 0
+        at_end = False
+        while True:
+            needed = core_start + self.window_size + self.overlap + _BOUNDARY_SLACK
+            while not at_end and buffer_start + len(buffer) < needed:
+                chunk = next(chunks, None)
+                if chunk is None:
+                    at_end = True
+                else:
+                    buffer += chunk
+            buffer_end = buffer_start + len(buffer)
+            if core_start >= buffer_end:
+                return
+
+            if at_end and buffer_end - core_start <= self.window_size:
+                core_end = buffer_end
+            else:
+                core_end = buffer_start + self._find_boundary(
+                    buffer, core_start - buffer_start
+                )
+
+            context_start = self._align_start(
+                buffer, max(buffer_start, core_start - self.overlap) - buffer_start,
+                core_start - buffer_start,
+            )
+            context_end = self._align_end(
+                buffer, min(buffer_end, core_end + self.overlap) - buffer_start
+            )
+            yield _Window(
+                buffer[context_start:context_end],
+                buffer_start + context_start,
+                core_start,
+                core_end,
+            )
+
+            core_start = core_end
+            drop = max(0, core_start - self.overlap - buffer_start)
+            buffer = buffer[drop:]
+            buffer_start += drop
+
+    def _find_boundary(self, buffer: str, start: int) -> int:
+        """Returns the end of the window that starts at start, preferring a line
+        end, then a sentence end, then whitespace in the second half of the
+        window."""
+        end = start + self.window_size
+        low = start + self.window_size // 2
+        newline = buffer.rfind("\n", low, end)
+        if newline != -1:
+            return newline + 1
+        sentence_ends = list(_SENTENCE_END.finditer(buffer, low, end))
+        if sentence_ends:
+            return sentence_ends[-1].end()
+        whitespace = buffer.rfind(" ", low, end)
+        if whitespace != -1:
+            return whitespace + 1
+        return end
+
+    @staticmethod
+    def _align_start(buffer: str, position: int, core_start: int) -> int:
+        if position == 0:
+            return 0
+        match = _WHITESPACE.search(buffer, position, core_start)
+        return match.end() if match else position
+
+    @staticmethod
+    def _align_end(buffer: str, position: int) -> int:
+        match = _WHITESPACE.search(buffer, position, position + _BOUNDARY_SLACK)
+        return match.start() if match else min(len(buffer), position)
+
+    @staticmethod
+    def _stitch(
+        window: _Window, response: RedactionResponse, cursor: int, new_position: int
+    ) -> Tuple[str, List[Replacement], int, int]:
+        """Returns the redacted text for the part of the window between cursor
+        and the end of its core, the entities that start in that part, and the
+        updated cursor and position in the redacted text."""
+        pieces = []
+        replacements = []
+        for entity in sorted(response.de_identify_results, key=lambda e: e.start):
+            start = window.offset + entity.start
+            end = window.offset + entity.end
+            if start < max(cursor, window.core_start) or start >= window.core_end:
+                continue
+
+            gap = window.text[cursor - window.offset : entity.start]
+            new_text = response.redacted_text[entity.new_start : entity.new_end]
+            pieces.append(gap)
+            new_start = new_position + len(gap)
+            new_position = new_start + len(new_text)
+            pieces.append(new_text)
+            replacements.append(
+                Replacement(
+                    start,
+                    end,
+                    new_start,
+                    new_position,
+                    entity.label,
+                    entity.text,
+                    entity.score,
+                    entity.language,
+                    entity.new_text,
+                    entity.example_redaction,
+                )
+            )
+            cursor = end
+
+        if cursor < window.core_end:
+            gap = window.text[cursor - window.offset : window.core_end - window.offset]
+            pieces.append(gap)
+            new_position += len(gap)
+            cursor = window.core_end
+
+        return "".join(pieces), replacements, cursor, new_position
@@ -3,7 +3,9 @@ import json
 import os
 from typing import Optional
 
+from tonic_textual.classes.http_client_options import HttpClientOptions
 from tonic_textual.classes.httpclient import HttpClient
+from tonic_textual.classes.multipart_encoder import SizedReader
 from tonic_textual.classes.parse_api_responses.file_parse_result import FileParseResult
 
 
@@ -20,6 +22,9 @@ class TextualParse:
         value of TEXTUAL_API_KEY.
     verify: bool
         Whether to verify SSL certification verification. By default, this is enabled.
+    client_options: Optional[HttpClientOptions]
+        Optional connection pooling and keep-alive settings. All requests made
+        through this object share one pool of keep-alive connections.
     Examples
     --------
     >>> from tonic_textual.parse_api import TextualParse
@@ -31,6 +36,7 @@ class TextualParse:
         base_url: str = "https://textual.tonic.ai",
         api_key: Optional[str] = None,
         verify: bool = True,
+        client_options: Optional[HttpClientOptions] = None,
     ):
         if api_key is None:
             api_key = os.environ.get("TONIC_TEXTUAL_API_KEY")
@@ -42,7 +48,7 @@ class TextualParse:
                 )
 
         self.api_key = api_key
-        self.client = HttpClient(base_url, self.api_key, verify)
+        self.client = HttpClient(base_url, self.api_key, verify, client_options)
         self.verify = verify
 
     def parse_file(
@@ -53,7 +59,10 @@ class TextualParse:
         Parameters
         ----------
         file: io.IOBase
-            The opened file, available for reading, to parse.
+            The opened file, available for reading, to parse. The file is
+            streamed to Textual in chunks, without reading it into memory. To
+            stream a source that cannot seek, such as a network response, wrap
+            it in a SizedReader with its length.
         file_name: str
             The name of the file.
         timeout: Optional[int]
@@ -81,7 +90,7 @@ class TextualParse:
         file_parse_result = response["fileParseResult"]
 
         return FileParseResult(
-            file_parse_result, self.client, document=json.loads(document)
+            file_parse_result, self.client, document=self.client.codec.loads(document)
         )
 
     def parse_s3_file(
@@ -110,7 +119,11 @@ class TextualParse:
         obj = s3.Object(bucket, key)
 
         file_name = key.split("/")[-1]
-        return self.parse_file(obj.get()["Body"].read(), file_name, timeout=timeout)
+        response = obj.get()
+        # The object is streamed from Amazon S3 to Textual without being
+        # buffered in memory.
+        body = SizedReader(response["Body"], response["ContentLength"], file_name)
+        return self.parse_file(body, file_name, timeout=timeout)
 
 
 class TonicTextualParse(TextualParse):
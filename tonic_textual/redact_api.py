@@ -1,24 +1,62 @@
+import glob
 import io
 import json
 import os
-from time import sleep
-from typing import Dict, List, Optional, Union
+import threading
+import time
+from concurrent.futures import Executor, Future, ThreadPoolExecutor
+from typing import BinaryIO, Callable, Dict, List, Optional, Tuple, Union
 from urllib.parse import urlencode
 from warnings import warn
 import requests
+from tqdm import tqdm
+from tonic_textual.batch_utils import (
+    dedupe_strings,
+    expand_bulk_redaction_response,
+    failed_bulk_redaction_response,
+    is_poison_error,
+    is_server_error,
+    merge_bulk_redaction_responses,
+    redaction_failure,
+    run_concurrently,
+    split_into_batches,
+)
 from tonic_textual.classes.common_api_responses.replacement import Replacement
 from tonic_textual.classes.dataset import Dataset
 from tonic_textual.classes.datasetfile import DatasetFile
 from tonic_textual.classes.generator_metadata.base_metadata import BaseMetadata
+from tonic_textual.classes.http_client_options import HttpClientOptions
 from tonic_textual.classes.httpclient import HttpClient
+from tonic_textual.classes.concurrency_governor import ConcurrencyGovernor
+from tonic_textual.classes.job_poller import (
+    NOT_READY,
+    JobPoller,
+    file_not_ready_error,
+    retries_to_timeout,
+    run_when_ready,
+)
 from tonic_textual.classes.llm_synthesis.llm_grouping_models import GroupResponse, LlmGrouping
 from tonic_textual.classes.record_api_request_options import RecordApiRequestOptions
 from tonic_textual.classes.redact_api_responses.bulk_redaction_response import (
     BulkRedactionResponse,
 )
+from tonic_textual.classes.redact_api_responses.bulk_redaction_spans import (
+    BulkRedactionSpans,
+)
+from tonic_textual.classes.redact_api_responses.file_redaction_report import (
+    FileRedactionReport,
+    FileRedactionResult,
+)
+from tonic_textual.classes.redact_api_responses.json_batch_redaction_response import (
+    JsonBatchRedactionResponse,
+)
 from tonic_textual.classes.redact_api_responses.redaction_response import (
     RedactionResponse,
 )
+from tonic_textual.classes.redaction_cache import RedactionCache, make_cache_key
+from tonic_textual.classes.redaction_config import RedactionConfig, payload_with_fields
+from tonic_textual.classes.redaction_coalescer import RedactionCoalescer
+from tonic_textual.classes.request_hedger import RequestHedger
 from tonic_textual.classes.tonic_exception import (
     DatasetNameAlreadyExists,
     FileNotReadyForDownload,
@@ -28,8 +66,10 @@ from tonic_textual.classes.audio.redact_audio_responses import (
     TranscriptionResult
 )
 from tonic_textual.enums.pii_state import PiiState
-from tonic_textual.generator_utils import generate_grouping_playload, validate_generator_default_and_config, default_record_options, \
-    generate_redact_payload, validate_generator_metadata
+from tonic_textual.generator_utils import generate_grouping_playload, default_record_options, \
+    generate_record_options_payload
+from tonic_textual.helpers.column_profiler import ColumnProfile, ColumnProfiler
+from tonic_textual.helpers.long_text_helper import LongTextHelper
 from tonic_textual.services.dataset import DatasetService
 from tonic_textual.services.datasetfile import DatasetFileService
 from tonic_textual.services.model_entity import ModelEntityService
@@ -48,6 +88,17 @@ class TextualNer:
         value of TONIC_TEXTUAL_API_KEY.
     verify: bool
         Whether to verify SSL certification. By default, this is enabled.
+    client_options: Optional[HttpClientOptions]
+        Optional connection pooling and keep-alive settings. All requests made
+        through this object share one pool of keep-alive connections.
+    cache: Optional[RedactionCache]
+        Optional cache of redaction results. Only requests that provide a
+        random_seed are cached. By default, results are not cached.
+    concurrency_governor: Optional[ConcurrencyGovernor]
+        Optional governor that adapts how many requests batch methods, such as
+        redact_bulk and redact_files, send at the same time, based on the
+        latency and errors of the server. When provided, it replaces the fixed
+        max_workers of those methods. By default, max_workers is used.
     Examples
     --------
     >>> from tonic_textual.redact_api import TextualNer
@@ -59,6 +110,9 @@ class TextualNer:
         base_url: str = "https://textual.tonic.ai",
         api_key: Optional[str] = None,
         verify: bool = True,
+        client_options: Optional[HttpClientOptions] = None,
+        cache: Optional[RedactionCache] = None,
+        concurrency_governor: Optional[ConcurrencyGovernor] = None,
     ):
         if api_key is None:
             api_key = os.environ.get("TONIC_TEXTUAL_API_KEY")
@@ -70,11 +124,16 @@ class TextualNer:
                 )
 
         self.api_key = api_key
-        self.client = HttpClient(base_url, self.api_key, verify)
+        self.client = HttpClient(base_url, self.api_key, verify, client_options)
         self.dataset_service = DatasetService(self.client)
         self.datasetfile_service = DatasetFileService(self.client)
         self.model_entity_service = ModelEntityService(self.client)
         self.verify = verify
+        self.redaction_coalescer: Optional[RedactionCoalescer] = None
+        self._redact_hedging: Optional[Tuple[RequestHedger, HttpClient]] = None
+        self.cache = cache
+        self.job_poller = JobPoller.default()
+        self.concurrency_governor = concurrency_governor
 
     def create_dataset(self, dataset_name: str):
         """Creates a dataset. A dataset is a collection of 1 or more files for Tonic
@@ -338,6 +397,131 @@ class TextualNer:
             stacklevel=1,
         )        
     
+    def enable_redact_coalescing(
+        self, max_batch_size: int = 64, max_wait_seconds: float = 0.005
+    ):
+        """Combines concurrent calls to redact into bulk requests.
+
+        When coalescing is enabled, calls to redact from different threads that
+        use the same configuration and random seed are sent together as a single
+        bulk request. Each call still returns its own RedactionResponse. Calls
+        that record the API request are always sent individually.
+
+        The server reports usage for the whole bulk request, so the usage of
+        each coalesced call is its share of that usage, in proportion to the
+        word count of its string.
+
+        Parameters
+        ----------
+        max_batch_size : int
+            The maximum number of strings in a bulk request. The default is 64.
+
+        max_wait_seconds : float
+            The maximum time that a call waits for other calls to join its
+            bulk request. The default is 0.005 seconds.
+
+        Examples
+        --------
+            >>> textual.enable_redact_coalescing(max_batch_size=100)
+            >>> with ThreadPoolExecutor(max_workers=32) as executor:
+            >>>     results = list(executor.map(textual.redact, texts))
+        """
+        self.redaction_coalescer = RedactionCoalescer(
+            lambda payload, random_seed: self.send_redact_bulk_request(
+                "/api/redact/bulk", payload, random_seed
+            ),
+            max_batch_size,
+            max_wait_seconds,
+        )
+
+    def disable_redact_coalescing(self):
+        """Sends each call to redact as its own request."""
+        self.redaction_coalescer = None
+
+    def enable_redact_hedging(
+        self,
+        percentile: float = 95.0,
+        max_hedge_ratio: float = 0.05,
+        alternate_base_url: Optional[str] = None,
+        initial_delay: float = 0.1,
+        max_workers: int = 32,
+    ):
+        """Sends a second copy of slow redaction requests, and uses whichever
+        copy answers first.
+
+        Hedging applies to calls to redact, redact_json, redact_xml, and
+        redact_html that pass a random_seed, so that both copies return the
+        same result, and that do not record the API request. When such a call
+        has not answered within the given percentile of recent latencies, a
+        copy is sent, and the first answer is returned. The slower copy is
+        cancelled if it has not started, and otherwise its answer is
+        discarded. Calls that are coalesced into bulk requests are not hedged.
+
+        Parameters
+        ----------
+        percentile : float
+            The percentile of recent latencies after which a call is hedged.
+            The default is 95.
+
+        max_hedge_ratio : float
+            The largest fraction of calls that are hedged, which bounds the
+            extra load on the server. The default is 0.05.
+
+        alternate_base_url : Optional[str]
+            The URL of another Textual instance to which the copies are sent.
+            The default is None, which sends the copies to the same instance.
+
+        initial_delay : float
+            The time, in seconds, after which a call is hedged until enough
+            latencies have been measured. The default is 0.1.
+
+        max_workers : int
+            The largest number of requests that are sent from the hedger's
+            threads at a time. Calls beyond that are sent from the caller's
+            thread and are not hedged. The default is 32.
+
+        Examples
+        --------
+            >>> textual.enable_redact_hedging(percentile=99, max_hedge_ratio=0.02)
+            >>> textual.redact("John Smith is a person", random_seed=42)
+        """
+        hedge_client = self.client
+        if alternate_base_url is not None:
+            hedge_client = HttpClient(
+                alternate_base_url, self.api_key, self.verify, self.client.options
+            )
+        hedger = RequestHedger(
+            percentile=percentile,
+            initial_delay=initial_delay,
+            max_hedge_ratio=max_hedge_ratio,
+            max_workers=max_workers,
+        )
+        self._swap_redact_hedging((hedger, hedge_client))
+
+    def disable_redact_hedging(self):
+        """Sends each redaction request once. Calls that are in progress
+        finish with the hedging that they started with."""
+        self._swap_redact_hedging(None)
+
+    @property
+    def redaction_hedger(self) -> Optional[RequestHedger]:
+        """The hedger of redaction calls, or None when hedging is disabled."""
+        hedging = self._redact_hedging
+        return None if hedging is None else hedging[0]
+
+    def _swap_redact_hedging(
+        self, hedging: Optional[Tuple[RequestHedger, HttpClient]]
+    ):
+        # Calls read the hedger and its client together, once, so replacing
+        # the pair is atomic. The old hedger drains, and its client is closed
+        # once no hedge uses it.
+        old, self._redact_hedging = self._redact_hedging, hedging
+        if old is not None:
+            hedger, hedge_client = old
+            hedger.shutdown(
+                None if hedge_client is self.client else hedge_client.close
+            )
+
     def redact(
         self,
         string: str,
@@ -349,6 +533,7 @@ class TextualNer:
         label_allow_lists: Optional[Dict[str, List[str]]] = None,
         record_options: RecordApiRequestOptions = default_record_options,
         custom_entities: Optional[List[str]] = None,
+        config: Optional[RedactionConfig] = None,
     ) -> RedactionResponse:
         """Redacts a string. Depending on the configured handling for each sensitive
         data type, values are either redacted, synthesized, or ignored.
@@ -399,6 +584,11 @@ class TextualNer:
             config. Custom entity types will respect generator defaults if they
             are not specified in the generator config.
 
+        config: Optional[RedactionConfig] = None
+            A validated, reusable configuration. When provided, it is used
+            instead of generator_default, generator_config, generator_metadata,
+            label_block_lists, label_allow_lists, and custom_entities.
+
         Returns
         -------
         RedactionResponse
@@ -422,20 +612,155 @@ class TextualNer:
 
         """
 
-        payload = generate_redact_payload(
+        config = self._resolve_config(
+            config,
             generator_default,
             generator_config,
             generator_metadata,
             label_block_lists,
             label_allow_lists,
-            record_options,
-            custom_entities
+            custom_entities,
         )
+        record_payload = generate_record_options_payload(record_options)
 
-        payload["text"] = string
+        coalescer = self.redaction_coalescer
+        if coalescer is not None and record_payload is None:
+            return coalescer.redact(
+                string, config.to_payload(recordApiRequestOptions=None), random_seed
+            )
+
+        payload = config.to_payload(
+            recordApiRequestOptions=record_payload, text=string
+        )
 
         return self.send_redact_request("/api/redact", payload, random_seed)
 
+    @staticmethod
+    def _resolve_config(
+        config: Optional[RedactionConfig],
+        generator_default: Union[PiiState, str],
+        generator_config: Dict[str, Union[PiiState, str]],
+        generator_metadata: Dict[str, BaseMetadata],
+        label_block_lists: Optional[Dict[str, List[str]]],
+        label_allow_lists: Optional[Dict[str, List[str]]],
+        custom_entities: Optional[List[str]],
+    ) -> RedactionConfig:
+        if config is not None:
+            return config
+        return RedactionConfig(
+            generator_default,
+            generator_config,
+            generator_metadata,
+            label_block_lists,
+            label_allow_lists,
+            custom_entities,
+        )
+
+    def redact_long_text(
+        self,
+        text: str,
+        window_size: int = 100000,
+        overlap: int = 1000,
+        max_workers: int = 4,
+        **kwargs,
+    ) -> RedactionResponse:
+        """Redacts a string that is too long for a single request.
+
+        The text is split into windows that end at line or sentence boundaries,
+        and the windows are redacted concurrently. Each window is sent with
+        overlap characters of context on each side, so that entities that cross
+        a window boundary are detected whole. The entity offsets in the response
+        are relative to the full text.
+
+        Parameters
+        ----------
+        text : str
+            The string to redact.
+
+        window_size: int = 100000
+            The target number of characters in each window.
+
+        overlap: int = 1000
+            The number of context characters to send on each side of a window.
+
+        max_workers: int = 4
+            The number of windows to redact concurrently.
+
+        **kwargs
+            Additional arguments to pass to
+            :meth:`redact<tonic_textual.redact_api.TextualNer.redact>`, such as
+            generator_config. Provide a random_seed to keep synthesized values
+            consistent across windows.
+
+        Returns
+        -------
+        RedactionResponse
+            The redacted string along with ancillary information. The usage is
+            the total for all windows, including the context.
+
+        Examples
+        --------
+            >>> with open("transcript.txt") as f:
+            >>>     response = textual.redact_long_text(f.read(), random_seed=42)
+        """
+        helper = LongTextHelper(window_size, overlap, max_workers)
+        return helper.redact(text, lambda window: self.redact(window, **kwargs))
+
+    def redact_text_file(
+        self,
+        path: str,
+        out_path: str,
+        window_size: int = 100000,
+        overlap: int = 1000,
+        max_workers: int = 4,
+        encoding: str = "utf-8",
+        **kwargs,
+    ) -> int:
+        """Redacts a text file of any size and writes the redacted text to
+        out_path.
+
+        The file is read, redacted, and written incrementally in windows, as
+        in :meth:`redact_long_text<tonic_textual.redact_api.TextualNer.redact_long_text>`,
+        so memory use does not depend on the file size.
+
+        Parameters
+        ----------
+        path : str
+            The path of the text file to redact.
+
+        out_path : str
+            The path of the redacted file to write.
+
+        window_size: int = 100000
+            The target number of characters in each window.
+
+        overlap: int = 1000
+            The number of context characters to send on each side of a window.
+
+        max_workers: int = 4
+            The number of windows to redact concurrently.
+
+        encoding: str = "utf-8"
+            The encoding of both files.
+
+        **kwargs
+            Additional arguments to pass to
+            :meth:`redact<tonic_textual.redact_api.TextualNer.redact>`.
+
+        Returns
+        -------
+        int
+            The total usage for all windows.
+
+        Examples
+        --------
+            >>> textual.redact_text_file("server.log", "server_redacted.log", random_seed=42)
+        """
+        helper = LongTextHelper(window_size, overlap, max_workers)
+        return helper.redact_file(
+            path, out_path, lambda window: self.redact(window, **kwargs), encoding
+        )
+
     def redact_bulk(
         self,
         strings: List[str],
@@ -446,6 +771,13 @@ class TextualNer:
         label_block_lists: Optional[Dict[str, List[str]]] = None,
         label_allow_lists: Optional[Dict[str, List[str]]] = None,
         custom_entities: Optional[List[str]] = None,
+        max_batch_chars: Optional[int] = None,
+        max_batch_size: Optional[int] = None,
+        max_workers: int = 4,
+        dedupe: bool = False,
+        config: Optional[RedactionConfig] = None,
+        span_format: str = "replacements",
+        isolate_failures: bool = False,
     ) -> BulkRedactionResponse:
         """Redacts a string. Depending on the configured handling for each sensitive
         data type, values are either redacted, synthesized, or ignored.
@@ -491,10 +823,56 @@ class TextualNer:
             config. Custom entity types will respect generator defaults if they
             are not specified in the generator config.
 
+        max_batch_chars: Optional[int] = None
+            When set, the strings are split into batches of at most this many
+            characters, and each batch is sent as a separate request. Use this
+            for inputs that are too large for a single request. A string that
+            is longer than this limit is sent in a batch of its own.
+
+        max_batch_size: Optional[int] = None
+            When set, the strings are split into batches of at most this many
+            strings.
+
+        max_workers: int = 4
+            The number of batches to send concurrently when the strings are
+            split into batches. Provide a random_seed to keep synthesized values
+            consistent across batches.
+
+        dedupe: bool = False
+            When True, each distinct string is sent only once, and the results
+            are copied to every position where the string occurs. Repeated
+            strings then always get the same synthesized value. The usage
+            covers only the distinct strings.
+
+        config: Optional[RedactionConfig] = None
+            A validated, reusable configuration. When provided, it is used
+            instead of generator_default, generator_config, generator_metadata,
+            label_block_lists, label_allow_lists, and custom_entities.
+
+        span_format: str = "replacements"
+            How the named entities are returned. "replacements" returns a list
+            of Replacement objects for each string in de_identify_results.
+            "columnar" returns the entities as parallel arrays in spans, which
+            uses much less memory for large inputs. "none" returns only the
+            redacted strings.
+
+        isolate_failures: bool = False
+            When True, a batch that the server rejects with a 400 or 500 error
+            is split in halves, which are sent again, until the strings that
+            cause the error are isolated. The other strings are redacted as
+            usual, and each string that fails is listed in the failures of the
+            response, and has None as its redacted text. A batch with one
+            failing string takes about 2 * log2(batch size) extra requests.
+            A 500 error is retried once first, and when both halves of the
+            batch also fail with a 500 error, the server is treated as down
+            and the error is raised. When False, the error is raised.
+
         Returns
         -------
-        RedactionResponse
-            The redacted string along with ancillary information.
+        BulkRedactionResponse
+            The redacted strings along with ancillary information. When the
+            strings are split into batches, the results are returned in the
+            original order, and the usage is the total for all batches.
 
         Examples
         --------
@@ -512,22 +890,564 @@ class TextualNer:
             >>> )
         """
 
-        validate_generator_default_and_config(generator_default, generator_config, custom_entities)
-
-        validate_generator_metadata(generator_metadata, custom_entities)
-
-        payload = generate_redact_payload(
+        config = self._resolve_config(
+            config,
             generator_default,
             generator_config,
             generator_metadata,
             label_block_lists,
             label_allow_lists,
-            None,
-            custom_entities
+            custom_entities,
+        )
+        payload = config.to_payload(recordApiRequestOptions=None)
+
+        if dedupe:
+            distinct, positions = dedupe_strings(strings)
+            if len(distinct) < len(strings):
+                response = self._send_redact_bulk_batches(
+                    distinct,
+                    payload,
+                    random_seed,
+                    max_batch_chars,
+                    max_batch_size,
+                    max_workers,
+                    span_format,
+                    isolate_failures,
+                )
+                return expand_bulk_redaction_response(response, positions)
+
+        return self._send_redact_bulk_batches(
+            strings,
+            payload,
+            random_seed,
+            max_batch_chars,
+            max_batch_size,
+            max_workers,
+            span_format,
+            isolate_failures,
+        )
+
+    def _send_redact_bulk_batches(
+        self,
+        strings: List[str],
+        payload: Dict,
+        random_seed: Optional[int],
+        max_batch_chars: Optional[int],
+        max_batch_size: Optional[int],
+        max_workers: int,
+        span_format: str = "replacements",
+        isolate_failures: bool = False,
+    ) -> BulkRedactionResponse:
+        def send(batch_strings: List[str]) -> BulkRedactionResponse:
+            if isolate_failures:
+                return self._send_redact_bulk_isolating(
+                    batch_strings, payload, random_seed, span_format
+                )
+            return self.send_redact_bulk_request(
+                "/api/redact/bulk",
+                payload_with_fields(payload, bulkText=batch_strings),
+                random_seed,
+                span_format,
+            )
+
+        batches = split_into_batches(strings, max_batch_chars, max_batch_size)
+        if len(batches) <= 1:
+            return send(strings)
+
+        def send_batch(batch):
+            start, end = batch
+            return send(strings[start:end])
+
+        responses = run_concurrently(
+            send_batch, batches, max_workers, self.concurrency_governor
+        )
+        return merge_bulk_redaction_responses(responses)
+
+    def _send_redact_bulk_isolating(
+        self,
+        strings: List[str],
+        payload: Dict,
+        random_seed: Optional[int],
+        span_format: str,
+    ) -> BulkRedactionResponse:
+        """Sends the strings in one request. When the server cannot redact
+        them, sends each half of the strings separately, until the strings
+        that fail are isolated.
+
+        A 5xx response is retried once before the strings are split. If both
+        halves then also fail with a 5xx response, the server is more likely
+        down than unable to redact the strings, so the error is raised instead
+        of sending a request for every string."""
+
+        def send(batch: List[str]) -> BulkRedactionResponse:
+            return self.send_redact_bulk_request(
+                "/api/redact/bulk",
+                payload_with_fields(payload, bulkText=batch),
+                random_seed,
+                span_format,
+            )
+
+        try:
+            try:
+                response = send(strings)
+            except Exception as e:
+                if not is_server_error(e):
+                    raise
+                response = send(strings)
+        except Exception as e:
+            if not is_poison_error(e):
+                raise
+            if len(strings) == 1 or not is_server_error(e):
+                return self._isolate_redact_bulk_failures(strings, e, send, span_format)
+
+            middle = len(strings) // 2
+            halves = [strings[:middle], strings[middle:]]
+            results = []
+            for half in halves:
+                try:
+                    results.append(send(half))
+                except Exception as half_error:
+                    if not is_poison_error(half_error):
+                        raise
+                    results.append(half_error)
+            if all(isinstance(r, Exception) and is_server_error(r) for r in results):
+                raise e
+            return merge_bulk_redaction_responses(
+                [
+                    self._isolate_redact_bulk_failures(half, r, send, span_format)
+                    if isinstance(r, Exception)
+                    else self._without_failures(r)
+                    for half, r in zip(halves, results)
+                ]
+            )
+        return self._without_failures(response)
+
+    def _isolate_redact_bulk_failures(
+        self,
+        strings: List[str],
+        error: Exception,
+        send: Callable[[List[str]], BulkRedactionResponse],
+        span_format: str,
+    ) -> BulkRedactionResponse:
+        """Splits strings that failed to redact with error into halves, and
+        sends each half, until the strings that fail are isolated."""
+        if len(strings) == 1:
+            return failed_bulk_redaction_response(strings[0], error, span_format)
+        middle = len(strings) // 2
+        responses = []
+        for half in (strings[:middle], strings[middle:]):
+            try:
+                responses.append(self._without_failures(send(half)))
+            except Exception as e:
+                if not is_poison_error(e):
+                    raise
+                responses.append(
+                    self._isolate_redact_bulk_failures(half, e, send, span_format)
+                )
+        return merge_bulk_redaction_responses(responses)
+
+    @staticmethod
+    def _without_failures(response: BulkRedactionResponse) -> BulkRedactionResponse:
+        response.failures = []
+        return response
+
+    def redact_series(
+        self,
+        series,
+        max_batch_chars: Optional[int] = None,
+        max_batch_size: Optional[int] = 1000,
+        max_workers: int = 4,
+        include_spans: bool = False,
+        **kwargs,
+    ):
+        """Redacts a pandas Series of free text.
+
+        Null and empty values are left unchanged and are not sent. Each
+        distinct value is sent only once, and the values are sent in
+        concurrent batches.
+
+        Parameters
+        ----------
+        series : pd.Series
+            The values to redact.
+
+        max_batch_chars: Optional[int] = None
+            The maximum number of characters in each batch.
+
+        max_batch_size: Optional[int] = 1000
+            The maximum number of values in each batch.
+
+        max_workers: int = 4
+            The number of batches to send concurrently.
+
+        include_spans: bool = False
+            When True, also returns the detected entities.
+
+        **kwargs
+            Additional arguments to pass to
+            :meth:`redact_bulk<tonic_textual.redact_api.TextualNer.redact_bulk>`,
+            such as generator_config, random_seed, or config.
+            dedupe, span_format, and isolate_failures are set by this method
+            and raise a TypeError.
+
+        Returns
+        -------
+        pd.Series or Tuple[pd.Series, pd.DataFrame]
+            A new series with the redacted values. When include_spans is True,
+            also returns a dataframe with one row per entity and the columns
+            row, start, end, new_start, new_end, label, and score. The row
+            column holds the index label of the value, and the label column is
+            categorical.
+
+        Examples
+        --------
+            >>> df["notes"] = textual.redact_series(df["notes"], random_seed=42)
+        """
+        self._reject_reserved_kwargs(
+            "redact_series", kwargs, ("dedupe", "span_format", "isolate_failures")
+        )
+        redacted, spans = self._redact_pandas_columns(
+            [series],
+            [0],
+            series.index,
+            max_batch_chars,
+            max_batch_size,
+            max_workers,
+            include_spans,
+            kwargs,
+        )
+        if not include_spans:
+            return redacted[0]
+        return redacted[0], spans.drop(columns="column")
+
+    def redact_dataframe(
+        self,
+        df,
+        columns: List[str],
+        max_batch_chars: Optional[int] = None,
+        max_batch_size: Optional[int] = 1000,
+        max_workers: int = 4,
+        include_spans: bool = False,
+        pii_types: Optional[Dict[str, str]] = None,
+        infer_pii_types: bool = False,
+        **kwargs,
+    ):
+        """Redacts free text columns of a pandas DataFrame.
+
+        The values of all of the columns are redacted together. Null and empty
+        values are left unchanged and are not sent. Each distinct value is sent
+        only once, and the values are sent in concurrent batches.
+
+        Columns that hold a single entity type in every row, such as email
+        addresses, can instead use structured redaction, which skips NER
+        detection. Provide their entity types in pii_types, or set
+        infer_pii_types to infer them with
+        :meth:`profile_columns<tonic_textual.redact_api.TextualNer.profile_columns>`.
+        A structured column is synthesized when its entity type is configured
+        for synthesis, and left unchanged when its entity type is turned off.
+        Otherwise, it is redacted with NER like the other columns.
+
+        Parameters
+        ----------
+        df : pd.DataFrame
+            The dataframe to redact.
+
+        columns: List[str]
+            The names of the columns to redact.
+
+        max_batch_chars: Optional[int] = None
+            The maximum number of characters in each batch.
+
+        max_batch_size: Optional[int] = 1000
+            The maximum number of values in each batch.
+
+        max_workers: int = 4
+            The number of batches to send concurrently.
+
+        include_spans: bool = False
+            When True, also returns the detected entities.
+
+        pii_types: Optional[Dict[str, str]] = None
+            The entity type of each column that holds a single entity in every
+            row.
+
+        infer_pii_types: bool = False
+            When True, the entity types of the columns that are not in
+            pii_types are inferred from a sample of their values.
+
+        **kwargs
+            Additional arguments to pass to
+            :meth:`redact_bulk<tonic_textual.redact_api.TextualNer.redact_bulk>`,
+            such as generator_config, random_seed, or config.
+            dedupe, span_format, and isolate_failures are set by this method
+            and raise a TypeError.
+
+        Returns
+        -------
+        pd.DataFrame or Tuple[pd.DataFrame, pd.DataFrame]
+            A copy of df in which the columns are redacted. When include_spans
+            is True, also returns a dataframe with one row per entity and the
+            columns column, row, start, end, new_start, new_end, label, and
+            score. The row column holds the index label of the row, and the
+            column and label columns are categorical. Columns that use
+            structured redaction have no entities in this dataframe.
+
+        Examples
+        --------
+            >>> redacted = textual.redact_dataframe(
+            >>>     df, ["subject", "body"], generator_default="Synthesis", random_seed=42
+            >>> )
+        """
+        self._reject_reserved_kwargs(
+            "redact_dataframe", kwargs, ("dedupe", "span_format", "isolate_failures")
+        )
+        columns = list(dict.fromkeys(columns))
+        missing = [c for c in columns if c not in df.columns]
+        if missing:
+            raise KeyError(f"Columns not found in the dataframe: {missing}")
+
+        result = df.copy()
+        pii_types = dict(pii_types or {})
+        if pii_types or infer_pii_types:
+            config = self._resolve_config(
+                kwargs.pop("config", None),
+                kwargs.pop("generator_default", PiiState.Redaction),
+                kwargs.pop("generator_config", dict()),
+                kwargs.pop("generator_metadata", dict()),
+                kwargs.pop("label_block_lists", None),
+                kwargs.pop("label_allow_lists", None),
+                kwargs.pop("custom_entities", None),
+            )
+            kwargs["config"] = config
+            if infer_pii_types:
+                profiles = self.profile_columns(
+                    {c: df[c] for c in columns if c not in pii_types},
+                    custom_entities=config.custom_entities,
+                )
+                pii_types.update(
+                    (c, p.pii_type) for c, p in profiles.items() if p.structured
+                )
+
+            states = {
+                c: PiiState(config.generator_config.get(t, config.generator_default))
+                for c, t in pii_types.items()
+            }
+            structured = [c for c in columns if states.get(c) == PiiState.Synthesis]
+            # Every other state, such as GroupingSynthesis, is applied by NER.
+            columns = [
+                c for c in columns if states.get(c) not in (PiiState.Synthesis, PiiState.Off)
+            ]
+
+            if structured:
+                synthesized = self._synthesize_pandas_columns(
+                    [df[c] for c in structured],
+                    [pii_types[c] for c in structured],
+                    [config.generator_metadata.get(pii_types[c]) for c in structured],
+                    kwargs.get("random_seed"),
+                    max_batch_size,
+                    max_workers,
+                )
+                for column, values in zip(structured, synthesized):
+                    result[column] = values
+
+        redacted, spans = self._redact_pandas_columns(
+            [df[c] for c in columns],
+            columns,
+            df.index,
+            max_batch_chars,
+            max_batch_size,
+            max_workers,
+            include_spans,
+            kwargs,
+        )
+        for column, values in zip(columns, redacted):
+            result[column] = values
+        if not include_spans:
+            return result
+        return result, spans
+
+    def profile_columns(
+        self,
+        columns,
+        sample_size: int = 100,
+        min_confidence: float = 0.9,
+        **kwargs,
+    ) -> Dict[str, ColumnProfile]:
+        """Infers the entity type of each column from a sample of its values.
+
+        The samples of all of the columns are sent through NER detection in a
+        single bulk request. Columns in which most of the sampled values are a
+        single entity of the same type are marked as structured. Structured
+        columns can be synthesized with
+        :meth:`redact_structured_table<tonic_textual.redact_api.TextualNer.redact_structured_table>`,
+        which is much cheaper than NER.
+
+        Parameters
+        ----------
+        columns : Union[Dict[str, Sequence[str]], pd.DataFrame]
+            The values of each column, by column name.
+
+        sample_size: int = 100
+            The maximum number of values to sample from each column.
+
+        min_confidence: float = 0.9
+            The fraction of the sampled values that must be a single entity of
+            the inferred type for the column to be marked as structured.
+
+        **kwargs
+            Additional arguments to pass to
+            :meth:`redact_bulk<tonic_textual.redact_api.TextualNer.redact_bulk>`,
+            such as label_allow_lists or custom_entities.
+            dedupe, span_format, and isolate_failures are set by this method
+            and raise a TypeError.
+
+        Returns
+        -------
+        Dict[str, ColumnProfile]
+            The profile of each column, by column name.
+
+        Examples
+        --------
+            >>> profiles = textual.profile_columns(customers)
+            >>> pii_types = {c: p.pii_type for c, p in profiles.items() if p.structured}
+        """
+        self._reject_reserved_kwargs(
+            "profile_columns",
+            kwargs,
+            ("generator_default", "dedupe", "span_format", "isolate_failures"),
         )
-        payload["bulkText"] = strings
+        profiler = ColumnProfiler(sample_size, min_confidence)
+        return profiler.profile(
+            columns,
+            lambda strings: self.redact_bulk(
+                strings, generator_default=PiiState.Off, dedupe=True, **kwargs
+            ),
+        )
+
+    @staticmethod
+    def _reject_reserved_kwargs(method: str, kwargs: Dict, reserved: Tuple[str, ...]):
+        """Raises a TypeError for arguments that a method sets itself and
+        cannot be passed through to redact_bulk."""
+        passed = [key for key in reserved if key in kwargs]
+        if passed:
+            raise TypeError(
+                f"{method} does not accept {', '.join(passed)}, because it sets "
+                f"{'this argument' if len(passed) == 1 else 'these arguments'} itself"
+            )
 
-        return self.send_redact_bulk_request("/api/redact/bulk", payload, random_seed)
+    @staticmethod
+    def _pandas_text_values(column):
+        """Returns the positions and string values of the rows of column that
+        are not null or empty."""
+        import numpy as np
+
+        positions = np.flatnonzero(column.notna().to_numpy())
+        values = column.iloc[positions].astype(str)
+        nonempty = (values != "").to_numpy()
+        return positions[nonempty], values[nonempty].tolist()
+
+    def _synthesize_pandas_columns(
+        self,
+        columns: List,
+        pii_types: List[str],
+        generator_metadata: List[Optional[BaseMetadata]],
+        random_seed: Optional[int],
+        max_batch_size: Optional[int],
+        max_workers: int,
+    ) -> List:
+        row_positions = []
+        values = []
+        for column in columns:
+            positions, strings = self._pandas_text_values(column)
+            row_positions.append(positions)
+            values.append(strings)
+
+        synthesized = self.redact_structured_table(
+            values,
+            pii_types,
+            generator_metadata,
+            random_seed,
+            dedupe=True,
+            max_batch_size=max_batch_size,
+            max_workers=max_workers,
+        )
+
+        result = []
+        for column, positions, new_values in zip(columns, row_positions, synthesized):
+            column = column.copy()
+            if len(positions):
+                column.iloc[positions] = new_values
+            result.append(column)
+        return result
+
+    def _redact_pandas_columns(
+        self,
+        columns: List,
+        names: List,
+        index,
+        max_batch_chars: Optional[int],
+        max_batch_size: Optional[int],
+        max_workers: int,
+        include_spans: bool,
+        kwargs: Dict,
+    ):
+        try:
+            import numpy as np
+            import pandas as pd
+        except ImportError as e:
+            raise ImportError(
+                "Pandas is required to redact a pandas dataframe. Before you use this method, you must install pandas."
+            ) from e
+
+        strings = []
+        row_positions = [np.empty(0, dtype=np.intp)]
+        column_codes = [np.empty(0, dtype=np.int32)]
+        for code, column in enumerate(columns):
+            positions, values = self._pandas_text_values(column)
+            strings += values
+            row_positions.append(positions)
+            column_codes.append(np.full(len(positions), code, dtype=np.int32))
+
+        span_format = "columnar" if include_spans else "none"
+        if strings:
+            response = self.redact_bulk(
+                strings,
+                max_batch_chars=max_batch_chars,
+                max_batch_size=max_batch_size,
+                max_workers=max_workers,
+                dedupe=True,
+                span_format=span_format,
+                **kwargs,
+            )
+            redacted_strings = response.bulk_redacted_text
+            spans = response.spans
+        else:
+            redacted_strings = []
+            spans = BulkRedactionSpans()
+
+        redacted = []
+        offset = 0
+        for column, positions in zip(columns, row_positions[1:]):
+            values = column.copy()
+            if len(positions):
+                values.iloc[positions] = redacted_strings[offset : offset + len(positions)]
+            offset += len(positions)
+            redacted.append(values)
+
+        if not include_spans:
+            return redacted, None
+
+        spans_df = spans.to_pandas()
+        string_positions = spans_df.pop("idx").to_numpy()
+        row_positions = np.concatenate(row_positions)[string_positions]
+        column_codes = np.concatenate(column_codes)[string_positions]
+        spans_df.insert(
+            0,
+            "column",
+            pd.Categorical.from_codes(column_codes, categories=pd.Index(names)),
+        )
+        spans_df.insert(1, "row", index[row_positions])
+        return redacted, spans_df
 
     def redact_structured(
         self,
@@ -535,6 +1455,7 @@ class TextualNer:
         pii_type: str,
         generator_metadata: Optional[BaseMetadata] = None,
         random_seed: Optional[int] = None,
+        dedupe: bool = False,
     ) -> List[str]:
         """Synthesizes a column of structured values for a given entity type.
         Unlike redact/redact_bulk, this does not perform PII detection — every
@@ -559,6 +1480,10 @@ class TextualNer:
             seeding. Can be used to ensure that different API calls use the same
             or different random seeds.
 
+        dedupe: bool = False
+            When True, each distinct value is sent only once, and every
+            occurrence of a value gets the same synthesized value.
+
         Returns
         -------
         List[str]
@@ -573,28 +1498,212 @@ class TextualNer:
             >>>     generator_metadata=EmailGeneratorMetadata(preserve_domain=True),
             >>> )
         """
-        payload = {
-            "columns": [values],
-            "piiTypes": [pii_type],
-        }
+        return self.redact_structured_table(
+            [values],
+            [pii_type],
+            [generator_metadata],
+            random_seed,
+            dedupe,
+            max_batch_size=None,
+        )[0]
+
+    def redact_structured_table(
+        self,
+        columns: List[List[str]],
+        pii_types: List[str],
+        generator_metadata: Optional[List[Optional[BaseMetadata]]] = None,
+        random_seed: Optional[int] = None,
+        dedupe: bool = False,
+        max_batch_size: Optional[int] = 10000,
+        max_workers: int = 4,
+    ) -> List[List[str]]:
+        """Synthesizes several columns of structured values. Each column has its
+        own entity type. As in
+        :meth:`redact_structured<tonic_textual.redact_api.TextualNer.redact_structured>`,
+        every value is treated as the entity type of its column.
+
+        Long columns are split into chunks of rows, and the chunks are sent
+        concurrently.
 
-        if generator_metadata is not None:
-            payload["generatorMetadata"] = {
-                pii_type: generator_metadata.to_payload()
-            }
+        Parameters
+        ----------
+        columns : List[List[str]]
+            The columns of values to synthesize.
+
+        pii_types : List[str]
+            The entity type of each column.
+
+        generator_metadata: Optional[List[Optional[BaseMetadata]]] = None
+            Optional generator metadata for each column. Use None for a column
+            to use the server default.
+
+        random_seed: Optional[int] = None
+            An optional value to use to override Textual's default random number
+            seeding. Provide a random_seed to keep synthesized values consistent
+            across chunks.
+
+        dedupe: bool = False
+            When True, each distinct value of a column is sent only once, and
+            every occurrence of a value in the column gets the same synthesized
+            value.
+
+        max_batch_size: Optional[int] = 10000
+            The maximum number of rows in each request. When None, all of the
+            rows are sent in a single request.
+
+        max_workers: int = 4
+            The number of requests to send concurrently.
+
+        Returns
+        -------
+        List[List[str]]
+            The synthesized columns, in the same order as the input.
+
+        Examples
+        --------
+            >>> emails, phones = textual.redact_structured_table(
+            >>>     [customers["email"], customers["phone"]],
+            >>>     pii_types=["EMAIL_ADDRESS", "PHONE_NUMBER"],
+            >>>     random_seed=42,
+            >>> )
+        """
+        if len(pii_types) != len(columns):
+            raise ValueError("pii_types must have one entry for each column")
+        if generator_metadata is None:
+            generator_metadata = [None] * len(columns)
+        elif len(generator_metadata) != len(columns):
+            raise ValueError("generator_metadata must have one entry for each column")
+        if max_batch_size is not None and max_batch_size < 1:
+            raise ValueError("max_batch_size must be at least 1")
+
+        payloads = []
+        for pii_type, metadata in zip(pii_types, generator_metadata):
+            payload = {"piiTypes": [pii_type]}
+            if metadata is not None:
+                payload["generatorMetadata"] = {pii_type: metadata.to_payload()}
+            payloads.append(payload)
+
+        positions = [None] * len(columns)
+        if dedupe:
+            columns = list(columns)
+            for i, column in enumerate(columns):
+                distinct, column_positions = dedupe_strings(column)
+                if len(distinct) < len(column):
+                    columns[i] = distinct
+                    positions[i] = column_positions
+
+        if self.cache is None or random_seed is None:
+            synthesized = self._send_structured_table(
+                columns, payloads, random_seed, max_batch_size, max_workers
+            )
+        else:
+            synthesized = self._cached_structured_table(
+                columns, payloads, random_seed, max_batch_size, max_workers
+            )
+
+        return [
+            values if column_positions is None else [values[p] for p in column_positions]
+            for values, column_positions in zip(synthesized, positions)
+        ]
+
+    def _cached_structured_table(
+        self,
+        columns: List[List[str]],
+        payloads: List[Dict],
+        random_seed: int,
+        max_batch_size: Optional[int],
+        max_workers: int,
+    ) -> List[List[str]]:
+        cells = [(i, value) for i, column in enumerate(columns) for value in column]
+        keys = [
+            make_cache_key(
+                "/api/redact/structured_table",
+                {**payloads[i], "value": value},
+                random_seed,
+                self._cache_scope(),
+            )
+            for i, value in cells
+        ]
+
+        def compute(indices: List[int]) -> List[str]:
+            missing = [[] for _ in columns]
+            for index in indices:
+                i, value = cells[index]
+                missing[i].append(value)
+            sent = [i for i, values in enumerate(missing) if values]
+            synthesized = self._send_structured_table(
+                [missing[i] for i in sent],
+                [payloads[i] for i in sent],
+                random_seed,
+                max_batch_size,
+                max_workers,
+            )
+            results = {i: iter(values) for i, values in zip(sent, synthesized)}
+            return [next(results[cells[index][0]]) for index in indices]
 
+        values = iter(self.cache.get_many_or_compute(keys, compute))
+        return [[next(values) for _ in column] for column in columns]
+
+    def _send_structured_table(
+        self,
+        columns: List[List[str]],
+        payloads: List[Dict],
+        random_seed: Optional[int],
+        max_batch_size: Optional[int],
+        max_workers: int,
+    ) -> List[List[str]]:
+        """Sends the columns in chunks of at most max_batch_size rows. Columns
+        that use different generator metadata for the same entity type are sent
+        in separate requests."""
         if random_seed is not None:
             additional_headers = {"textual-random-seed": str(random_seed)}
         else:
             additional_headers = {}
 
-        response = self.client.http_post(
-            "/api/redact/structured_table",
-            data=payload,
-            additional_headers=additional_headers,
-        )
+        groups = []
+        for i, payload in enumerate(payloads):
+            pii_type = payload["piiTypes"][0]
+            metadata = payload.get("generatorMetadata", {}).get(pii_type)
+            for group in groups:
+                if group["types"].get(pii_type, metadata) == metadata:
+                    break
+            else:
+                group = {"columns": [], "types": {}}
+                groups.append(group)
+            group["columns"].append(i)
+            group["types"][pii_type] = metadata
+
+        requests_to_send = []
+        for group in groups:
+            rows = max((len(columns[i]) for i in group["columns"]), default=0)
+            step = max_batch_size or max(rows, 1)
+            for start in range(0, max(rows, 1), step):
+                requests_to_send.append((group, start, start + step))
+
+        def send(request) -> List[List[str]]:
+            group, start, end = request
+            sent = [i for i in group["columns"] if columns[i][start:end] or start == 0]
+            data = {
+                "piiTypes": [payloads[i]["piiTypes"][0] for i in sent],
+                "columns": [columns[i][start:end] for i in sent],
+            }
+            metadata = {t: m for t, m in group["types"].items() if m is not None}
+            if metadata:
+                data["generatorMetadata"] = metadata
+            response = self.client.http_post(
+                "/api/redact/structured_table",
+                data=data,
+                additional_headers=additional_headers,
+            )
+            return list(zip(sent, response))
 
-        return response[0]
+        synthesized = [[] for _ in columns]
+        for chunk in run_concurrently(
+            send, requests_to_send, max_workers, self.concurrency_governor
+        ):
+            for i, values in chunk:
+                synthesized[i] += values
+        return synthesized
 
     def group_entities(self, ner_entities: list[Replacement], original_text: str) -> GroupResponse:
         payload = generate_grouping_playload(ner_entities, original_text)
@@ -643,6 +1752,7 @@ class TextualNer:
         jsonpath_allow_lists: Optional[Dict[str, List[str]]] = None,
         json_path_ignore_paths: Optional[List[str]] = None,
         custom_entities: Optional[List[str]] = None,
+        config: Optional[RedactionConfig] = None,
     ) -> RedactionResponse:
         """Redacts the values in a JSON blob. Depending on the configured handling for
         each sensitive data type, values are either redacted, synthesized, or
@@ -696,15 +1806,26 @@ class TextualNer:
             config. Custom entity types will respect generator defaults if they
             are not specified in the generator config.
 
+        config: Optional[RedactionConfig] = None
+            A validated, reusable configuration. When provided, it is used
+            instead of generator_default, generator_config, generator_metadata,
+            label_block_lists, label_allow_lists, and custom_entities.
+
         Returns
         -------
         RedactionResponse
             The redacted string along with ancillary information.
         """
 
-        validate_generator_default_and_config(generator_default, generator_config, custom_entities)
-
-        validate_generator_metadata(generator_metadata, custom_entities)
+        config = self._resolve_config(
+            config,
+            generator_default,
+            generator_config,
+            generator_metadata,
+            label_block_lists,
+            label_allow_lists,
+            custom_entities,
+        )
 
         if isinstance(json_data, str):
             json_text = json_data
@@ -716,16 +1837,7 @@ class TextualNer:
                 f"You passed in type {type(json_data)} which is not supported"
             )
 
-        payload = generate_redact_payload(
-            generator_default,
-            generator_config,
-            generator_metadata,
-            label_block_lists,
-            label_allow_lists,
-            None,
-            custom_entities
-        )
-        payload["jsonText"] = json_text
+        payload = config.to_payload(recordApiRequestOptions=None, jsonText=json_text)
 
         if jsonpath_allow_lists is not None:
             payload["jsonPathAllowLists"] = jsonpath_allow_lists
@@ -735,6 +1847,64 @@ class TextualNer:
 
         return self.send_redact_request("/api/redact/json", payload, random_seed)
 
+    def redact_json_batch(
+        self,
+        json_documents: List[Union[str, dict]],
+        max_workers: int = 4,
+        isolate_failures: bool = False,
+        **kwargs,
+    ) -> JsonBatchRedactionResponse:
+        """Redacts the values in many JSON blobs. Each blob is sent as a
+        separate request, and the requests are sent concurrently.
+
+        Parameters
+        ----------
+        json_documents : List[Union[str, dict]]
+            The JSON blobs to redact. Each blob can be either a JSON string or
+            a Python dictionary.
+
+        max_workers: int = 4
+            The number of blobs to send concurrently. Provide a random_seed to
+            keep synthesized values consistent across blobs.
+
+        isolate_failures: bool = False
+            When True, a blob that the server rejects with a 400 or 500 error
+            is listed in the failures of the response, and the other blobs are
+            redacted as usual. When False, the first error is raised.
+
+        **kwargs
+            Additional arguments to pass to
+            :meth:`redact_json<tonic_textual.redact_api.TextualNer.redact_json>`,
+            such as generator_config, random_seed, or config.
+
+        Returns
+        -------
+        JsonBatchRedactionResponse
+            The response for each blob, in the original order, and the blobs
+            that failed.
+        """
+
+        def redact(item):
+            index, json_data = item
+            try:
+                return self.redact_json(json_data, **kwargs), None
+            except Exception as e:
+                if not isolate_failures or not is_poison_error(e):
+                    raise
+                text = json_data if isinstance(json_data, str) else json.dumps(json_data)
+                return None, redaction_failure(index, text, e)
+
+        outcomes = run_concurrently(
+            redact,
+            list(enumerate(json_documents)),
+            max_workers,
+            self.concurrency_governor,
+        )
+        return JsonBatchRedactionResponse(
+            [result for result, _ in outcomes],
+            [failure for _, failure in outcomes if failure is not None],
+        )
+
     def redact_xml(
         self,
         xml_data: str,
@@ -745,6 +1915,7 @@ class TextualNer:
         label_block_lists: Optional[Dict[str, List[str]]] = None,
         label_allow_lists: Optional[Dict[str, List[str]]] = None,
         custom_entities: Optional[List[str]] = None,
+        config: Optional[RedactionConfig] = None,
     ) -> RedactionResponse:
         """Redacts the values in an XML blob. Depending on the configured handling for
         each entity type, values are either redacted, synthesized, or
@@ -789,26 +1960,27 @@ class TextualNer:
             config. Custom entity types will respect generator defaults if they
             are not specified in the generator config.
 
+        config: Optional[RedactionConfig] = None
+            A validated, reusable configuration. When provided, it is used
+            instead of generator_default, generator_config, generator_metadata,
+            label_block_lists, label_allow_lists, and custom_entities.
+
         Returns
         -------
         RedactionResponse
             The redacted string plus additional information.
         """
 
-        validate_generator_default_and_config(generator_default, generator_config, custom_entities)
-
-        validate_generator_metadata(generator_metadata, custom_entities)
-
-        payload = generate_redact_payload(
+        config = self._resolve_config(
+            config,
             generator_default,
             generator_config,
             generator_metadata,
             label_block_lists,
             label_allow_lists,
-            None,
-            custom_entities
+            custom_entities,
         )
-        payload["xmlText"] = xml_data        
+        payload = config.to_payload(recordApiRequestOptions=None, xmlText=xml_data)
 
         return self.send_redact_request("/api/redact/xml", payload, random_seed)
 
@@ -823,6 +1995,7 @@ class TextualNer:
         label_allow_lists: Optional[Dict[str, List[str]]] = None,
         custom_entities: Optional[List[str]] = None,
         record_options: RecordApiRequestOptions = default_record_options,
+        config: Optional[RedactionConfig] = None,
     ) -> RedactionResponse:
         """Redacts the values in an HTML blob. Depending on the configured handling for
         each entity type, values are either redacted, synthesized, or
@@ -871,27 +2044,31 @@ class TextualNer:
             A value to record the API request and results for analysis in the
             Textual application. The default value is to not record the API
             request.  Must specify a time between 1 and 720 hours (inclusive).
-            
+
+        config: Optional[RedactionConfig] = None
+            A validated, reusable configuration. When provided, it is used
+            instead of generator_default, generator_config, generator_metadata,
+            label_block_lists, label_allow_lists, and custom_entities.
+
         Returns
         -------
         RedactionResponse
             The redacted string plus additional information.
         """
 
-        validate_generator_default_and_config(generator_default, generator_config, custom_entities)
-
-        validate_generator_metadata(generator_metadata, custom_entities)
-
-        payload = generate_redact_payload(
+        config = self._resolve_config(
+            config,
             generator_default,
             generator_config,
             generator_metadata,
             label_block_lists,
             label_allow_lists,
-            record_options,
-            custom_entities
+            custom_entities,
+        )
+        payload = config.to_payload(
+            recordApiRequestOptions=generate_record_options_payload(record_options),
+            htmlText=html_data,
         )
-        payload["htmlText"] = html_data        
 
         return self.send_redact_request("/api/redact/html", payload, random_seed)
 
@@ -903,38 +2080,18 @@ class TextualNer:
     ) -> RedactionResponse:
         """Helper function to send redact requests, handle responses, and catch errors."""
 
-        if random_seed is not None:
-            additional_headers = {"textual-random-seed": str(random_seed)}
-        else:
-            additional_headers = {}
-
-        try:
-            
-            response = self.client.http_post(
-                endpoint,
-                data=payload,
-                additional_headers=additional_headers
+        if self._is_cacheable(payload, random_seed):
+            response = self.cache.get_or_compute(
+                make_cache_key(endpoint, payload, random_seed, self._cache_scope()),
+                lambda: self._post_hedged_redact_payload(
+                    endpoint, payload, random_seed
+                ),
             )
-        except requests.exceptions.HTTPError as e:
-            if e.response.status_code == 400:
-                raise InvalidJsonForRedactionRequest(e.response.text)
-            raise e
+        else:
+            response = self._post_hedged_redact_payload(endpoint, payload, random_seed)
 
         de_id_results = [
-            Replacement(
-                start=result["start"],
-                end=result["end"],
-                new_start=result.get("newStart"),
-                new_end=result.get("newEnd"),
-                label=result["label"],
-                text=result["text"],
-                new_text=result.get("newText"),
-                score=result["score"],
-                language=result.get("language"),
-                example_redaction=result.get("exampleRedaction"),
-                json_path=result.get("jsonPath"),
-                xml_path=result.get("xmlPath"),
-            )
+            Replacement.from_api_result(result)
             for result in response["deIdentifyResults"]
         ]
 
@@ -950,16 +2107,91 @@ class TextualNer:
         endpoint: str,
         payload: Dict,
         random_seed: Optional[int] = None,
+        span_format: str = "replacements",
     ) -> BulkRedactionResponse:
         """Helper function to send redact requests, handle responses, and catch errors."""
 
+        if span_format not in ("replacements", "columnar", "none"):
+            raise ValueError(
+                "span_format must be one of 'replacements', 'columnar', or 'none'"
+            )
+
+        if self._is_cacheable(payload, random_seed):
+            response = self._cached_bulk_response(endpoint, payload, random_seed)
+        else:
+            response = self._post_redact_payload(endpoint, payload, random_seed)
+
+        if span_format != "replacements":
+            spans = None
+            if span_format == "columnar":
+                spans = BulkRedactionSpans.from_api_results(
+                    response["deIdentifyResults"]
+                )
+            return BulkRedactionResponse(
+                response["bulkText"],
+                response["bulkRedactedText"],
+                response["usage"],
+                [],
+                spans,
+            )
+
+        de_id_results = [[] for i in range(len(response["bulkText"]))]
+        for result in response["deIdentifyResults"]:
+            de_id_results[result["idx"]].append(Replacement.from_api_result(result))
+
+        return BulkRedactionResponse(
+            response["bulkText"],
+            response["bulkRedactedText"],
+            response["usage"],
+            de_id_results,
+        )
+
+    def _is_cacheable(self, payload: Dict, random_seed: Optional[int]) -> bool:
+        return (
+            self.cache is not None
+            and random_seed is not None
+            and payload.get("recordApiRequestOptions") is None
+        )
+
+    def _cache_scope(self) -> str:
+        # Custom entities and models differ between instances and workspaces,
+        # so cached results are only shared by clients with the same URL and
+        # API key. The key is hashed with the rest of the cache key.
+        return f"{self.client.base_url}\0{self.api_key}"
+
+    def _post_hedged_redact_payload(
+        self, endpoint: str, payload: Dict, random_seed: Optional[int]
+    ) -> Dict:
+        hedging = self._redact_hedging
+        if (
+            hedging is None
+            or random_seed is None
+            or payload.get("recordApiRequestOptions") is not None
+        ):
+            return self._post_redact_payload(endpoint, payload, random_seed)
+
+        hedger, hedge_client = hedging
+        clients = (self.client, hedge_client)
+        return hedger.call(
+            lambda attempt: self._post_redact_payload(
+                endpoint, payload, random_seed, clients[attempt]
+            )
+        )
+
+    def _post_redact_payload(
+        self,
+        endpoint: str,
+        payload: Dict,
+        random_seed: Optional[int],
+        client: Optional[HttpClient] = None,
+    ) -> Dict:
         if random_seed is not None:
             additional_headers = {"textual-random-seed": str(random_seed)}
         else:
             additional_headers = {}
 
         try:
-            response = self.client.http_post(
+            return (client or self.client).http_post(
                 endpoint, data=payload, additional_headers=additional_headers
             )
         except requests.exceptions.HTTPError as e:
@@ -967,29 +2199,52 @@ class TextualNer:
                 raise InvalidJsonForRedactionRequest(e.response.text)
             raise e
 
-        de_id_results = [[] for i in range(len(response["bulkText"]))]
-        for result in response["deIdentifyResults"]:
-            de_id_results[result["idx"]].append(
-                Replacement(
-                    start=result["start"],
-                    end=result["end"],
-                    new_start=result.get("newStart"),
-                    new_end=result.get("newEnd"),
-                    label=result["label"],
-                    text=result["text"],
-                    new_text=result.get("newText"),
-                    score=result["score"],
-                    language=result.get("language"),
-                    example_redaction=result.get("exampleRedaction"),
-                )
-            )
+    def _cached_bulk_response(
+        self, endpoint: str, payload: Dict, random_seed: Optional[int]
+    ) -> Dict:
+        """Looks up each string of a bulk request in the cache, and sends only
+        the strings that are not cached. Returns a response in the format of the
+        bulk endpoint. The usage covers only the strings that were sent."""
+        strings = payload["bulkText"]
+        config = {k: v for k, v in payload.items() if k != "bulkText"}
+        scope = self._cache_scope()
+        keys = [
+            make_cache_key(endpoint, {**config, "text": s}, random_seed, scope)
+            for s in strings
+        ]
+        usage = 0
 
-        return BulkRedactionResponse(
-            response["bulkText"],
-            response["bulkRedactedText"],
-            response["usage"],
-            de_id_results,
-        )
+        def send(indices: List[int]) -> List[Dict]:
+            nonlocal usage
+            response = self._post_redact_payload(
+                endpoint,
+                payload_with_fields(payload, bulkText=[strings[i] for i in indices]),
+                random_seed,
+            )
+            usage = response["usage"]
+            entries = [
+                {
+                    "originalText": response["bulkText"][i],
+                    "redactedText": response["bulkRedactedText"][i],
+                    "deIdentifyResults": [],
+                }
+                for i in range(len(indices))
+            ]
+            for result in response["deIdentifyResults"]:
+                entries[result["idx"]]["deIdentifyResults"].append(result)
+            return entries
+
+        entries = self.cache.get_many_or_compute(keys, send)
+        return {
+            "bulkText": [entry["originalText"] for entry in entries],
+            "bulkRedactedText": [entry["redactedText"] for entry in entries],
+            "usage": usage,
+            "deIdentifyResults": [
+                {**result, "idx": idx}
+                for idx, entry in enumerate(entries)
+                for result in entry["deIdentifyResults"]
+            ],
+        }
 
     def start_file_redaction(
         self,
@@ -1052,7 +2307,10 @@ class TextualNer:
         num_retries: int = 6,
         wait_between_retries: int = 10,
         custom_entities: Optional[List[str]] = None,
-    ) -> bytes:
+        config: Optional[RedactionConfig] = None,
+        destination: Optional[Union[str, os.PathLike, BinaryIO]] = None,
+        checksum: Optional[str] = None,
+    ) -> Union[bytes, int]:
         """
         Download a redacted file
 
@@ -1087,12 +2345,14 @@ class TextualNer:
             ignored and is not redacted or synthesized.
 
         num_retries: int = 6
-            An optional value to specify the number of times to attempt to
-            download the file. If a file is not yet ready for download, Textual
-            pauses for 10 seconds before retrying. (The default value is 6)
+            Together with wait_between_retries, sets how long to wait for the
+            file. If the file is not ready, Textual checks again, with waits
+            that grow up to wait_between_retries, for up to
+            (num_retries - 1) * wait_between_retries seconds. (The default
+            value is 6)
 
         wait_between_retries: int = 10
-            The number of seconds to wait between retry attempts. (The default
+            The longest wait, in seconds, between two checks. (The default
             value is 10)
 
         custom_entities: Optional[List[str]]
@@ -1101,50 +2361,357 @@ class TextualNer:
             config. Custom entity types will respect generator defaults if they
             are not specified in the generator config.
 
+        config: Optional[RedactionConfig] = None
+            A validated, reusable configuration. When provided, it is used
+            instead of generator_default, generator_config, generator_metadata,
+            label_block_lists, and custom_entities.
+
+        destination: Optional[Union[str, os.PathLike, BinaryIO]] = None
+            A file path or a writable binary file object. When provided, the
+            file is streamed to destination in chunks instead of being held in
+            memory. A file path is written to destination.part and renamed when
+            the download is complete. An interrupted download resumes from
+            where it stopped, as long as the file on the server has the same
+            ETag and length.
+
+        checksum: Optional[str] = None
+            The expected checksum of the file, either as "algorithm:hex", such
+            as "sha256:9f86d0...", or as a hex SHA-256 digest. Only used with
+            destination. A file that does not match raises
+            DownloadChecksumMismatch.
+
         Returns
         -------
-        bytes
-            The redacted file as a byte array.
+        Union[bytes, int]
+            The redacted file as a byte array or, when destination is provided,
+            the size of the file in bytes.
         """
+        config = self._resolve_config(
+            config,
+            generator_default,
+            generator_config,
+            generator_metadata,
+            label_block_lists,
+            None,
+            custom_entities,
+        )
+        ready, transfer = self._redacted_file_download(
+            job_id, config, random_seed, num_retries, wait_between_retries, destination, checksum
+        )
+        return transfer(ready.result())
 
-        validate_generator_default_and_config(generator_default, generator_config, custom_entities)
+    def submit_download_redacted_file(
+        self,
+        job_id: str,
+        generator_default: Union[PiiState, str] = PiiState.Redaction,
+        generator_config: Dict[str, Union[PiiState, str]] = dict(),
+        generator_metadata: Dict[str, BaseMetadata] = dict(),
+        random_seed: Optional[int] = None,
+        label_block_lists: Optional[Dict[str, List[str]]] = None,
+        num_retries: int = 6,
+        wait_between_retries: int = 10,
+        custom_entities: Optional[List[str]] = None,
+        config: Optional[RedactionConfig] = None,
+        destination: Optional[Union[str, os.PathLike, BinaryIO]] = None,
+        checksum: Optional[str] = None,
+        download_executor: Optional[Executor] = None,
+    ) -> Future:
+        """Starts downloading a redacted file, and returns without waiting for
+        the file to be ready. Takes the same arguments as
+        :meth:`download_redacted_file<tonic_textual.redact_api.TextualNer.download_redacted_file>`.
+
+        All pending downloads are polled by one shared
+        :class:`JobPoller<tonic_textual.classes.job_poller.JobPoller>` thread,
+        so many downloads can be waited on without a thread for each. The
+        poller only checks whether the file is ready. The file is then
+        transferred on download_executor, or on a thread of its own when
+        download_executor is None.
 
-        validate_generator_metadata(generator_metadata, custom_entities)
+        Parameters
+        ----------
+        download_executor: Optional[Executor] = None
+            The executor on which files are transferred once they are ready.
+            Its number of workers limits the number of concurrent transfers.
+            The default is None, which transfers each file on its own thread.
 
-        if random_seed is not None:
-            additional_headers = {"textual-random-seed": str(random_seed)}
-        else:
-            additional_headers = {}
-        
-        payload = generate_redact_payload(
+        Returns
+        -------
+        Future
+            Resolves to the redacted file as a byte array or, when destination
+            is provided, to the size of the file in bytes.
+
+        Examples
+        --------
+            >>> futures = [textual.submit_download_redacted_file(job_id) for job_id in job_ids]
+            >>> files = [f.result() for f in futures]
+        """
+
+        config = self._resolve_config(
+            config,
             generator_default,
             generator_config,
             generator_metadata,
             label_block_lists,
             None,
-            None,
-            custom_entities
-        )        
+            custom_entities,
+        )
+        ready, transfer = self._redacted_file_download(
+            job_id, config, random_seed, num_retries, wait_between_retries, destination, checksum
+        )
+        return run_when_ready(
+            ready, transfer, download_executor, lambda response: response.close()
+        )
 
-        retries = 1
-        while retries <= num_retries:
-            try:                
-                return self.client.http_post_download_file(
-                    f"/api/unattachedfile/{job_id}/download",
+    def _redacted_file_download(
+        self,
+        job_id: str,
+        config: RedactionConfig,
+        random_seed: Optional[int],
+        num_retries: int,
+        wait_between_retries: int,
+        destination: Optional[Union[str, os.PathLike, BinaryIO]],
+        checksum: Optional[str],
+    ) -> Tuple[Future, Callable[[requests.Response], Union[bytes, int]]]:
+        """Starts polling for a redacted file. Returns a future for the open
+        response of the ready file, and a function that transfers the file
+        from that response. The transfer is left to the caller so that the
+        poller's workers only check whether files are ready."""
+        if random_seed is not None:
+            additional_headers = {"textual-random-seed": str(random_seed)}
+        else:
+            additional_headers = {}
+        url = f"/api/unattachedfile/{job_id}/download"
+        payload = config.to_payload(recordApiRequestOptions=None)
+
+        def poll():
+            try:
+                return self.client.http_post_download_response(
+                    url, data=payload, additional_headers=additional_headers
+                )
+            except FileNotReadyForDownload:
+                return NOT_READY
+
+        def transfer(response: requests.Response) -> Union[bytes, int]:
+            if destination is not None:
+                return self.client.http_post_download_file_to(
+                    url,
+                    destination,
                     data=payload,
                     additional_headers=additional_headers,
+                    checksum=checksum,
+                    response=response,
                 )
+            with response:
+                return response.content
+
+        ready = self.job_poller.submit(
+            poll,
+            timeout_seconds=retries_to_timeout(num_retries, wait_between_retries),
+            max_interval=wait_between_retries,
+            on_timeout=lambda: file_not_ready_error(num_retries),
+        )
+        return ready, transfer
 
-            except FileNotReadyForDownload:
-                retries = retries + 1
-                if retries <= num_retries:
-                    sleep(wait_between_retries)
-
-        retryWord = "retry" if num_retries == 1 else "retries"
-        raise FileNotReadyForDownload(
-            f"After {num_retries} {retryWord}, the file is not yet ready to download. "
-            "This is likely due to a high service load. Try again later."
+    def redact_files(
+        self,
+        paths: Union[str, List[str]],
+        out_dir: str,
+        config: Optional[RedactionConfig] = None,
+        concurrency: int = 16,
+        random_seed: Optional[int] = None,
+        num_retries: int = 61,
+        wait_between_retries: int = 10,
+        show_progress: bool = True,
+        on_file_done: Optional[Callable[[FileRedactionResult], None]] = None,
+    ) -> FileRedactionReport:
+        """Redacts many files and writes the redacted files to out_dir.
+
+        Files are uploaded with
+        :meth:`start_file_redaction<tonic_textual.redact_api.TextualNer.start_file_redaction>`
+        and downloaded as soon as each job is finished, with up to concurrency
+        files in progress at a time. The redacted files keep their paths
+        relative to the deepest folder that contains all of the files. A file
+        that fails does not stop the other files.
+
+        Parameters
+        ----------
+        paths: Union[str, List[str]]
+            The paths of the files to redact. Glob patterns such as
+            "contracts/**/*.pdf" are expanded.
+
+        out_dir: str
+            The folder in which to write the redacted files.
+
+        config: Optional[RedactionConfig] = None
+            The redaction configuration. By default, all entities are redacted.
+
+        concurrency: int = 16
+            The maximum number of files that are being uploaded, redacted, or
+            downloaded at the same time. Uploads and downloads run on a pool of
+            concurrency threads, while files that are being redacted are waited
+            on by the shared job poller and do not hold a thread. When the
+            client has a concurrency_governor, the governor adapts the number
+            of files in progress, up to concurrency. Because a large file takes
+            longer to redact, only failed files, and not slow ones, cut the
+            number of files in progress.
+
+        random_seed: Optional[int] = None
+            An optional value to use to override Textual's default random
+            number seeding.
+
+        num_retries: int = 61
+            Together with wait_between_retries, sets how long to wait for each
+            file, as in
+            :meth:`download_redacted_file<tonic_textual.redact_api.TextualNer.download_redacted_file>`.
+            The default allows 10 minutes.
+
+        wait_between_retries: int = 10
+            The longest wait, in seconds, between two checks of a file.
+
+        show_progress: bool = True
+            Whether to show a progress bar.
+
+        on_file_done: Optional[Callable[[FileRedactionResult], None]] = None
+            Called with the result of each file as soon as it is finished.
+
+        Returns
+        -------
+        FileRedactionReport
+            The result of each file, and the number of files that succeeded and
+            failed.
+
+        Examples
+        --------
+            >>> report = textual.redact_files(["inbox/*.pdf", "inbox/*.docx"], "redacted")
+            >>> for failure in report.failures():
+            >>>     print(failure.path, failure.error)
+        """
+        if concurrency < 1:
+            raise ValueError("concurrency must be at least 1")
+        if config is None:
+            config = RedactionConfig()
+
+        files = self._expand_paths([paths] if isinstance(paths, str) else paths)
+        started = time.monotonic()
+        if not files:
+            return FileRedactionReport([], 0.0)
+
+        root = os.path.commonpath([os.path.dirname(os.path.abspath(p)) for p in files])
+        custom_entities = list(config.custom_entities or []) or None
+        results: List[Optional[FileRedactionResult]] = [None] * len(files)
+        finished = [Future() for _ in files]
+        start_times = [0.0] * len(files)
+        slots = threading.Semaphore(concurrency)
+        governor = self.concurrency_governor
+        governor_starts = [0.0] * len(files)
+        progress = tqdm(
+            desc="[INFO] Redacting files",
+            total=len(files),
+            unit="file",
+            disable=not show_progress,
         )
+        progress_lock = threading.Lock()
+        failed = [0]
+
+        output_paths = [
+            os.path.join(out_dir, os.path.relpath(os.path.abspath(p), root))
+            for p in files
+        ]
+
+        def finish(
+            i: int,
+            job_id: Optional[str],
+            download: Optional[Future] = None,
+            error: Optional[Exception] = None,
+        ):
+            path = files[i]
+            failure = None
+            try:
+                if error is not None:
+                    raise error
+                download.result()
+                result = FileRedactionResult(
+                    path,
+                    output_paths[i],
+                    job_id,
+                    "succeeded",
+                    None,
+                    time.monotonic() - start_times[i],
+                )
+            except Exception as e:
+                failure = e
+                result = FileRedactionResult(
+                    path,
+                    None,
+                    job_id,
+                    "failed",
+                    str(e) or type(e).__name__,
+                    time.monotonic() - start_times[i],
+                )
+
+            try:
+                results[i] = result
+                if governor is not None:
+                    governor.release(governor_starts[i], failure, measure_latency=False)
+                slots.release()
+                with progress_lock:
+                    progress.update(1)
+                    if result.status == "failed":
+                        failed[0] += 1
+                        progress.set_postfix(failed=failed[0])
+                if on_file_done is not None:
+                    on_file_done(result)
+            finally:
+                finished[i].set_result(None)
+
+        def start(i: int):
+            start_times[i] = time.monotonic()
+            try:
+                with open(files[i], "rb") as f:
+                    job_id = self.start_file_redaction(
+                        f, os.path.basename(files[i]), custom_entities
+                    )
+            except Exception as e:
+                finish(i, None, error=e)
+                return
+            try:
+                os.makedirs(os.path.dirname(output_paths[i]), exist_ok=True)
+                download = self.submit_download_redacted_file(
+                    job_id,
+                    random_seed=random_seed,
+                    num_retries=num_retries,
+                    wait_between_retries=wait_between_retries,
+                    config=config,
+                    destination=output_paths[i],
+                    download_executor=workers,
+                )
+            except Exception as e:
+                finish(i, job_id, error=e)
+                return
+            download.add_done_callback(
+                lambda d: workers.submit(finish, i, job_id, d)
+            )
+
+        with progress, ThreadPoolExecutor(max_workers=concurrency) as workers:
+            for i in range(len(files)):
+                slots.acquire()
+                if governor is not None:
+                    governor_starts[i] = governor.acquire()
+                workers.submit(start, i)
+            for f in finished:
+                f.result()
+
+        return FileRedactionReport(results, time.monotonic() - started)
+
+    @staticmethod
+    def _expand_paths(paths: List[str]) -> List[str]:
+        files = []
+        for path in paths:
+            if any(c in path for c in "*?["):
+                files += sorted(p for p in glob.glob(path, recursive=True) if os.path.isfile(p))
+            else:
+                files.append(path)
+        return list(dict.fromkeys(files))
 
     # --- Model-Based Custom Entities ---
 
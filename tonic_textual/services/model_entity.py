@@ -1,7 +1,6 @@
 """Service for managing model-based custom entities."""
 
 from typing import List, Optional
-import requests
 
 from tonic_textual.classes.model_entity import ModelEntity
 
@@ -56,11 +55,9 @@ class ModelEntityService:
         Returns:
             The ModelEntity object
         """
-        with requests.Session() as session:
-            data = self.client.http_get(
-                f"/api/model-based-entities/{entity_id}",
-                session=session,
-            )
+        data = self.client.http_get(
+            f"/api/model-based-entities/{entity_id}",
+        )
         return ModelEntity(self.client, data)
 
     def list(self) -> List[ModelEntity]:
@@ -69,12 +66,10 @@ class ModelEntityService:
         Returns:
             List of all ModelEntity objects accessible to the user
         """
-        with requests.Session() as session:
-            # Use the custom-entities endpoint which lists all custom entities
-            data = self.client.http_get(
-                "/api/custom-entities",
-                session=session,
-            )
+        # Use the custom-entities endpoint which lists all custom entities
+        data = self.client.http_get(
+            "/api/custom-entities",
+        )
 
         # Filter to only model-based entities (entityType == "ModelBased")
         model_entities = []